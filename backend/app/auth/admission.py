@@ -0,0 +1,100 @@
+import math
+import os
+from typing import Callable, Dict, Tuple
+
+from fastapi import Depends, HTTPException, status
+
+from app.config.db import rate_limits_collection
+from app.models.user import TokenData, UserRole
+from app.utils.rate_limit import (
+    TokenBucketLimiter, MemoryTokenBucketStore, MongoTokenBucketStore,
+    ConcurrencyLimiter, ConcurrencyLimitExceeded
+)
+from .auth_service import RATE_LIMIT_STORE
+
+# Seconds a request may wait for a free slot on a capped route before it gets a 429
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "10"))
+
+# Per policy and role: (requests per minute, burst)
+RATE_LIMITS: Dict[str, Dict[UserRole, Tuple[float, float]]] = {
+    # LLM calls: slow, and they spend the shared OpenAI quota
+    "ai": {
+        UserRole.TEACHER: (6, 3),
+        UserRole.ADMIN: (20, 5),
+    },
+    "quiz": {
+        UserRole.STUDENT: (20, 10),
+        UserRole.TEACHER: (60, 20),
+        UserRole.ADMIN: (60, 20),
+    },
+    "dashboard": {
+        UserRole.STUDENT: (30, 10),
+        UserRole.TEACHER: (30, 10),
+        UserRole.ADMIN: (60, 20),
+    },
+}
+
+# Per policy: (concurrent requests per worker, requests allowed to wait for a slot)
+CONCURRENCY_LIMITS: Dict[str, Tuple[int, int]] = {
+    "ai": (int(os.getenv("AI_CONCURRENCY", "4")), int(os.getenv("AI_QUEUE_LIMIT", "8"))),
+    "quiz": (int(os.getenv("QUIZ_CONCURRENCY", "16")), int(os.getenv("QUIZ_QUEUE_LIMIT", "32"))),
+    "dashboard": (int(os.getenv("DASHBOARD_CONCURRENCY", "8")), int(os.getenv("DASHBOARD_QUEUE_LIMIT", "16"))),
+}
+
+_store = MongoTokenBucketStore(rate_limits_collection) if RATE_LIMIT_STORE == "mongo" else MemoryTokenBucketStore()
+
+_buckets: Dict[Tuple[str, UserRole], TokenBucketLimiter] = {
+    (policy, role): TokenBucketLimiter(per_minute / 60, burst, _store)
+    for policy, roles in RATE_LIMITS.items()
+    for role, (per_minute, burst) in roles.items()
+}
+
+_slots: Dict[str, ConcurrencyLimiter] = {
+    policy: ConcurrencyLimiter(limit, queue_limit, ADMISSION_QUEUE_TIMEOUT)
+    for policy, (limit, queue_limit) in CONCURRENCY_LIMITS.items()
+}
+
+def _too_many_requests(detail: str, retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+    )
+
+def admission(policy: str, role_dependency: Callable) -> Callable:
+    """
+    Dependency enforcing a policy's per-user rate limit and per-route concurrency cap
+
+    Use in place of the route's role dependency, e.g.
+    ``token_data: TokenData = Depends(admission("ai", teacher_required))``.
+    Each user gets a token bucket per policy sized by their role; requests
+    beyond the concurrency cap queue for a slot. Either limit answers 429
+    with Retry-After. With RATE_LIMIT_STORE=mongo the buckets are shared by
+    all workers; concurrency is always capped per worker.
+
+    Args:
+        policy: Key of RATE_LIMITS / CONCURRENCY_LIMITS
+        role_dependency: The role check the route would otherwise use
+
+    Returns:
+        A dependency yielding the caller's TokenData
+    """
+    slots = _slots[policy]
+
+    async def dependency(token_data: TokenData = Depends(role_dependency)):
+        bucket = _buckets.get((policy, token_data.role))
+        if bucket is not None:
+            retry_after = bucket.take(f"{policy}:{token_data.role.value}:{token_data.user_id}")
+            if retry_after is not None:
+                raise _too_many_requests("Rate limit exceeded, please slow down", retry_after)
+
+        try:
+            await slots.acquire()
+        except ConcurrencyLimitExceeded as e:
+            raise _too_many_requests(str(e), e.retry_after)
+        try:
+            yield token_data
+        finally:
+            slots.release()
+
+    return dependency
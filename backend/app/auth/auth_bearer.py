@@ -1,20 +1,35 @@
+import os
+import time
+from typing import Optional
 from fastapi import Request, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from .auth_handler import decode_token
-from app.models.user import UserRole
+from .auth_handler import decode_token_payload
+from .revocation import RevocationList
+from app.models.user import TokenData, UserRole
+from app.utils.cache import TTLCache
+from app.utils.server_timing import record_timing
+
+# Verified tokens kept per process; entries never outlive the token's own exp
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+TOKEN_CACHE_TTL = float(os.getenv("TOKEN_CACHE_TTL", "300"))
+
+# token -> (TokenData, issued-at UNIX time)
+_verified_tokens = TTLCache(TOKEN_CACHE_SIZE, TOKEN_CACHE_TTL)
 
 class JWTBearer(HTTPBearer):
     def __init__(self, auto_error: bool = True):
         super(JWTBearer, self).__init__(auto_error=auto_error)
         
     async def __call__(self, request: Request):
+        start = time.perf_counter()
         credentials: HTTPAuthorizationCredentials = await super(JWTBearer, self).__call__(request)
         
         if credentials:
             if not credentials.scheme == "Bearer":
                 raise HTTPException(status_code=403, detail="Invalid authentication scheme.")
             
-            token_data = self.verify_jwt(credentials.credentials)
+            token_data, cached = self.verify_jwt(credentials.credentials)
+            record_timing(request, "auth", time.perf_counter() - start, "cache hit" if cached else "verify")
             if not token_data:
                 raise HTTPException(status_code=403, detail="Invalid token or expired token.")
                 
@@ -23,8 +38,48 @@ class JWTBearer(HTTPBearer):
             raise HTTPException(status_code=403, detail="Invalid authorization code.")
             
     def verify_jwt(self, token: str):
-        # Verify token by decoding it and returning TokenData object
-        return decode_token(token)
+        """
+        Verify a token, reusing earlier verifications of the same token
+        
+        Returns:
+            (TokenData or None, whether the verification came from the cache)
+        """
+        cached = _verified_tokens.get(token)
+        if cached:
+            token_data, issued_at = cached
+            if RevocationList.is_revoked(token_data.user_id, issued_at):
+                _verified_tokens.pop(token)
+                return None, True
+            return token_data, True
+        
+        payload = decode_token_payload(token)
+        if payload is None or payload.get("sub") is None:
+            return None, False
+        
+        token_data = TokenData(user_id=payload["sub"], role=UserRole(payload.get("role")))
+        issued_at = payload.get("iat")
+        if RevocationList.is_revoked(token_data.user_id, issued_at):
+            return None, False
+        
+        ttl = min(TOKEN_CACHE_TTL, payload["exp"] - time.time()) if "exp" in payload else TOKEN_CACHE_TTL
+        if ttl > 0:
+            _verified_tokens.set(token, (token_data, issued_at), ttl=ttl)
+        return token_data, False
+
+_bearer = JWTBearer(auto_error=False)
+
+def request_role(request: Request) -> Optional[str]:
+    """
+    Role of the caller's bearer token, or None if it is missing or invalid
+
+    For middleware that needs to authorize a request before routing; route
+    handlers use the dependencies below.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme != "Bearer" or not token:
+        return None
+    token_data, _ = _bearer.verify_jwt(token)
+    return token_data.role.value if token_data else None
 
 # Role-based dependencies
 def admin_required(token_data = Depends(JWTBearer())):
@@ -1,6 +1,8 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
@@ -14,10 +16,27 @@ load_dotenv()
 # JWT settings
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing; hashes made with a different cost are upgraded on the next successful login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+# bcrypt releases the GIL, so a thread pool keeps hashing off the event loop
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2)))
+
+# Password operations allowed to wait for a worker before new ones are turned away
+PASSWORD_QUEUE_LIMIT = int(os.getenv("PASSWORD_QUEUE_LIMIT", str(PASSWORD_HASH_WORKERS * 16)))
+
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+_password_jobs = 0
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many password operations are already queued"""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("Too many sign-in attempts in progress, please retry shortly")
+        self.retry_after = retry_after
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
@@ -27,6 +46,33 @@ def get_password_hash(password: str) -> str:
     """Hash a password"""
     return pwd_context.hash(password)
 
+async def _run_password_job(func, *args):
+    """Run a bcrypt call on the password pool, refusing work beyond PASSWORD_QUEUE_LIMIT"""
+    global _password_jobs
+    if _password_jobs >= PASSWORD_HASH_WORKERS + PASSWORD_QUEUE_LIMIT:
+        # Roughly how long the queue ahead takes to drain at ~0.25s per hash
+        raise PasswordHasherBusy(retry_after=max(1, round(_password_jobs * 0.25 / PASSWORD_HASH_WORKERS)))
+
+    _password_jobs += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_password_executor, func, *args)
+    finally:
+        _password_jobs -= 1
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password on the password pool
+
+    Returns:
+        (valid, new_hash): new_hash is set when the stored hash uses another
+        cost factor than BCRYPT_ROUNDS and should be replaced
+    """
+    return await _run_password_job(pwd_context.verify_and_update, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the password pool"""
+    return await _run_password_job(pwd_context.hash, password)
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Create a new JWT token"""
     to_encode = data.copy()
@@ -36,21 +82,28 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     
     return encoded_jwt
 
-def decode_token(token: str) -> Optional[TokenData]:
-    """Decode a JWT token"""
+def decode_token_payload(token: str) -> Optional[Dict[str, Any]]:
+    """Verify a JWT token and return its claims, or None if it is invalid or expired"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        role: str = payload.get("role")
-        
-        if user_id is None:
-            return None
-            
-        return TokenData(user_id=user_id, role=UserRole(role))
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+def decode_token(token: str) -> Optional[TokenData]:
+    """Decode a JWT token"""
+    payload = decode_token_payload(token)
+    if payload is None:
+        return None
+    
+    user_id: str = payload.get("sub")
+    role: str = payload.get("role")
+    
+    if user_id is None:
+        return None
+    
+    return TokenData(user_id=user_id, role=UserRole(role))
@@ -1,92 +1,79 @@
 from datetime import timedelta
-from fastapi import APIRouter, HTTPException, Depends, status
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
-from bson import ObjectId
-from datetime import datetime
 
-from app.config.db import users_collection
-from app.models.user import UserLogin, Token, UserRole
-from .auth_handler import verify_password, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from app.models.user import UserLogin, Token, UserRole, TokenData, RefreshRequest
+from .auth_handler import create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from .auth_bearer import JWTBearer
+from .auth_service import AuthenticationService, LoginThrottled
+from .session_store import SessionStore
 
 router = APIRouter(tags=["Authentication"])
 
-@router.post("/login", response_model=Token)
-async def login(user_data: UserLogin):
-    # Find user by email
-    user = users_collection.find_one({"email": user_data.email})
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
+async def password_login(email: str, password: str, request: Request, required_role: Optional[UserRole] = None) -> Token:
+    """Run a password login through the rate-limited authentication service"""
+    try:
+        return await AuthenticationService.login(
+            email, password, request.client.host if request.client else None, required_role
         )
-    
-    # Verify password
-    if not verify_password(user_data.password, user["hashed_password"]):
+    except LoginThrottled as e:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
         )
-    
-    # Check if user is active
-    if not user.get("is_active", True):
+    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Account is inactive",
+            detail=str(e),
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    # Generate token
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": str(user["_id"]), "role": user["role"]},
-        expires_delta=access_token_expires
-    )
-    
-    return Token(
-        access_token=access_token,
-        token_type="bearer",
-        user_id=str(user["_id"]),
-        role=UserRole(user["role"])
-    )
+
+@router.post("/login", response_model=Token)
+async def login(user_data: UserLogin, request: Request):
+    return await password_login(user_data.email, user_data.password, request)
 
 @router.post("/oauth/token", response_model=Token)
-async def login_oauth(form_data: OAuth2PasswordRequestForm = Depends()):
+async def login_oauth(request: Request, form_data: OAuth2PasswordRequestForm = Depends()):
     # For OAuth2 compatibility - uses form data instead of JSON
-    user = users_collection.find_one({"email": form_data.username})
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    if not verify_password(form_data.password, user["hashed_password"]):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    return await password_login(form_data.username, form_data.password, request)
+
+@router.post("/refresh", response_model=Token)
+async def refresh_token(request: RefreshRequest):
+    """Exchange a refresh token for a new access token and refresh token (no password check)"""
+    rotated = SessionStore.rotate(request.refresh_token)
     
-    if not user.get("is_active", True):
+    if not rotated:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Account is inactive",
+            detail="Invalid or expired refresh token",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    session, new_refresh_token = rotated
     access_token = create_access_token(
-        data={"sub": str(user["_id"]), "role": user["role"]},
-        expires_delta=access_token_expires
+        data={"sub": session["user_id"], "role": session["role"]},
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     
     return Token(
         access_token=access_token,
         token_type="bearer",
-        user_id=str(user["_id"]),
-        role=UserRole(user["role"])
-    )
\ No newline at end of file
+        user_id=session["user_id"],
+        role=UserRole(session["role"]),
+        refresh_token=new_refresh_token,
+        expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    )
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(request: RefreshRequest):
+    """End the session of a refresh token"""
+    SessionStore.revoke(request.refresh_token)
+    return None
+
+@router.post("/logout/all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_everywhere(token_data: TokenData = Depends(JWTBearer())):
+    """End every session of the current user and reject their outstanding access tokens"""
+    SessionStore.revoke_user(token_data.user_id)
+    return None
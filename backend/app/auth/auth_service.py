@@ -0,0 +1,116 @@
+import os
+from datetime import timedelta
+from typing import Dict, Any, Optional
+
+from app.config.db import users_collection, rate_limits_collection
+from app.models.user import Token, UserRole
+from app.utils.rate_limit import SlidingWindowLimiter, MemoryRateLimitStore, MongoRateLimitStore
+from .auth_handler import verify_password_async, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from .session_store import SessionStore
+
+# Failed logins allowed per client IP, and login attempts per account, within the window.
+# Only failures count against an IP, so a classroom behind one NAT address can sign in at once.
+LOGIN_IP_LIMIT = int(os.getenv("LOGIN_IP_LIMIT", "30"))
+LOGIN_ACCOUNT_LIMIT = int(os.getenv("LOGIN_ACCOUNT_LIMIT", "5"))
+LOGIN_WINDOW_SECONDS = float(os.getenv("LOGIN_WINDOW_SECONDS", "300"))
+
+# "memory" limits per worker; "mongo" shares the attempt log between workers
+RATE_LIMIT_STORE = os.getenv("RATE_LIMIT_STORE", "memory").lower()
+
+def _store():
+    if RATE_LIMIT_STORE == "mongo":
+        return MongoRateLimitStore(rate_limits_collection)
+    return MemoryRateLimitStore()
+
+_ip_limiter = SlidingWindowLimiter(LOGIN_IP_LIMIT, LOGIN_WINDOW_SECONDS, _store())
+_account_limiter = SlidingWindowLimiter(LOGIN_ACCOUNT_LIMIT, LOGIN_WINDOW_SECONDS, _store())
+
+class LoginThrottled(Exception):
+    """Raised when a client IP or account has used up its login attempts"""
+
+    def __init__(self, retry_after: float):
+        super().__init__("Too many login attempts, please try again later")
+        self.retry_after = max(1, int(retry_after + 0.999))
+
+class AuthenticationService:
+    """Password login and token issuing shared by every login endpoint"""
+
+    @staticmethod
+    def issue_tokens(user: Dict[str, Any], full_name: Optional[str] = None) -> Token:
+        """Mint an access token and start a refresh-token session for a user"""
+        user_id = str(user["_id"])
+        access_token = create_access_token(
+            data={"sub": user_id, "role": user["role"]},
+            expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        )
+        return Token(
+            access_token=access_token,
+            token_type="bearer",
+            user_id=user_id,
+            role=UserRole(user["role"]),
+            full_name=full_name,
+            refresh_token=SessionStore.create(user_id, user["role"]),
+            expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        )
+
+    @staticmethod
+    async def login(
+        email: str,
+        password: str,
+        client_ip: Optional[str],
+        required_role: Optional[UserRole] = None
+    ) -> Token:
+        """
+        Check credentials and issue tokens
+
+        Every attempt counts against the account and failed attempts count
+        against the client IP, each in a sliding window; once either limit is
+        reached attempts are refused before any bcrypt work. A successful
+        login clears the account's count.
+
+        Args:
+            email: Account email
+            password: Plain password
+            client_ip: Address of the caller, if known
+            required_role: Only accept accounts with this role
+
+        Returns:
+            The token pair
+
+        Raises:
+            LoginThrottled: If the IP or account is over its limit
+            ValueError: If the credentials are wrong, the account is inactive
+                or has another role (the message is safe to return)
+        """
+        ip_key = f"ip:{client_ip or 'unknown'}"
+        account_key = f"account:{email.lower()}"
+        waits = [wait for wait in (_ip_limiter.retry_after(ip_key), _account_limiter.retry_after(account_key)) if wait is not None]
+        if waits:
+            raise LoginThrottled(max(waits))
+        _account_limiter.hit(account_key)
+
+        user = users_collection.find_one(
+            {"email": email},
+            {"hashed_password": 1, "role": 1, "is_active": 1, "full_name": 1}
+        )
+        if not user:
+            _ip_limiter.hit(ip_key)
+            raise ValueError("Incorrect email or password")
+
+        valid, new_hash = await verify_password_async(password, user["hashed_password"])
+        if not valid:
+            _ip_limiter.hit(ip_key)
+            raise ValueError("Incorrect email or password")
+
+        # Upgrade hashes made with another cost factor while the plain password is at hand
+        if new_hash:
+            users_collection.update_one({"_id": user["_id"]}, {"$set": {"hashed_password": new_hash}})
+
+        if required_role and user["role"] != required_role:
+            raise ValueError(f"This login is for {required_role.value}s only")
+
+        if not user.get("is_active", True):
+            raise ValueError("Account is inactive")
+
+        _account_limiter.reset(account_key)
+        return AuthenticationService.issue_tokens(user)
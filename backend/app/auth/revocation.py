@@ -0,0 +1,71 @@
+import math
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from app.config.db import revocations_collection
+from .auth_handler import ACCESS_TOKEN_EXPIRE_MINUTES
+
+# Set TOKEN_REVOCATION=false to skip revocation checks entirely
+TOKEN_REVOCATION = os.getenv("TOKEN_REVOCATION", "true").lower() in ("1", "true", "yes")
+
+# How often a worker reloads the revocation list, i.e. how soon other workers' revocations apply
+REVOCATION_CHECK_INTERVAL = float(os.getenv("REVOCATION_CHECK_INTERVAL", "5"))
+
+_lock = threading.Lock()
+# user id -> UNIX time of the revocation; tokens issued before it are rejected
+_revoked: Dict[str, float] = {}
+_loaded_at = float("-inf")
+
+class RevocationList:
+    """Users whose outstanding access tokens must be rejected (e.g. deactivated accounts)"""
+
+    @staticmethod
+    def is_revoked(user_id: str, issued_at: Optional[float]) -> bool:
+        """
+        Whether a token issued to a user at ``issued_at`` (UNIX time) has been revoked
+
+        The shared list is re-read every REVOCATION_CHECK_INTERVAL seconds, so
+        a revocation made by another worker applies within that interval.
+        """
+        global _revoked, _loaded_at
+        if not TOKEN_REVOCATION:
+            return False
+
+        now = time.monotonic()
+        if now - _loaded_at >= REVOCATION_CHECK_INTERVAL:
+            with _lock:
+                if now - _loaded_at >= REVOCATION_CHECK_INTERVAL:
+                    _revoked = {
+                        doc["_id"]: doc["revoked_at"].replace(tzinfo=timezone.utc).timestamp()
+                        for doc in revocations_collection.find({}, {"revoked_at": 1})
+                    }
+                    _loaded_at = now
+        revoked_at = _revoked.get(user_id)
+        # iat has whole-second precision: tokens from the second of the revocation
+        # are accepted, or a re-login right after it would be rejected for good
+        return revoked_at is not None and (issued_at or 0) < math.floor(revoked_at)
+
+    @staticmethod
+    def revoke(user_id: str) -> None:
+        """
+        Reject every token issued to a user until now
+
+        Tokens issued afterwards (e.g. after the account is reactivated) are
+        accepted again. The entry expires on its own once all tokens issued
+        before it have run out, which keeps the list small.
+        """
+        now = datetime.utcnow()
+        revocations_collection.replace_one(
+            {"_id": user_id},
+            {
+                "_id": user_id,
+                "revoked_at": now,
+                "expires_at": now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+            },
+            upsert=True
+        )
+        with _lock:
+            _revoked[user_id] = now.replace(tzinfo=timezone.utc).timestamp()
@@ -0,0 +1,97 @@
+import hashlib
+import os
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Tuple
+
+from pymongo import ReturnDocument
+
+from app.config.db import sessions_collection
+from .revocation import RevocationList
+
+# How long a login's refresh tokens stay usable; each use replaces the token with a
+# fresh one, but rotation never extends the session past this many days from login
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "30"))
+
+def _hash_token(token: str) -> str:
+    """Refresh tokens are random 256-bit values, so a plain SHA-256 is enough (no bcrypt)"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+class SessionStore:
+    """Server-side refresh-token sessions with rotation and reuse detection"""
+
+    @staticmethod
+    def create(
+        user_id: str,
+        role: str,
+        family_id: Optional[str] = None,
+        expires_at: Optional[datetime] = None
+    ) -> str:
+        """
+        Start a session (or continue a rotation family) and return its refresh token
+
+        Only the token's hash is stored. Sessions expire through the TTL index
+        on expires_at; a continued family passes its existing expiry so that
+        rotation cannot keep it alive indefinitely.
+        """
+        token = secrets.token_urlsafe(32)
+        now = datetime.utcnow()
+        sessions_collection.insert_one({
+            "_id": _hash_token(token),
+            "user_id": user_id,
+            "role": role,
+            "family_id": family_id or secrets.token_hex(16),
+            "created_at": now,
+            "expires_at": expires_at or now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        })
+        return token
+
+    @staticmethod
+    def rotate(token: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Exchange a refresh token for a new one
+
+        The old token is marked used atomically, so it works exactly once.
+        Presenting an already used token means it leaked: the whole family of
+        tokens descending from the same login is revoked.
+
+        Returns:
+            (session, new refresh token), or None if the token is unknown,
+            expired, reused or its user's tokens have been revoked
+        """
+        token_hash = _hash_token(token)
+        now = datetime.utcnow()
+        session = sessions_collection.find_one_and_update(
+            {"_id": token_hash, "used_at": {"$exists": False}, "expires_at": {"$gt": now}},
+            {"$set": {"used_at": now}},
+            return_document=ReturnDocument.AFTER
+        )
+        if not session:
+            reused = sessions_collection.find_one({"_id": token_hash, "used_at": {"$exists": True}}, {"family_id": 1})
+            if reused:
+                sessions_collection.delete_many({"family_id": reused["family_id"]})
+            return None
+
+        issued_at = session["created_at"].replace(tzinfo=timezone.utc).timestamp()
+        if RevocationList.is_revoked(session["user_id"], issued_at):
+            sessions_collection.delete_many({"family_id": session["family_id"]})
+            return None
+
+        new_token = SessionStore.create(
+            session["user_id"], session["role"], session["family_id"], session["expires_at"]
+        )
+        return session, new_token
+
+    @staticmethod
+    def revoke(token: str) -> None:
+        """End the session family a refresh token belongs to (logout)"""
+        session = sessions_collection.find_one({"_id": _hash_token(token)}, {"family_id": 1})
+        if session:
+            sessions_collection.delete_many({"family_id": session["family_id"]})
+
+    @staticmethod
+    def revoke_user(user_id: str) -> int:
+        """End every session of a user and reject their outstanding access tokens"""
+        deleted = sessions_collection.delete_many({"user_id": user_id}).deleted_count
+        RevocationList.revoke(user_id)
+        return deleted
@@ -5,6 +5,8 @@ from dotenv import load_dotenv
 import os
 import logging
 
+from app.utils.metrics import CommandMetrics
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,7 +20,8 @@ DB_NAME = os.getenv("DB_NAME", "question_generator_db")
 
 try:
     # Connect to MongoDB
-    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
+    # CommandMetrics attributes command time to the request being handled (see app/utils/metrics.py)
+    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000, event_listeners=[CommandMetrics()])
     # Check connection
     client.server_info()
     logger.info(f"Connected to MongoDB database: {DB_NAME}")
@@ -34,6 +37,12 @@ try:
     topics_collection = db["topics"]
     questions_collection = db["questions"]
     prompts_collection = db["prompts"]
+    curriculum_catalog_collection = db["curriculum_catalog"]
+    meta_collection = db["meta"]
+    jobs_collection = db["jobs"]
+    revocations_collection = db["revocations"]
+    sessions_collection = db["sessions"]
+    rate_limits_collection = db["rate_limits"]
 
     # Create indexes
     try:
@@ -49,6 +58,37 @@ try:
         topics_collection.create_index([("name", 1), ("unit_id", 1)], unique=True)
         topics_collection.create_index("slug", unique=True)  # Add slug index
         questions_collection.create_index("question_text")
+        # Keyset pagination indexes: equality filter first, then the _id sort key
+        users_collection.create_index([("role", 1), ("_id", 1)])
+        subjects_collection.create_index([("curriculum_id", 1), ("_id", 1)])
+        courses_collection.create_index([("subject_id", 1), ("_id", 1)])
+        units_collection.create_index([("course_id", 1), ("_id", 1)])
+        topics_collection.create_index([("unit_id", 1), ("_id", 1)])
+        questions_collection.create_index([("topic_id", 1), ("_id", 1)])
+        # Question search: multikey inverted index over normalized terms
+        questions_collection.create_index("search_terms")
+        questions_collection.create_index([("topic_id", 1), ("search_terms", 1)])
+        # Materialized ancestor ids: curriculum-level filters are plain equality matches
+        for ancestor_field in ("course_id", "subject_id", "curriculum_id"):
+            topics_collection.create_index(ancestor_field)
+        for ancestor_field in ("unit_id", "course_id", "subject_id", "curriculum_id"):
+            questions_collection.create_index(ancestor_field)
+        # Denormalized search catalog of every curriculum hierarchy node
+        curriculum_catalog_collection.create_index("name_normalized")
+        curriculum_catalog_collection.create_index("name_terms")
+        curriculum_catalog_collection.create_index([("curriculum_id", 1), ("name_terms", 1)])
+        for ancestor_field in ("subject_id", "course_id", "unit_id"):
+            curriculum_catalog_collection.create_index(ancestor_field, sparse=True)
+        jobs_collection.create_index([("type", 1), ("status", 1)])
+        # Revoked users are only remembered until every token issued before the revocation has expired
+        revocations_collection.create_index("expires_at", expireAfterSeconds=0)
+        # Refresh-token sessions: expired ones are removed by the TTL monitor
+        sessions_collection.create_index("expires_at", expireAfterSeconds=0)
+        sessions_collection.create_index("user_id")
+        sessions_collection.create_index("family_id")
+        # Shared login rate limiting (RATE_LIMIT_STORE=mongo): one document per attempt
+        rate_limits_collection.create_index([("key", 1), ("at", 1)])
+        rate_limits_collection.create_index("expires_at", expireAfterSeconds=0)
         logger.info("Database indexes created successfully")
     except errors.OperationFailure as e:
         logger.warning(f"Error creating indexes: {e}")
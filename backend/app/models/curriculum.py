@@ -142,6 +142,10 @@ class TopicUpdate(BaseModel):
     unit_id: Optional[str] = None
     slug: Optional[str] = None  # Added slug field
 
+# Moving a subject, course, unit or topic under another parent (one level up)
+class NodeMove(BaseModel):
+    parent_id: str  # ID or slug of the new parent
+
 class TopicInDB(TopicBase):
     id: str = Field(alias="_id")
     created_by: str
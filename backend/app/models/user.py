@@ -47,6 +47,11 @@ class Token(BaseModel):
     user_id: str
     role: UserRole
     full_name: Optional[str] = None  # Added for returning user name with token response
+    refresh_token: Optional[str] = None  # Exchanged at /refresh for a new token pair
+    expires_in: Optional[int] = None  # Access token lifetime in seconds
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
 
 class TokenData(BaseModel):
     user_id: Optional[str] = None
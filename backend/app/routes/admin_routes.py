@@ -1,15 +1,20 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Response
 from typing import List, Optional
 from datetime import datetime
 from bson import ObjectId
 
 from app.auth.auth_bearer import admin_required
-from app.auth.auth_handler import get_password_hash
+from app.auth.auth_handler import get_password_hash_async
+from app.auth.session_store import SessionStore
 from app.config.db import users_collection
 from app.models.user import (
     UserCreate, UserUpdate, UserOut, UserRole, TokenData
 )
+from app.services.cascade_service import CascadeDeleteService
+from app.services.user_profiles import UserProfileCache
 from app.utils.db_utils import transform_object_id
+from app.utils.pagination import paginate_response
+from app.utils.projections import USER_OUT_PROJECTION
 
 router = APIRouter(tags=["Admin"])
 
@@ -36,7 +41,7 @@ async def create_user(user: UserCreate, token_data: TokenData = Depends(admin_re
         )
     
     # Hash the password
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await get_password_hash_async(user.password)
     
     now = datetime.utcnow()
     user_data = {
@@ -56,9 +61,11 @@ async def create_user(user: UserCreate, token_data: TokenData = Depends(admin_re
 
 @router.get("/users", response_model=List[UserOut])
 async def get_all_users(
+    response: Response,
     role: Optional[UserRole] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     token_data: TokenData = Depends(admin_required)
 ):
     """Get all users with optional role filtering"""
@@ -66,7 +73,10 @@ async def get_all_users(
     if role:
         query["role"] = role
         
-    users = users_collection.find(query).skip(skip).limit(limit)
+    users = paginate_response(
+        users_collection, query, response, limit, skip, cursor,
+        projection=USER_OUT_PROJECTION
+    )
     return [transform_object_id(user) for user in users]
 
 @router.get("/users/{user_id}", response_model=UserOut)
@@ -118,6 +128,11 @@ async def update_user(
             {"_id": user_oid},
             {"$set": update_data}
         )
+        UserProfileCache.invalidate(user_id)
+        
+        # Deactivating through an update rejects outstanding tokens too
+        if update_data.get("is_active") is False and existing_user.get("is_active", True):
+            SessionStore.revoke_user(user_id)
     
     # Return the updated user
     updated_user = users_collection.find_one({"_id": user_oid})
@@ -148,6 +163,8 @@ async def delete_user(
     
     # Delete the user
     users_collection.delete_one({"_id": user_oid})
+    SessionStore.revoke_user(user_id)
+    UserProfileCache.invalidate(user_id)
     
     return None
 
@@ -169,7 +186,7 @@ async def reset_user_password(
         )
     
     # Hash the new password
-    hashed_password = get_password_hash(new_password)
+    hashed_password = await get_password_hash_async(new_password)
     
     # Update the user
     users_collection.update_one(
@@ -179,6 +196,8 @@ async def reset_user_password(
             "updated_at": datetime.utcnow()
         }}
     )
+    # Sessions opened with the old password must not outlive it
+    SessionStore.revoke_user(user_id)
     
     return None
 
@@ -214,6 +233,10 @@ async def deactivate_user(
         }}
     )
     
+    # End the user's sessions and reject outstanding tokens on every worker within seconds
+    SessionStore.revoke_user(user_id)
+    UserProfileCache.invalidate(user_id)
+    
     # Return the updated user
     updated_user = users_collection.find_one({"_id": user_oid})
     return transform_object_id(updated_user)
@@ -242,7 +265,22 @@ async def activate_user(
             "updated_at": datetime.utcnow()
         }}
     )
+    UserProfileCache.invalidate(user_id)
     
     # Return the updated user
     updated_user = users_collection.find_one({"_id": user_oid})
-    return transform_object_id(updated_user)
\ No newline at end of file
+    return transform_object_id(updated_user)
+
+# Background job endpoints
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str, token_data: TokenData = Depends(admin_required)):
+    """Get the status, per-level counts and run time of a cascade-delete or move job"""
+    job = await CascadeDeleteService.get_job(parse_object_id(job_id))
+    
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with ID {job_id} not found"
+        )
+    
+    return transform_object_id(job)
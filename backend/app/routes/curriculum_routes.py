@@ -1,7 +1,9 @@
 # backend/app/routes/curriculum_routes.py - Fixed ObjectId transformation and slug handling
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Response, UploadFile, File
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Any, Dict, List, Optional
+import codecs
 from datetime import datetime
 from bson import ObjectId
 import pymongo
@@ -16,11 +18,25 @@ from app.models.curriculum import (
     SubjectCreate, SubjectUpdate, SubjectOut, SubjectWithCourses,
     CourseCreate, CourseUpdate, CourseOut, CourseWithUnits,
     UnitCreate, UnitUpdate, UnitOut, UnitWithTopics,
-    TopicCreate, TopicUpdate, TopicOut
+    TopicCreate, TopicUpdate, TopicOut, NodeMove
 )
 from app.models.user import TokenData
-from app.utils.helpers import create_unique_slug
+from app.utils.helpers import create_unique_slug, insert_with_unique_slug
 from app.utils.db_utils import transform_object_id
+from app.utils.pagination import paginate_response
+from app.utils.responses import fast_json
+from app.utils.projections import TREE_NODE_FIELDS
+from app.utils.curriculum_io import read_jsonl, read_csv, write_jsonl, write_csv
+from app.services.catalog_service import CatalogService
+from app.services.hierarchy_cache import HierarchyCache
+from app.services.ancestry_service import AncestryService
+from app.services.cascade_service import CascadeDeleteService
+from app.services.bulk_service import BulkCurriculumService
+from app.services.node_resolver import NodeResolver
+from app.services.question_stats import QuestionStatsCache
+from app.services.move_service import MoveService
+from app.services.hierarchy_cache import COLLECTIONS
+from app.utils.hierarchy import PARENT_FIELD, PARENT_LEVEL
 
 router = APIRouter(tags=["Curriculum"])
 
@@ -33,21 +49,77 @@ def parse_object_id(id_str: str):
         return None
 
 def get_by_id_or_slug(collection, id_or_slug):
-    """Try to find document by ID first, then by slug if ID lookup fails"""
-    # Try to find by ID first
-    obj_id = parse_object_id(id_or_slug)
-    if obj_id:
-        doc = collection.find_one({"_id": obj_id})
-        if doc:
-            return doc, str(doc["_id"])
-    
-    # If not found by ID or not a valid ObjectID, try by slug
-    doc = collection.find_one({"slug": id_or_slug})
-    if doc:
-        return doc, str(doc["_id"])
-    
-    # Not found by either method
-    return None, None
+    """Find a document by ID or slug (ID wins) with a single query"""
+    return NodeResolver.get(collection, id_or_slug)
+
+async def cascade_delete(node_type: str, node_id: str):
+    """Delete a node with its whole subtree (questions included)"""
+    job = await CascadeDeleteService.delete(node_type, node_id)
+    if job["status"] == "done":
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    
+    # Large subtree: deletion continues in the background, poll /api/jobs/{job_id}
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={"job_id": str(job["_id"]), "status": job["status"]}
+    )
+
+async def move_node(node_type: str, id_or_slug: str, move: NodeMove):
+    """Move a node with its subtree under a new parent"""
+    collection = COLLECTIONS[node_type]
+    node, _ = get_by_id_or_slug(collection, id_or_slug)
+    if not node:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{node_type.capitalize()} with ID or slug {id_or_slug} not found"
+        )
+    
+    parent_type = PARENT_LEVEL[node_type]
+    parent_id = NodeResolver.resolve_id(COLLECTIONS[parent_type], move.parent_id)
+    if not parent_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{parent_type.capitalize()} with ID or slug {move.parent_id} not found"
+        )
+    
+    if parent_id == node.get(PARENT_FIELD[node_type]):
+        return transform_object_id(node)
+    
+    return await reparent(node_type, node, parent_id)
+
+async def reparent(node_type: str, node: Dict[str, Any], parent_id: str):
+    """
+    Move a node under a resolved parent id through MoveService
+
+    Shared by the /move endpoints and the PUT endpoints, so a parent change
+    always gets the sibling-name check, the transaction and the job fallback.
+    """
+    try:
+        job = await MoveService.move(node_type, node, parent_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    if job["status"] != "done":
+        # Large subtree: the move continues in the background, poll /api/jobs/{job_id}
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"job_id": str(job["_id"]), "status": job["status"]}
+        )
+    
+    return transform_object_id(COLLECTIONS[node_type].find_one({"_id": node["_id"]}))
+
+# Search across every hierarchy level
+@router.get("/catalog/search")
+async def search_catalog(
+    q: str = Query(..., min_length=1),
+    curriculum_id: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    token_data: TokenData = Depends(student_or_above_required)
+):
+    return await CatalogService.search(q, limit, curriculum_id)
 
 # Curriculum endpoints
 @router.post("/curriculum", response_model=CurriculumOut, status_code=status.HTTP_201_CREATED)
@@ -60,6 +132,7 @@ async def create_curriculum(curriculum: CurriculumCreate, token_data: TokenData
         )
     
     # Generate a unique slug if not provided
+    slug_generated = not curriculum.slug
     if not curriculum.slug:
         curriculum.slug = create_unique_slug(curriculum_collection, curriculum.name)
     else:
@@ -78,19 +151,23 @@ async def create_curriculum(curriculum: CurriculumCreate, token_data: TokenData
         "updated_at": now
     }
     
-    result = curriculum_collection.insert_one(curriculum_data)
+    result = insert_with_unique_slug(curriculum_collection, curriculum_data, regenerate=slug_generated)
     
     created_curriculum = curriculum_collection.find_one({"_id": result.inserted_id})
+    await CatalogService.upsert_node("curriculum", created_curriculum)
+    HierarchyCache.node_changed("curriculum", created_curriculum)
     # Transform MongoDB document to match Pydantic model
     return transform_object_id(created_curriculum)
 
 @router.get("/curriculum", response_model=List[CurriculumOut])
 async def get_all_curricula(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     token_data: TokenData = Depends(student_or_above_required)
 ):
-    curricula = list(curriculum_collection.find().skip(skip).limit(limit))
+    curricula = paginate_response(curriculum_collection, {}, response, limit, skip, cursor)
     # Transform MongoDB documents to match Pydantic model
     return [transform_object_id(curriculum) for curriculum in curricula]
 
@@ -109,84 +186,84 @@ async def get_curriculum(
     
     return transform_object_id(curriculum)
 
+@router.post("/curriculum/import")
+async def import_curriculum(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(jsonl|csv)$"),
+    token_data: TokenData = Depends(admin_required)
+):
+    """Bulk import a curriculum hierarchy (and questions) from a JSON Lines or CSV file"""
+    if not format:
+        format = "csv" if (file.filename or "").lower().endswith(".csv") else "jsonl"
+    
+    lines = codecs.iterdecode(file.file, "utf-8")
+    records = read_csv(lines) if format == "csv" else read_jsonl(lines)
+    
+    try:
+        return await BulkCurriculumService.import_records(records, token_data.user_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Import failed: {str(e)}"
+        )
+
+@router.get("/curriculum/{curriculum_id_or_slug}/export")
+async def export_curriculum(
+    curriculum_id_or_slug: str,
+    format: str = Query("jsonl", pattern="^(jsonl|csv)$"),
+    include_questions: bool = True,
+    token_data: TokenData = Depends(teacher_required)
+):
+    """Stream a curriculum with its hierarchy (and questions) in the import format"""
+    curriculum, _ = get_by_id_or_slug(curriculum_collection, curriculum_id_or_slug)
+    
+    if not curriculum:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Curriculum with ID or slug {curriculum_id_or_slug} not found"
+        )
+    
+    records = BulkCurriculumService.export_records(curriculum, include_questions)
+    writer, media_type = (write_csv, "text/csv") if format == "csv" else (write_jsonl, "application/x-ndjson")
+    filename = f"{curriculum.get('slug') or curriculum['_id']}.{format}"
+    
+    return StreamingResponse(
+        writer(records),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.get("/curriculum/{curriculum_id_or_slug}/full", response_model=CurriculumWithSubjects)
 async def get_curriculum_with_hierarchy(
     curriculum_id_or_slug: str,
     token_data: TokenData = Depends(student_or_above_required)
 ):
     """Get full curriculum hierarchy with subjects, courses, units, and topics"""
-    curriculum, curriculum_id = get_by_id_or_slug(curriculum_collection, curriculum_id_or_slug)
+    curriculum_with_hierarchy = HierarchyCache.get_subtree("curriculum", curriculum_id_or_slug, TREE_NODE_FIELDS)
     
-    if not curriculum:
+    if not curriculum_with_hierarchy:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Curriculum with ID or slug {curriculum_id_or_slug} not found"
         )
     
-    # Get all subjects for this curriculum
-    subjects = list(subjects_collection.find({"curriculum_id": curriculum_id}))
-    subject_ids = [str(subject["_id"]) for subject in subjects]
-    
-    # Get all courses for these subjects
-    courses = list(courses_collection.find({"subject_id": {"$in": subject_ids}}))
-    
-    # Group courses by subject_id
-    subject_courses = {}
-    for course in courses:
-        subject_id = course["subject_id"]
-        if subject_id not in subject_courses:
-            subject_courses[subject_id] = []
-        subject_courses[subject_id].append(course)
-    
-    # Get all units for these courses
-    course_ids = [str(course["_id"]) for course in courses]
-    units = list(units_collection.find({"course_id": {"$in": course_ids}}))
-    
-    # Group units by course_id
-    course_units = {}
-    for unit in units:
-        course_id = unit["course_id"]
-        if course_id not in course_units:
-            course_units[course_id] = []
-        course_units[course_id].append(unit)
-    
-    # Get all topics for these units
-    unit_ids = [str(unit["_id"]) for unit in units]
-    topics = list(topics_collection.find({"unit_id": {"$in": unit_ids}}))
-    
-    # Group topics by unit_id
-    unit_topics = {}
-    for topic in topics:
-        unit_id = topic["unit_id"]
-        if unit_id not in unit_topics:
-            unit_topics[unit_id] = []
-        unit_topics[unit_id].append(topic)
-    
-    # Build the hierarchy
-    curriculum_with_hierarchy = dict(curriculum)
-    curriculum_with_hierarchy["subjects"] = []
-    
-    for subject in subjects:
-        subject_dict = dict(subject)
-        subject_dict["courses"] = []
-        
-        # Add courses to subject
-        for course in subject_courses.get(str(subject["_id"]), []):
-            course_dict = dict(course)
-            course_dict["units"] = []
-            
-            # Add units to course
-            for unit in course_units.get(str(course["_id"]), []):
-                unit_dict = dict(unit)
-                unit_dict["topics"] = unit_topics.get(str(unit["_id"]), [])
-                course_dict["units"].append(unit_dict)
-            
-            subject_dict["courses"].append(course_dict)
-        
-        curriculum_with_hierarchy["subjects"].append(subject_dict)
+    return fast_json(transform_object_id(curriculum_with_hierarchy))
+
+@router.get("/curriculum/{curriculum_id_or_slug}/stats/tree")
+async def get_curriculum_stats_tree(
+    curriculum_id_or_slug: str,
+    token_data: TokenData = Depends(teacher_required)
+):
+    """Get the full curriculum hierarchy with question counts by type and difficulty at every node"""
+    curriculum_with_stats = QuestionStatsCache.get_tree_stats(curriculum_id_or_slug)
     
-    # Transform the entire structure to match Pydantic model
-    return transform_object_id(curriculum_with_hierarchy)
+    if not curriculum_with_stats:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Curriculum with ID or slug {curriculum_id_or_slug} not found"
+        )
+    
+    return transform_object_id(curriculum_with_stats)
 
 @router.put("/curriculum/{curriculum_id_or_slug}", response_model=CurriculumOut)
 async def update_curriculum(
@@ -237,6 +314,8 @@ async def update_curriculum(
     
     # Return the updated curriculum
     updated_curriculum = curriculum_collection.find_one({"_id": curriculum_oid})
+    await CatalogService.upsert_node("curriculum", updated_curriculum)
+    HierarchyCache.node_changed("curriculum", updated_curriculum)
     return transform_object_id(updated_curriculum)
 
 @router.delete("/curriculum/{curriculum_id_or_slug}", status_code=status.HTTP_204_NO_CONTENT)
@@ -252,36 +331,15 @@ async def delete_curriculum(
             detail=f"Curriculum with ID or slug {curriculum_id_or_slug} not found"
         )
     
-    curriculum_oid = curriculum_obj["_id"]
-    
-    # Get all subjects for this curriculum
-    subjects = subjects_collection.find({"curriculum_id": curriculum_id})
-    subject_ids = [str(subject["_id"]) for subject in subjects]
-    
-    # Get all courses for these subjects
-    courses = courses_collection.find({"subject_id": {"$in": subject_ids}})
-    course_ids = [str(course["_id"]) for course in courses]
-    
-    # Get all units for these courses
-    units = units_collection.find({"course_id": {"$in": course_ids}})
-    unit_ids = [str(unit["_id"]) for unit in units]
-    
-    # Delete everything in reverse order (topics → units → courses → subjects → curriculum)
-    topics_collection.delete_many({"unit_id": {"$in": unit_ids}})
-    units_collection.delete_many({"course_id": {"$in": course_ids}})
-    courses_collection.delete_many({"subject_id": {"$in": subject_ids}})
-    subjects_collection.delete_many({"curriculum_id": curriculum_id})
-    curriculum_collection.delete_one({"_id": curriculum_oid})
-    
-    return None
+    return await cascade_delete("curriculum", curriculum_id)
 
 # Subject endpoints
 @router.post("/subjects", response_model=SubjectOut, status_code=status.HTTP_201_CREATED)
 async def create_subject(subject: SubjectCreate, token_data: TokenData = Depends(admin_required)):
     # Check if curriculum exists
-    curriculum, curriculum_id = get_by_id_or_slug(curriculum_collection, subject.curriculum_id)
+    curriculum_id = NodeResolver.resolve_id(curriculum_collection, subject.curriculum_id)
     
-    if not curriculum:
+    if not curriculum_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Curriculum with ID or slug {subject.curriculum_id} not found"
@@ -301,6 +359,7 @@ async def create_subject(subject: SubjectCreate, token_data: TokenData = Depends
         )
     
     # Generate a unique slug if not provided
+    slug_generated = not subject.slug
     if not subject.slug:
         subject.slug = create_unique_slug(subjects_collection, subject.name)
     else:
@@ -319,28 +378,32 @@ async def create_subject(subject: SubjectCreate, token_data: TokenData = Depends
         "updated_at": now
     }
     
-    result = subjects_collection.insert_one(subject_data)
+    result = insert_with_unique_slug(subjects_collection, subject_data, regenerate=slug_generated)
     created_subject = subjects_collection.find_one({"_id": result.inserted_id})
+    await CatalogService.upsert_node("subject", created_subject)
+    HierarchyCache.node_changed("subject", created_subject)
     
     return transform_object_id(created_subject)
 
 @router.get("/subjects", response_model=List[SubjectOut])
 async def get_all_subjects(
+    response: Response,
     curriculum_id: Optional[str] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     token_data: TokenData = Depends(student_or_above_required)
 ):
     query = {}
     if curriculum_id:
         # Check if it's an ObjectId or a slug
-        curriculum, curr_id = get_by_id_or_slug(curriculum_collection, curriculum_id)
-        if curriculum:
+        curr_id = NodeResolver.resolve_id(curriculum_collection, curriculum_id)
+        if curr_id:
             query["curriculum_id"] = curr_id
         else:
             query["curriculum_id"] = curriculum_id  # Use as-is for consistent behavior
         
-    subjects = subjects_collection.find(query).skip(skip).limit(limit)
+    subjects = paginate_response(subjects_collection, query, response, limit, skip, cursor)
     return [transform_object_id(subject) for subject in subjects]
 
 @router.get("/subjects/{subject_id_or_slug}", response_model=SubjectOut)
@@ -364,58 +427,24 @@ async def get_subject_with_hierarchy(
     token_data: TokenData = Depends(student_or_above_required)
 ):
     """Get subject with its courses, units, and topics"""
-    subject, subject_id = get_by_id_or_slug(subjects_collection, subject_id_or_slug)
+    subject_with_hierarchy = HierarchyCache.get_subtree("subject", subject_id_or_slug, TREE_NODE_FIELDS)
     
-    if not subject:
+    if not subject_with_hierarchy:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Subject with ID or slug {subject_id_or_slug} not found"
         )
     
-    # Get all courses for this subject
-    courses = list(courses_collection.find({"subject_id": subject_id}))
-    course_ids = [str(course["_id"]) for course in courses]
-    
-    # Get all units for these courses
-    units = list(units_collection.find({"course_id": {"$in": course_ids}}))
-    
-    # Group units by course_id
-    course_units = {}
-    for unit in units:
-        course_id = unit["course_id"]
-        if course_id not in course_units:
-            course_units[course_id] = []
-        course_units[course_id].append(unit)
-    
-    # Get all topics for these units
-    unit_ids = [str(unit["_id"]) for unit in units]
-    topics = list(topics_collection.find({"unit_id": {"$in": unit_ids}}))
-    
-    # Group topics by unit_id
-    unit_topics = {}
-    for topic in topics:
-        unit_id = topic["unit_id"]
-        if unit_id not in unit_topics:
-            unit_topics[unit_id] = []
-        unit_topics[unit_id].append(topic)
-    
-    # Build the hierarchy
-    subject_with_hierarchy = dict(subject)
-    subject_with_hierarchy["courses"] = []
-    
-    for course in courses:
-        course_dict = dict(course)
-        course_dict["units"] = []
-        
-        # Add units to course
-        for unit in course_units.get(str(course["_id"]), []):
-            unit_dict = dict(unit)
-            unit_dict["topics"] = unit_topics.get(str(unit["_id"]), [])
-            course_dict["units"].append(unit_dict)
-        
-        subject_with_hierarchy["courses"].append(course_dict)
-    
-    return transform_object_id(subject_with_hierarchy)
+    return fast_json(transform_object_id(subject_with_hierarchy))
+
+@router.post("/subjects/{subject_id_or_slug}/move", response_model=SubjectOut)
+async def move_subject(
+    subject_id_or_slug: str,
+    move: NodeMove,
+    token_data: TokenData = Depends(admin_required)
+):
+    """Move a subject (with everything below it) to another curriculum"""
+    return await move_node("subject", subject_id_or_slug, move)
 
 @router.put("/subjects/{subject_id_or_slug}", response_model=SubjectOut)
 async def update_subject(
@@ -435,9 +464,9 @@ async def update_subject(
     
     # If curriculum_id is being changed, check if the new curriculum exists
     if subject.curriculum_id and subject.curriculum_id != subject_obj["curriculum_id"]:
-        curriculum, curriculum_id = get_by_id_or_slug(curriculum_collection, subject.curriculum_id)
+        curriculum_id = NodeResolver.resolve_id(curriculum_collection, subject.curriculum_id)
         
-        if not curriculum:
+        if not curriculum_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Curriculum with ID or slug {subject.curriculum_id} not found"
@@ -472,6 +501,8 @@ async def update_subject(
     
     # Prepare update data, excluding None values
     update_data = {k: v for k, v in subject.dict().items() if v is not None}
+    # A parent change is applied by reparent() below, like POST /subjects/{id}/move
+    new_parent_id = update_data.pop("curriculum_id", subject_obj["curriculum_id"])
     if update_data:
         update_data["updated_at"] = datetime.utcnow()
         
@@ -483,6 +514,11 @@ async def update_subject(
     
     # Return the updated subject
     updated_subject = subjects_collection.find_one({"_id": subject_oid})
+    await CatalogService.upsert_node("subject", updated_subject)
+    HierarchyCache.node_changed("subject", updated_subject)
+    
+    if new_parent_id != subject_obj["curriculum_id"]:
+        return await reparent("subject", updated_subject, new_parent_id)
     return transform_object_id(updated_subject)
 
 @router.delete("/subjects/{subject_id_or_slug}", status_code=status.HTTP_204_NO_CONTENT)
@@ -498,31 +534,15 @@ async def delete_subject(
             detail=f"Subject with ID or slug {subject_id_or_slug} not found"
         )
     
-    subject_oid = subject_obj["_id"]
-    
-    # Get all courses for this subject
-    courses = courses_collection.find({"subject_id": subject_id})
-    course_ids = [str(course["_id"]) for course in courses]
-    
-    # Get all units for these courses
-    units = units_collection.find({"course_id": {"$in": course_ids}})
-    unit_ids = [str(unit["_id"]) for unit in units]
-    
-    # Delete everything in reverse order (topics → units → courses → subject)
-    topics_collection.delete_many({"unit_id": {"$in": unit_ids}})
-    units_collection.delete_many({"course_id": {"$in": course_ids}})
-    courses_collection.delete_many({"subject_id": subject_id})
-    subjects_collection.delete_one({"_id": subject_oid})
-    
-    return None
+    return await cascade_delete("subject", subject_id)
 
 # Course endpoints
 @router.post("/courses", response_model=CourseOut, status_code=status.HTTP_201_CREATED)
 async def create_course(course: CourseCreate, token_data: TokenData = Depends(admin_required)):
     # Check if subject exists
-    subject, subject_id = get_by_id_or_slug(subjects_collection, course.subject_id)
+    subject_id = NodeResolver.resolve_id(subjects_collection, course.subject_id)
     
-    if not subject:
+    if not subject_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Subject with ID or slug {course.subject_id} not found"
@@ -542,6 +562,7 @@ async def create_course(course: CourseCreate, token_data: TokenData = Depends(ad
         )
     
     # Generate a unique slug if not provided
+    slug_generated = not course.slug
     if not course.slug:
         course.slug = create_unique_slug(courses_collection, course.name)
     else:
@@ -560,28 +581,32 @@ async def create_course(course: CourseCreate, token_data: TokenData = Depends(ad
         "updated_at": now
     }
     
-    result = courses_collection.insert_one(course_data)
+    result = insert_with_unique_slug(courses_collection, course_data, regenerate=slug_generated)
     created_course = courses_collection.find_one({"_id": result.inserted_id})
+    await CatalogService.upsert_node("course", created_course)
+    HierarchyCache.node_changed("course", created_course)
     
     return transform_object_id(created_course)
 
 @router.get("/courses", response_model=List[CourseOut])
 async def get_all_courses(
+    response: Response,
     subject_id: Optional[str] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     token_data: TokenData = Depends(student_or_above_required)
 ):
     query = {}
     if subject_id:
         # Check if it's an ObjectId or a slug
-        subject, subj_id = get_by_id_or_slug(subjects_collection, subject_id)
-        if subject:
+        subj_id = NodeResolver.resolve_id(subjects_collection, subject_id)
+        if subj_id:
             query["subject_id"] = subj_id
         else:
             query["subject_id"] = subject_id  # Use as-is for consistent behavior
     
-    courses = courses_collection.find(query).skip(skip).limit(limit)
+    courses = paginate_response(courses_collection, query, response, limit, skip, cursor)
     return [transform_object_id(course) for course in courses]
 
 @router.get("/courses/{course_id_or_slug}", response_model=CourseOut)
@@ -605,39 +630,24 @@ async def get_course_with_hierarchy(
     token_data: TokenData = Depends(student_or_above_required)
 ):
     """Get course with its units and topics"""
-    course, course_id = get_by_id_or_slug(courses_collection, course_id_or_slug)
+    course_with_hierarchy = HierarchyCache.get_subtree("course", course_id_or_slug, TREE_NODE_FIELDS)
     
-    if not course:
+    if not course_with_hierarchy:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Course with ID or slug {course_id_or_slug} not found"
         )
     
-    # Get all units for this course
-    units = list(units_collection.find({"course_id": course_id}))
-    unit_ids = [str(unit["_id"]) for unit in units]
-    
-    # Get all topics for these units
-    topics = list(topics_collection.find({"unit_id": {"$in": unit_ids}}))
-    
-    # Group topics by unit_id
-    unit_topics = {}
-    for topic in topics:
-        unit_id = topic["unit_id"]
-        if unit_id not in unit_topics:
-            unit_topics[unit_id] = []
-        unit_topics[unit_id].append(topic)
-    
-    # Build the hierarchy
-    course_with_hierarchy = dict(course)
-    course_with_hierarchy["units"] = []
-    
-    for unit in units:
-        unit_dict = dict(unit)
-        unit_dict["topics"] = unit_topics.get(str(unit["_id"]), [])
-        course_with_hierarchy["units"].append(unit_dict)
-    
-    return transform_object_id(course_with_hierarchy)
+    return fast_json(transform_object_id(course_with_hierarchy))
+
+@router.post("/courses/{course_id_or_slug}/move", response_model=CourseOut)
+async def move_course(
+    course_id_or_slug: str,
+    move: NodeMove,
+    token_data: TokenData = Depends(admin_required)
+):
+    """Move a course (with everything below it) to another subject"""
+    return await move_node("course", course_id_or_slug, move)
 
 @router.put("/courses/{course_id_or_slug}", response_model=CourseOut)
 async def update_course(
@@ -657,9 +667,9 @@ async def update_course(
     
     # If subject_id is being changed, check if the new subject exists
     if course.subject_id and course.subject_id != course_obj["subject_id"]:
-        subject, subject_id = get_by_id_or_slug(subjects_collection, course.subject_id)
+        subject_id = NodeResolver.resolve_id(subjects_collection, course.subject_id)
         
-        if not subject:
+        if not subject_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Subject with ID or slug {course.subject_id} not found"
@@ -694,6 +704,8 @@ async def update_course(
     
     # Prepare update data, excluding None values
     update_data = {k: v for k, v in course.dict().items() if v is not None}
+    # A parent change is applied by reparent() below, like POST /courses/{id}/move
+    new_parent_id = update_data.pop("subject_id", course_obj["subject_id"])
     if update_data:
         update_data["updated_at"] = datetime.utcnow()
         
@@ -705,6 +717,11 @@ async def update_course(
     
     # Return the updated course
     updated_course = courses_collection.find_one({"_id": course_oid})
+    await CatalogService.upsert_node("course", updated_course)
+    HierarchyCache.node_changed("course", updated_course)
+    
+    if new_parent_id != course_obj["subject_id"]:
+        return await reparent("course", updated_course, new_parent_id)
     return transform_object_id(updated_course)
 
 @router.delete("/courses/{course_id_or_slug}", status_code=status.HTTP_204_NO_CONTENT)
@@ -720,26 +737,15 @@ async def delete_course(
             detail=f"Course with ID or slug {course_id_or_slug} not found"
         )
     
-    course_oid = course_obj["_id"]
-    
-    # Get all units for this course
-    units = units_collection.find({"course_id": course_id})
-    unit_ids = [str(unit["_id"]) for unit in units]
-    
-    # Delete everything in reverse order (topics → units → course)
-    topics_collection.delete_many({"unit_id": {"$in": unit_ids}})
-    units_collection.delete_many({"course_id": course_id})
-    courses_collection.delete_one({"_id": course_oid})
-    
-    return None
+    return await cascade_delete("course", course_id)
 
 # Unit endpoints
 @router.post("/units", response_model=UnitOut, status_code=status.HTTP_201_CREATED)
 async def create_unit(unit: UnitCreate, token_data: TokenData = Depends(admin_required)):
     # Check if course exists
-    course, course_id = get_by_id_or_slug(courses_collection, unit.course_id)
+    course_id = NodeResolver.resolve_id(courses_collection, unit.course_id)
     
-    if not course:
+    if not course_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Course with ID or slug {unit.course_id} not found"
@@ -759,6 +765,7 @@ async def create_unit(unit: UnitCreate, token_data: TokenData = Depends(admin_re
         )
     
     # Generate a unique slug if not provided
+    slug_generated = not unit.slug
     if not unit.slug:
         unit.slug = create_unique_slug(units_collection, unit.name)
     else:
@@ -777,28 +784,32 @@ async def create_unit(unit: UnitCreate, token_data: TokenData = Depends(admin_re
         "updated_at": now
     }
     
-    result = units_collection.insert_one(unit_data)
+    result = insert_with_unique_slug(units_collection, unit_data, regenerate=slug_generated)
     created_unit = units_collection.find_one({"_id": result.inserted_id})
+    await CatalogService.upsert_node("unit", created_unit)
+    HierarchyCache.node_changed("unit", created_unit)
     
     return transform_object_id(created_unit)
 
 @router.get("/units", response_model=List[UnitOut])
 async def get_all_units(
+    response: Response,
     course_id: Optional[str] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     token_data: TokenData = Depends(student_or_above_required)
 ):
     query = {}
     if course_id:
         # Check if it's an ObjectId or a slug
-        course, course_id_str = get_by_id_or_slug(courses_collection, course_id)
-        if course:
+        course_id_str = NodeResolver.resolve_id(courses_collection, course_id)
+        if course_id_str:
             query["course_id"] = course_id_str
         else:
             query["course_id"] = course_id  # Use as-is for consistent behavior
     
-    units = units_collection.find(query).skip(skip).limit(limit)
+    units = paginate_response(units_collection, query, response, limit, skip, cursor)
     return [transform_object_id(unit) for unit in units]
 
 @router.get("/units/{unit_id_or_slug}", response_model=UnitOut)
@@ -822,22 +833,24 @@ async def get_unit_with_topics(
     token_data: TokenData = Depends(student_or_above_required)
 ):
     """Get unit with its topics"""
-    unit, unit_id = get_by_id_or_slug(units_collection, unit_id_or_slug)
+    unit_with_topics = HierarchyCache.get_subtree("unit", unit_id_or_slug, TREE_NODE_FIELDS)
     
-    if not unit:
+    if not unit_with_topics:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Unit with ID or slug {unit_id_or_slug} not found"
         )
     
-    # Get all topics for this unit
-    topics = list(topics_collection.find({"unit_id": unit_id}))
-    
-    # Build the hierarchy
-    unit_with_topics = dict(unit)
-    unit_with_topics["topics"] = topics
-    
-    return transform_object_id(unit_with_topics)
+    return fast_json(transform_object_id(unit_with_topics))
+
+@router.post("/units/{unit_id_or_slug}/move", response_model=UnitOut)
+async def move_unit(
+    unit_id_or_slug: str,
+    move: NodeMove,
+    token_data: TokenData = Depends(admin_required)
+):
+    """Move a unit (with everything below it) to another course"""
+    return await move_node("unit", unit_id_or_slug, move)
 
 @router.put("/units/{unit_id_or_slug}", response_model=UnitOut)
 async def update_unit(
@@ -857,9 +870,9 @@ async def update_unit(
     
     # If course_id is being changed, check if the new course exists
     if unit.course_id and unit.course_id != unit_obj["course_id"]:
-        course, course_id = get_by_id_or_slug(courses_collection, unit.course_id)
+        course_id = NodeResolver.resolve_id(courses_collection, unit.course_id)
         
-        if not course:
+        if not course_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Course with ID or slug {unit.course_id} not found"
@@ -894,6 +907,8 @@ async def update_unit(
     
     # Prepare update data, excluding None values
     update_data = {k: v for k, v in unit.dict().items() if v is not None}
+    # A parent change is applied by reparent() below, like POST /units/{id}/move
+    new_parent_id = update_data.pop("course_id", unit_obj["course_id"])
     if update_data:
         update_data["updated_at"] = datetime.utcnow()
         
@@ -905,6 +920,11 @@ async def update_unit(
     
     # Return the updated unit
     updated_unit = units_collection.find_one({"_id": unit_oid})
+    await CatalogService.upsert_node("unit", updated_unit)
+    HierarchyCache.node_changed("unit", updated_unit)
+    
+    if new_parent_id != unit_obj["course_id"]:
+        return await reparent("unit", updated_unit, new_parent_id)
     return transform_object_id(updated_unit)
 
 @router.delete("/units/{unit_id_or_slug}", status_code=status.HTTP_204_NO_CONTENT)
@@ -920,23 +940,15 @@ async def delete_unit(
             detail=f"Unit with ID or slug {unit_id_or_slug} not found"
         )
     
-    unit_oid = unit_obj["_id"]
-    
-    # Delete all topics for this unit first
-    topics_collection.delete_many({"unit_id": unit_id})
-    
-    # Then delete the unit
-    units_collection.delete_one({"_id": unit_oid})
-    
-    return None
+    return await cascade_delete("unit", unit_id)
 
 # Topic endpoints
 @router.post("/topics", response_model=TopicOut, status_code=status.HTTP_201_CREATED)
 async def create_topic(topic: TopicCreate, token_data: TokenData = Depends(admin_required)):
     # Check if unit exists
-    unit, unit_id = get_by_id_or_slug(units_collection, topic.unit_id)
+    unit_id = NodeResolver.resolve_id(units_collection, topic.unit_id)
     
-    if not unit:
+    if not unit_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Unit with ID or slug {topic.unit_id} not found"
@@ -956,6 +968,7 @@ async def create_topic(topic: TopicCreate, token_data: TokenData = Depends(admin
         )
     
     # Generate a unique slug if not provided
+    slug_generated = not topic.slug
     if not topic.slug:
         topic.slug = create_unique_slug(topics_collection, topic.name)
     else:
@@ -969,33 +982,38 @@ async def create_topic(topic: TopicCreate, token_data: TokenData = Depends(admin
     now = datetime.utcnow()
     topic_data = {
         **topic.dict(),
+        **await AncestryService.get_lineage("unit", topic.unit_id),
         "created_by": token_data.user_id,
         "created_at": now,
         "updated_at": now
     }
     
-    result = topics_collection.insert_one(topic_data)
+    result = insert_with_unique_slug(topics_collection, topic_data, regenerate=slug_generated)
     created_topic = topics_collection.find_one({"_id": result.inserted_id})
+    await CatalogService.upsert_node("topic", created_topic)
+    HierarchyCache.node_changed("topic", created_topic)
     
     return transform_object_id(created_topic)
 
 @router.get("/topics", response_model=List[TopicOut])
 async def get_all_topics(
+    response: Response,
     unit_id: Optional[str] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     token_data: TokenData = Depends(student_or_above_required)
 ):
     query = {}
     if unit_id:
         # Check if it's an ObjectId or a slug
-        unit, unit_id_str = get_by_id_or_slug(units_collection, unit_id)
-        if unit:
+        unit_id_str = NodeResolver.resolve_id(units_collection, unit_id)
+        if unit_id_str:
             query["unit_id"] = unit_id_str
         else:
             query["unit_id"] = unit_id  # Use as-is for consistent behavior
     
-    topics = topics_collection.find(query).skip(skip).limit(limit)
+    topics = paginate_response(topics_collection, query, response, limit, skip, cursor)
     return [transform_object_id(topic) for topic in topics]
 
 @router.get("/topics/{topic_id_or_slug}", response_model=TopicOut)
@@ -1013,6 +1031,15 @@ async def get_topic(
     
     return transform_object_id(topic)
 
+@router.post("/topics/{topic_id_or_slug}/move", response_model=TopicOut)
+async def move_topic(
+    topic_id_or_slug: str,
+    move: NodeMove,
+    token_data: TokenData = Depends(admin_required)
+):
+    """Move a topic (with everything below it) to another unit"""
+    return await move_node("topic", topic_id_or_slug, move)
+
 @router.put("/topics/{topic_id_or_slug}", response_model=TopicOut)
 async def update_topic(
     topic_id_or_slug: str,
@@ -1031,9 +1058,9 @@ async def update_topic(
     
     # If unit_id is being changed, check if the new unit exists
     if topic.unit_id and topic.unit_id != topic_obj["unit_id"]:
-        unit, unit_id = get_by_id_or_slug(units_collection, topic.unit_id)
+        unit_id = NodeResolver.resolve_id(units_collection, topic.unit_id)
         
-        if not unit:
+        if not unit_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Unit with ID or slug {topic.unit_id} not found"
@@ -1068,6 +1095,8 @@ async def update_topic(
     
     # Prepare update data, excluding None values
     update_data = {k: v for k, v in topic.dict().items() if v is not None}
+    # A parent change is applied by reparent() below, like POST /topics/{id}/move
+    new_parent_id = update_data.pop("unit_id", topic_obj["unit_id"])
     if update_data:
         update_data["updated_at"] = datetime.utcnow()
         
@@ -1079,6 +1108,11 @@ async def update_topic(
     
     # Return the updated topic
     updated_topic = topics_collection.find_one({"_id": topic_oid})
+    await CatalogService.upsert_node("topic", updated_topic)
+    HierarchyCache.node_changed("topic", updated_topic)
+    
+    if new_parent_id != topic_obj["unit_id"]:
+        return await reparent("topic", updated_topic, new_parent_id)
     return transform_object_id(updated_topic)
 
 @router.delete("/topics/{topic_id_or_slug}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1086,7 +1120,7 @@ async def delete_topic(
     topic_id_or_slug: str,
     token_data: TokenData = Depends(admin_required)
 ):
-    topic_obj, _ = get_by_id_or_slug(topics_collection, topic_id_or_slug)
+    topic_obj, topic_id = get_by_id_or_slug(topics_collection, topic_id_or_slug)
     
     if not topic_obj:
         raise HTTPException(
@@ -1094,9 +1128,4 @@ async def delete_topic(
             detail=f"Topic with ID or slug {topic_id_or_slug} not found"
         )
     
-    topic_oid = topic_obj["_id"]
-    
-    # Delete the topic
-    topics_collection.delete_one({"_id": topic_oid})
-    
-    return None
\ No newline at end of file
+    return await cascade_delete("topic", topic_id)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Response
 from typing import List, Optional
 from datetime import datetime
 from bson import ObjectId
@@ -9,7 +9,9 @@ from app.models.question import (
     PromptTemplateCreate, PromptTemplateUpdate, PromptTemplateOut
 )
 from app.models.user import TokenData
+from app.utils.change_tracking import bump_version, PROMPTS_SCOPE
 from app.utils.db_utils import transform_object_id
+from app.utils.pagination import paginate_response
 
 router = APIRouter(tags=["Prompt Templates"])
 
@@ -52,17 +54,20 @@ async def create_prompt_template(prompt: PromptTemplateCreate, token_data: Token
     
     result = prompts_collection.insert_one(prompt_data)
     created_prompt = prompts_collection.find_one({"_id": result.inserted_id})
+    bump_version(PROMPTS_SCOPE)
     
     return transform_object_id(created_prompt)
 
 @router.get("/prompts", response_model=List[PromptTemplateOut])
 async def get_all_prompt_templates(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     token_data: TokenData = Depends(teacher_required)
 ):
     """Get all prompt templates"""
-    prompts = prompts_collection.find().skip(skip).limit(limit)
+    prompts = paginate_response(prompts_collection, {}, response, limit, skip, cursor)
     return [transform_object_id(prompt) for prompt in prompts]
 
 @router.get("/prompts/default", response_model=PromptTemplateOut)
@@ -137,6 +142,7 @@ async def update_prompt_template(
     
     # Return the updated prompt
     updated_prompt = prompts_collection.find_one({"_id": prompt_oid})
+    bump_version(PROMPTS_SCOPE)
     return transform_object_id(updated_prompt)
 
 @router.delete("/prompts/{prompt_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -164,6 +170,7 @@ async def delete_prompt_template(
     
     # Delete the prompt
     prompts_collection.delete_one({"_id": prompt_oid})
+    bump_version(PROMPTS_SCOPE)
     
     return None
 
@@ -197,4 +204,5 @@ async def set_default_prompt_template(
     
     # Return the updated prompt
     updated_prompt = prompts_collection.find_one({"_id": prompt_oid})
+    bump_version(PROMPTS_SCOPE)
     return transform_object_id(updated_prompt)
\ No newline at end of file
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Response
 from typing import List, Optional
 from datetime import datetime
 from bson import ObjectId
 
+from app.auth.admission import admission
 from app.auth.auth_bearer import admin_required, teacher_required, student_or_above_required
 from app.config.db import questions_collection, topics_collection
 from app.models.question import (
@@ -12,7 +13,15 @@ from app.models.question import (
 )
 from app.models.user import TokenData
 from app.services.ai_service import AIService
+from app.services.question_service import QuestionService
+from app.services.question_stats import QuestionStatsCache
+from app.utils.change_tracking import bump_version, QUESTIONS_SCOPE
 from app.utils.db_utils import transform_object_id
+from app.utils.hierarchy import ANCESTOR_FIELDS, ancestor_ids
+from app.utils.pagination import paginate_response
+from app.utils.projections import QUESTION_OUT_PROJECTION
+from app.utils.responses import fast_json
+from app.utils.search import build_search_fields
 
 router = APIRouter(tags=["Questions"])
 
@@ -45,7 +54,9 @@ async def create_question(question: QuestionCreate, token_data: TokenData = Depe
         "created_by": token_data.user_id,
         "created_at": now,
         "updated_at": now,
-        "ai_generated": False
+        "ai_generated": False,
+        **ancestor_ids(topic),
+        **build_search_fields(question.question_text, question.explanation)
     }
     
     # Handle ShortAnswer and LongAnswer question types
@@ -55,17 +66,20 @@ async def create_question(question: QuestionCreate, token_data: TokenData = Depe
     
     result = questions_collection.insert_one(question_data)
     created_question = questions_collection.find_one({"_id": result.inserted_id})
+    QuestionStatsCache.question_changed(None, created_question)
     
     return transform_object_id(created_question)
 
 @router.get("/questions", response_model=List[QuestionOut])
 async def get_all_questions(
+    response: Response,
     topic_id: Optional[str] = None,
     difficulty: Optional[str] = None,
     question_type: Optional[str] = None,
     ai_generated: Optional[bool] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     token_data: TokenData = Depends(student_or_above_required)
 ):
     """Get all questions with optional filtering"""
@@ -83,8 +97,34 @@ async def get_all_questions(
     if ai_generated is not None:
         query["ai_generated"] = ai_generated
     
-    questions = questions_collection.find(query).skip(skip).limit(limit)
-    return [transform_object_id(question) for question in questions]
+    questions = paginate_response(
+        questions_collection, query, response, limit, skip, cursor,
+        projection=QUESTION_OUT_PROJECTION
+    )
+    # The projection already matches QuestionOut, so skip re-validating up to 1000 documents
+    return fast_json([transform_object_id(question) for question in questions], response)
+
+@router.get("/questions/search")
+async def search_questions(
+    q: str = Query("", max_length=200),
+    topic_id: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    question_type: Optional[str] = None,
+    ai_generated: Optional[bool] = None,
+    prefix: bool = True,
+    limit: int = Query(20, ge=1, le=100),
+    token_data: TokenData = Depends(student_or_above_required)
+):
+    """Ranked search over question text and explanations"""
+    return await QuestionService.search_questions(
+        q,
+        topic_id=topic_id,
+        question_type=question_type,
+        difficulty=difficulty,
+        ai_generated=ai_generated,
+        limit=limit,
+        prefix=prefix
+    )
 
 @router.get("/questions/{question_id}", response_model=QuestionOut)
 async def get_question(
@@ -92,7 +132,7 @@ async def get_question(
     token_data: TokenData = Depends(student_or_above_required)
 ):
     """Get a specific question by ID"""
-    question = questions_collection.find_one({"_id": parse_object_id(question_id)})
+    question = questions_collection.find_one({"_id": parse_object_id(question_id)}, QUESTION_OUT_PROJECTION)
     if not question:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -129,22 +169,39 @@ async def update_question(
     # Prepare update data, excluding None values
     update_data = {k: v for k, v in question.dict().items() if v is not None}
     
+    # A question moved to another topic takes over that topic's ancestor ids;
+    # ids the new topic lacks are removed rather than left from the old one
+    unset_fields = {}
+    if question.topic_id and question.topic_id != existing_question["topic_id"]:
+        ancestors = ancestor_ids(topic)
+        update_data.update(ancestors)
+        unset_fields = {field: "" for field in ANCESTOR_FIELDS if field not in ancestors}
+    
     # Handle ShortAnswer and LongAnswer question types
     if update_data.get("question_type") in ["ShortAnswer", "LongAnswer"]:
         update_data["options"] = []
         update_data["correct_answer"] = None
     
+    # Keep the search index fields in sync with the text they are built from
+    if "question_text" in update_data or "explanation" in update_data:
+        update_data.update(build_search_fields(
+            update_data.get("question_text", existing_question.get("question_text")),
+            update_data.get("explanation", existing_question.get("explanation"))
+        ))
+    
     if update_data:
         update_data["updated_at"] = datetime.utcnow()
         
         # Update the question
-        questions_collection.update_one(
-            {"_id": question_oid},
-            {"$set": update_data}
-        )
+        update = {"$set": update_data}
+        if unset_fields:
+            update["$unset"] = unset_fields
+        questions_collection.update_one({"_id": question_oid}, update)
     
     # Return the updated question
     updated_question = questions_collection.find_one({"_id": question_oid})
+    if update_data:
+        QuestionStatsCache.question_changed(existing_question, updated_question)
     return transform_object_id(updated_question)
 
 @router.delete("/questions/{question_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -165,13 +222,14 @@ async def delete_question(
     
     # Delete the question
     questions_collection.delete_one({"_id": question_oid})
+    QuestionStatsCache.question_changed(existing_question, None)
     
     return None
 
 @router.post("/questions/ai/generate", response_model=List[QuestionOut])
 async def generate_questions(
     request: QuestionGenerationRequest,
-    token_data: TokenData = Depends(teacher_required),
+    token_data: TokenData = Depends(admission("ai", teacher_required)),
 ):
     """Generate questions using AI"""
     try:
@@ -233,6 +291,8 @@ async def generate_questions(
             saved_question = questions_collection.find_one({"_id": result.inserted_id})
             saved_questions.append(saved_question)
         
+        if saved_questions:
+            bump_version(QUESTIONS_SCOPE)
         return [transform_object_id(question) for question in saved_questions]
         
     except ValueError as e:
@@ -251,7 +311,7 @@ async def generate_questions(
 @router.post("/questions/ai/regenerate", response_model=QuestionOut)
 async def regenerate_question(
     request: QuestionRegenerationRequest,
-    token_data: TokenData = Depends(teacher_required)
+    token_data: TokenData = Depends(admission("ai", teacher_required))
 ):
     """Regenerate a specific question using AI"""
     try:
@@ -265,6 +325,7 @@ async def regenerate_question(
             {"_id": question_oid},
             {"$set": new_question}
         )
+        bump_version(QUESTIONS_SCOPE)
         
         # Return the updated question
         updated_question = questions_collection.find_one({"_id": question_oid})
@@ -308,6 +369,8 @@ async def batch_delete_questions(
     
     # Delete all questions in the list
     result = questions_collection.delete_many({"_id": {"$in": question_oids}})
+    if result.deleted_count:
+        bump_version(QUESTIONS_SCOPE)
     
     if result.deleted_count == 0:
         raise HTTPException(
@@ -1,15 +1,17 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from app.auth.admission import admission
 from app.auth.auth_bearer import student_or_above_required
 from app.models.user import TokenData
 from app.services.student_service import StudentService
+from app.utils.responses import fast_json
 
 router = APIRouter(tags=["Student"])
 
 @router.get("/student/dashboard")
-async def get_student_dashboard(token_data: TokenData = Depends(student_or_above_required)):
+async def get_student_dashboard(token_data: TokenData = Depends(admission("dashboard", student_or_above_required))):
     """Get student dashboard with available questions and recommended topics"""
     try:
         dashboard = await StudentService.get_student_dashboard(token_data.user_id)
@@ -26,10 +28,21 @@ async def get_student_dashboard(token_data: TokenData = Depends(student_or_above
         )
 
 @router.get("/student/question-sets")
-async def get_available_question_sets(token_data: TokenData = Depends(student_or_above_required)):
+async def get_available_question_sets(
+    request: Request,
+    response: Response,
+    token_data: TokenData = Depends(student_or_above_required)
+):
     """Get all available question sets grouped by curriculum structure"""
     try:
+        # The catalog only changes with the hierarchy or the questions, so clients can revalidate cheaply
+        etag = StudentService.question_sets_etag()
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        
         question_sets = await StudentService.get_available_question_sets()
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
         return question_sets
     except Exception as e:
         raise HTTPException(
@@ -45,7 +58,7 @@ async def get_topic_questions(
     """Get all questions for a specific topic"""
     try:
         questions = await StudentService.get_topic_questions(topic_id)
-        return questions
+        return fast_json(questions)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -63,7 +76,7 @@ async def generate_practice_quiz(
     question_count: int = Query(10, ge=1, le=50),
     difficulty: Optional[str] = None,
     question_types: Optional[List[str]] = None,
-    token_data: TokenData = Depends(student_or_above_required)
+    token_data: TokenData = Depends(admission("quiz", student_or_above_required))
 ):
     """Generate a practice quiz from specified topics"""
     try:
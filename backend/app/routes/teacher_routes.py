@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Depends, status, Query
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from app.auth.admission import admission
 from app.auth.auth_bearer import teacher_required
 from app.models.user import TokenData
 from app.services.teacher_service import TeacherService
@@ -9,7 +10,7 @@ from app.services.teacher_service import TeacherService
 router = APIRouter(tags=["Teacher"])
 
 @router.get("/teacher/dashboard")
-async def get_teacher_dashboard(token_data: TokenData = Depends(teacher_required)):
+async def get_teacher_dashboard(token_data: TokenData = Depends(admission("dashboard", teacher_required))):
     """Get teacher dashboard with statistics and recent activity"""
     try:
         dashboard = await TeacherService.get_teacher_dashboard(token_data.user_id)
@@ -28,7 +29,7 @@ async def get_teacher_dashboard(token_data: TokenData = Depends(teacher_required
 @router.get("/teacher/activity")
 async def get_teacher_activity(
     days: int = Query(30, ge=1, le=365),
-    token_data: TokenData = Depends(teacher_required)
+    token_data: TokenData = Depends(admission("dashboard", teacher_required))
 ):
     """Get detailed teacher activity over a period of time"""
     try:
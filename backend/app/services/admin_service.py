@@ -1,6 +1,5 @@
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
-from bson import ObjectId
 
 from app.config.db import (
     users_collection, curriculum_collection, subjects_collection, 
@@ -9,6 +8,8 @@ from app.config.db import (
 )
 from app.models.admin import AdminStats, AdminDashboard
 from app.models.user import UserRole
+from app.utils.projections import QUESTION_OUT_PROJECTION, USER_OUT_PROJECTION
+from app.services.user_profiles import UserProfileCache
 
 class AdminService:
     """Service for admin-specific business logic"""
@@ -35,22 +36,18 @@ class AdminService:
         questions_by_teachers = questions_collection.count_documents({"ai_generated": False})
         
         # Get recent users
-        recent_users = list(users_collection.find().sort("created_at", -1).limit(5))
+        recent_users = list(users_collection.find({}, USER_OUT_PROJECTION).sort("created_at", -1).limit(5))
         for user in recent_users:
             user["id"] = str(user.pop("_id"))
         
         # Get recent questions
-        recent_questions = list(questions_collection.find().sort("created_at", -1).limit(5))
+        recent_questions = list(questions_collection.find({}, QUESTION_OUT_PROJECTION).sort("created_at", -1).limit(5))
+        
+        # Resolve all authors from the profile cache (at most one query for the misses)
+        authors = UserProfileCache.get_many(question.get("created_by") for question in recent_questions)
         for question in recent_questions:
             question["id"] = str(question.pop("_id"))
-            question["created_by_user"] = users_collection.find_one({"_id": ObjectId(question["created_by"])})
-            if question["created_by_user"]:
-                question["created_by_user"] = {
-                    "id": str(question["created_by_user"]["_id"]),
-                    "full_name": question["created_by_user"]["full_name"],
-                    "email": question["created_by_user"]["email"],
-                    "role": question["created_by_user"]["role"]
-                }
+            question["created_by_user"] = authors.get(str(question.get("created_by")))
         
         # Build dashboard data
         stats = AdminStats(
@@ -1,6 +1,7 @@
 import os
 import json
 import hashlib
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -13,6 +14,8 @@ from app.models.question import (
     QuestionType, DifficultyLevel, QuestionGenerationRequest, 
     QuestionRegenerationRequest
 )
+from app.utils.metrics import record_llm_call
+from app.utils.search import build_search_fields
 from bson import ObjectId
 
 # Load OpenAI API key from environment
@@ -109,6 +112,10 @@ class AIService:
                     formatted_question = {
                         **q,
                         "topic_id": topic_id,
+                        "unit_id": str(unit["_id"]),
+                        "course_id": str(course["_id"]),
+                        "subject_id": str(subject["_id"]),
+                        "curriculum_id": str(curriculum["_id"]),
                         "difficulty": q.get("difficulty", request.difficulty),
                         "created_by": user_id,
                         "created_at": datetime.utcnow(),
@@ -116,7 +123,8 @@ class AIService:
                         "ai_generated": True,
                         "ai_model": "gpt4",  # Or whichever model you're using
                         "ai_prompt": prompt,
-                        "content_hash": content_hash
+                        "content_hash": content_hash,
+                        **build_search_fields(q.get("question_text"), q.get("explanation"))
                     }
                     
                     # Convert question_type to enum if it's not
@@ -229,7 +237,8 @@ class AIService:
                 "ai_generated": True,
                 "ai_model": "gpt-4",  # Or whichever model you're using
                 "ai_prompt": custom_prompt,
-                "content_hash": content_hash
+                "content_hash": content_hash,
+                **build_search_fields(new_question.get("question_text"), new_question.get("explanation"))
             })
             
             return new_question
@@ -283,6 +292,7 @@ class AIService:
                 # Try the new client style first
                 from openai import OpenAI
                 client = OpenAI(api_key=openai_api_key)
+                start = time.perf_counter()
                 response = client.chat.completions.create(
                     model="gpt-4o-mini",  # Or any other appropriate model
                     messages=[
@@ -292,9 +302,11 @@ class AIService:
                     temperature=0.7,
                     max_tokens=3000
                 )
+                AIService._record_usage(response, time.perf_counter() - start)
                 return response.choices[0].message.content
             except (ImportError, AttributeError):
                 # Fall back to the older style OpenAI API
+                start = time.perf_counter()
                 response = openai.ChatCompletion.create(
                     model="gpt-4o-mini",  # Or any other appropriate model
                     messages=[
@@ -304,10 +316,21 @@ class AIService:
                     temperature=0.7,
                     max_tokens=3000
                 )
+                AIService._record_usage(response, time.perf_counter() - start)
                 return response.choices[0].message['content']
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
     
+    @staticmethod
+    def _record_usage(response: Any, seconds: float) -> None:
+        """Report an OpenAI call's duration and token usage to the request metrics"""
+        usage = getattr(response, "usage", None)
+        record_llm_call(
+            seconds,
+            prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0) or 0
+        )
+    
     @staticmethod
     def _parse_questions(response: str) -> List[Dict[str, Any]]:
         """Parse the AI response into a list of question dictionaries"""
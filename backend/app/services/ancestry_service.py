@@ -0,0 +1,38 @@
+from typing import Dict
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.services.hierarchy_cache import HierarchyCache, COLLECTIONS
+from app.utils.hierarchy import PARENT_FIELD, PARENT_LEVEL
+
+class AncestryService:
+    """Resolves the ancestor ids a node carries (stored denormalized on topics and questions)"""
+
+    @staticmethod
+    async def get_lineage(node_type: str, node_id: str) -> Dict[str, str]:
+        """
+        Ids of a node and all of its ancestors, keyed by field name
+
+        A unit yields unit_id, course_id, subject_id and curriculum_id. Served
+        from the tree cache when it is enabled, otherwise by walking up the
+        parent links (at most one lookup per level).
+        """
+        tree = HierarchyCache.get_tree()
+        if tree and tree.types.get(node_id) == node_type:
+            return {f"{level}_id": str(doc["_id"]) for level, doc in tree.path(node_id).items()}
+
+        lineage = {}
+        current_type, current_id = node_type, node_id
+        while current_id:
+            lineage[f"{current_type}_id"] = current_id
+            parent_field = PARENT_FIELD.get(current_type)
+            if not parent_field:
+                break
+            try:
+                doc = COLLECTIONS[current_type].find_one({"_id": ObjectId(current_id)}, {parent_field: 1})
+            except InvalidId:
+                doc = None
+            if not doc:
+                break
+            current_type, current_id = PARENT_LEVEL[current_type], doc.get(parent_field)
+        return lineage
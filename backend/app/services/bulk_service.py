@@ -0,0 +1,278 @@
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Any, Iterable, Iterator, Tuple
+from bson import ObjectId
+from pydantic import ValidationError
+from pymongo import InsertOne, ReplaceOne
+from pymongo.errors import BulkWriteError
+
+from app.config.db import questions_collection, curriculum_catalog_collection
+from app.models.question import QuestionCreate, QuestionType
+from app.services.catalog_service import build_catalog_entry
+from app.services.hierarchy_cache import HierarchyCache, COLLECTIONS
+from app.utils.change_tracking import bump_version, QUESTIONS_SCOPE
+from app.utils.curriculum_io import QUESTION_FIELDS, chunked, validate_record
+from app.utils.helpers import allocate_unique_slugs
+from app.utils.hierarchy import LEVELS, PARENT_FIELD, COLLECTION_NAMES
+from app.utils.search import build_search_fields
+
+logger = logging.getLogger(__name__)
+
+# Records parsed, resolved and written per round trip
+IMPORT_CHUNK_SIZE = 5000
+
+# Error messages kept in the import summary (the total is always counted)
+MAX_REPORTED_ERRORS = 100
+
+# Ids per $in query when walking the hierarchy for export
+EXPORT_ID_BATCH = 1000
+
+Path = Tuple[str, ...]
+
+def _lineage(path: Path, ids: Dict[Path, str]) -> Dict[str, str]:
+    """Ancestor ids of the node at ``path`` (curriculum_id ... unit_id as applicable)"""
+    return {f"{LEVELS[depth]}_id": ids[path[:depth + 1]] for depth in range(len(path) - 1)}
+
+class BulkCurriculumService:
+    """Streaming bulk import and export of whole curricula"""
+
+    @staticmethod
+    async def import_records(records: Iterable[Dict[str, Any]], user_id: str) -> Dict[str, Any]:
+        """
+        Import a stream of hierarchy and question records
+
+        Records are consumed in chunks, so memory is bounded by the chunk size
+        plus the name-path -> id map of hierarchy nodes. Parents must appear
+        before their children (as in the export format). Nodes that already
+        exist under the same parent with the same name are reused, so an
+        import can extend an existing curriculum. Within a chunk each level
+        is written with one ordered bulk_write, its slugs allocated in batch.
+
+        Args:
+            records: Parsed records (see app.utils.curriculum_io)
+            user_id: Recorded as created_by
+
+        Returns:
+            Summary with created/existing counts per type, errors and run time
+
+        Raises:
+            ValueError: If a bulk write fails (e.g. an explicit slug is taken)
+        """
+        start = time.perf_counter()
+        ids: Dict[Path, str] = {}
+        summary = {
+            "created": {record_type: 0 for record_type in LEVELS + ["question"]},
+            "existing": {level: 0 for level in LEVELS},
+            "error_count": 0,
+            "errors": []
+        }
+
+        def report(record: Dict[str, Any], message: str) -> None:
+            summary["error_count"] += 1
+            if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+                summary["errors"].append(f"Line {record.get('line', '?')}: {message}")
+
+        try:
+            for chunk in chunked(records, IMPORT_CHUNK_SIZE):
+                by_type = defaultdict(list)
+                for record in chunk:
+                    try:
+                        validate_record(record)
+                    except ValueError as e:
+                        report(record, str(e))
+                        continue
+                    by_type[record["type"]].append(record)
+
+                for level in LEVELS:
+                    if by_type[level]:
+                        BulkCurriculumService._import_level(level, by_type[level], ids, user_id, summary, report)
+                if by_type["question"]:
+                    BulkCurriculumService._import_questions(by_type["question"], ids, user_id, summary, report)
+        finally:
+            if any(summary["created"][level] for level in LEVELS):
+                HierarchyCache.invalidate()
+
+        summary["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(f"Curriculum import: {summary['created']} created, {summary['error_count']} errors in {summary['duration_ms']}ms")
+        return summary
+
+    @staticmethod
+    def _import_level(level, records, ids, user_id, summary, report) -> None:
+        collection = COLLECTIONS[level]
+        parent_field = PARENT_FIELD.get(level)
+
+        # Resolve parents from the in-memory map
+        pending = {}
+        for record in records:
+            path = tuple(record["path"])
+            if path in ids or path in pending:
+                summary["existing"][level] += 1
+                continue
+            if parent_field and path[:-1] not in ids:
+                report(record, f"parent of {level} '{path[-1]}' not found (parents must come first)")
+                continue
+            pending[path] = record
+        if not pending:
+            return
+
+        # Reuse nodes that already exist under the same parent (one query per chunk)
+        query = {"name": {"$in": list({path[-1] for path in pending})}}
+        if parent_field:
+            query[parent_field] = {"$in": list({ids[path[:-1]] for path in pending})}
+        existing = {
+            (doc.get(parent_field) if parent_field else None, doc["name"]): str(doc["_id"])
+            for doc in collection.find(query, {"name": 1, parent_field or "_id": 1})
+        }
+        new_paths = []
+        for path in pending:
+            key = (ids[path[:-1]] if parent_field else None, path[-1])
+            if key in existing:
+                ids[path] = existing[key]
+                summary["existing"][level] += 1
+            else:
+                new_paths.append(path)
+        if not new_paths:
+            return
+
+        # Slugs for every node without an explicit one, in one batch
+        explicit = {pending[path]["slug"] for path in new_paths if pending[path].get("slug")}
+        unslugged = [path for path in new_paths if not pending[path].get("slug")]
+        slugs = dict(zip(unslugged, allocate_unique_slugs(collection, [path[-1] for path in unslugged], explicit)))
+
+        now = datetime.utcnow()
+        docs = []
+        for path in new_paths:
+            record = pending[path]
+            doc = {
+                "_id": ObjectId(),
+                "name": path[-1],
+                "description": record.get("description"),
+                "slug": record.get("slug") or slugs[path],
+                "created_by": user_id,
+                "created_at": now,
+                "updated_at": now
+            }
+            if parent_field:
+                doc[parent_field] = ids[path[:-1]]
+            if level == "topic":
+                doc.update(_lineage(path, ids))
+            docs.append(doc)
+
+        try:
+            collection.bulk_write([InsertOne(doc) for doc in docs], ordered=True)
+        except BulkWriteError as e:
+            raise ValueError(f"Importing {COLLECTION_NAMES[level]} failed: {e.details['writeErrors'][0]['errmsg']}")
+
+        catalog_ops = []
+        for path, doc in zip(new_paths, docs):
+            ids[path] = str(doc["_id"])
+            catalog_ops.append(ReplaceOne(
+                {"_id": doc["_id"]},
+                build_catalog_entry(level, doc, _lineage(path, ids)),
+                upsert=True
+            ))
+        curriculum_catalog_collection.bulk_write(catalog_ops, ordered=False)
+        summary["created"][level] += len(docs)
+
+    @staticmethod
+    def _import_questions(records, ids, user_id, summary, report) -> None:
+        now = datetime.utcnow()
+        docs = []
+        for record in records:
+            path = tuple(record["path"])
+            topic_id = ids.get(path)
+            if not topic_id:
+                report(record, f"topic '{path[-1]}' not found (topics must come before their questions)")
+                continue
+            try:
+                question = QuestionCreate(
+                    topic_id=topic_id,
+                    **{field: record[field] for field in QUESTION_FIELDS if field in record}
+                )
+            except ValidationError as e:
+                report(record, f"invalid question ({e.errors()[0]['loc'][0]}: {e.errors()[0]['msg']})")
+                continue
+
+            doc = {
+                **question.dict(),
+                **_lineage(path, ids),
+                "created_by": user_id,
+                "created_at": now,
+                "updated_at": now,
+                "ai_generated": False,
+                **build_search_fields(question.question_text, question.explanation)
+            }
+            if question.question_type in [QuestionType.SHORT_ANSWER, QuestionType.LONG_ANSWER]:
+                doc["options"] = []
+                doc["correct_answer"] = None
+            docs.append(InsertOne(doc))
+
+        if docs:
+            try:
+                questions_collection.bulk_write(docs, ordered=True)
+            except BulkWriteError as e:
+                raise ValueError(f"Importing questions failed: {e.details['writeErrors'][0]['errmsg']}")
+            bump_version(QUESTIONS_SCOPE)
+            summary["created"]["question"] += len(docs)
+
+    @staticmethod
+    def export_records(curriculum: Dict[str, Any], include_questions: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a curriculum as import records, parents before children
+
+        Levels are read one after another with batched ``$in`` queries and
+        questions with a single cursor over the curriculum_id index, so only
+        the id -> path map of hierarchy nodes is held in memory.
+
+        Args:
+            curriculum: The curriculum document
+            include_questions: Also export the curriculum's questions
+
+        Returns:
+            Iterator of records in the format read by import_records()
+        """
+        def node_record(level: str, doc: Dict[str, Any], path: Path) -> Dict[str, Any]:
+            record = {"type": level, "path": list(path), "slug": doc.get("slug")}
+            if doc.get("description"):
+                record["description"] = doc["description"]
+            return record
+
+        curriculum_path = (curriculum["name"],)
+        paths = {str(curriculum["_id"]): curriculum_path}
+        yield node_record("curriculum", curriculum, curriculum_path)
+
+        parent_ids = [str(curriculum["_id"])]
+        for level in LEVELS[1:]:
+            parent_field = PARENT_FIELD[level]
+            level_ids = []
+            for start in range(0, len(parent_ids), EXPORT_ID_BATCH):
+                batch = parent_ids[start:start + EXPORT_ID_BATCH]
+                cursor = COLLECTIONS[level].find(
+                    {parent_field: {"$in": batch}},
+                    {"name": 1, "slug": 1, "description": 1, parent_field: 1}
+                ).sort("_id", 1)
+                for doc in cursor:
+                    path = paths[doc[parent_field]] + (doc["name"],)
+                    node_id = str(doc["_id"])
+                    level_ids.append(node_id)
+                    paths[node_id] = path
+                    yield node_record(level, doc, path)
+            parent_ids = level_ids
+
+        if not include_questions:
+            return
+
+        projection = {field: 1 for field in QUESTION_FIELDS}
+        projection["topic_id"] = 1
+        cursor = questions_collection.find({"curriculum_id": str(curriculum["_id"])}, projection)
+        for question in cursor:
+            path = paths.get(question["topic_id"])
+            if not path:
+                continue
+            record = {"type": "question", "path": list(path)}
+            for field in QUESTION_FIELDS:
+                if question.get(field) is not None:
+                    record[field] = question[field]
+            yield record
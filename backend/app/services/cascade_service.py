@@ -0,0 +1,240 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+from bson import ObjectId
+
+from app.config.db import (
+    client, curriculum_collection, subjects_collection, courses_collection,
+    units_collection, topics_collection, questions_collection,
+    curriculum_catalog_collection, jobs_collection
+)
+from app.services.hierarchy_cache import HierarchyCache
+from app.utils.change_tracking import bump_version, QUESTIONS_SCOPE
+from app.utils.hierarchy import LEVELS, PARENT_FIELD
+
+logger = logging.getLogger(__name__)
+
+# Subtrees with more topics + questions than this are deleted by a background job
+CASCADE_SYNC_LIMIT = int(os.getenv("CASCADE_SYNC_LIMIT", "10000"))
+
+# Documents removed per batch by background jobs
+CASCADE_BATCH_SIZE = 1000
+
+# A running job whose worker has not reported progress for this long may be taken over
+JOB_LEASE = timedelta(seconds=60)
+
+COLLECTIONS = {
+    "curriculum": curriculum_collection,
+    "subject": subjects_collection,
+    "course": courses_collection,
+    "unit": units_collection,
+    "topic": topics_collection,
+    "question": questions_collection
+}
+
+# Levels whose documents store every ancestor id (so any ancestor is an equality filter)
+MATERIALIZED_LEVELS = {"topic", "question"}
+
+def _supports_transactions() -> bool:
+    """Multi-document transactions need a replica set or sharded cluster"""
+    return client.topology_description.topology_type_name in (
+        "ReplicaSetWithPrimary", "Sharded", "LoadBalanced"
+    )
+
+class CascadeDeleteService:
+    """Deletes a hierarchy node with everything below it, questions included"""
+
+    @staticmethod
+    def plan(node_type: str, node_id: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        (level, filter) pairs covering the subtree, bottom-up
+
+        Deleting children before parents means an interrupted run never leaves
+        orphans behind, and re-running the plan simply finishes the job.
+        Documents are found by walking the parent ids down from the node, so
+        data the ancestor-id backfill has not reached is still covered; the
+        ids the catalog records for the subtree and the materialized ancestor
+        ids of topics and questions are matched as well.
+        """
+        field = f"{node_type}_id"
+        below = LEVELS[LEVELS.index(node_type) + 1:] + ["question"]
+
+        steps = []
+        parent_ids = [node_id]
+        for level in below:
+            parent_field = PARENT_FIELD.get(level, "topic_id")
+            if level in MATERIALIZED_LEVELS:
+                query = {field: node_id}
+                if parent_field != field:
+                    query = {"$or": [query, {parent_field: {"$in": parent_ids}}]}
+                if level == "question":
+                    steps.append((level, query))
+                    break
+                ids = [doc["_id"] for doc in COLLECTIONS[level].find(query, {"_id": 1})]
+            else:
+                ids = {doc["_id"] for doc in COLLECTIONS[level].find(
+                    {parent_field: {"$in": parent_ids}}, {"_id": 1}
+                )}
+                if parent_field != field:
+                    ids.update(entry["_id"] for entry in curriculum_catalog_collection.find(
+                        {"type": level, field: node_id}, {"_id": 1}
+                    ))
+                ids = list(ids)
+                query = {"_id": {"$in": ids}}
+            steps.append((level, query))
+            parent_ids = [str(id_value) for id_value in ids]
+
+        steps.reverse()
+        steps.append((node_type, {"_id": ObjectId(node_id)}))
+        return steps
+
+    @staticmethod
+    def estimate_size(node_type: str, node_id: str) -> int:
+        """Topics + questions in the subtree (two indexed counts)"""
+        field = f"{node_type}_id"
+        size = questions_collection.count_documents({field: node_id})
+        if node_type != "topic":
+            size += topics_collection.count_documents({field: node_id})
+        return size
+
+    @staticmethod
+    async def delete(node_type: str, node_id: str) -> Dict[str, Any]:
+        """
+        Delete a node's subtree, synchronously when small or as a background job
+
+        Args:
+            node_type: Level of the node
+            node_id: Node id
+
+        Returns:
+            The job document: status "done" with per-level counts and run time,
+            or status "pending" when handed to a background job
+        """
+        job = {
+            "type": "cascade_delete",
+            "node_type": node_type,
+            "node_id": node_id,
+            "status": "pending",
+            "deleted": {},
+            "created_at": datetime.utcnow()
+        }
+
+        if CascadeDeleteService.estimate_size(node_type, node_id) > CASCADE_SYNC_LIMIT:
+            job["_id"] = jobs_collection.insert_one(job).inserted_id
+            CascadeDeleteService.start_job(job["_id"])
+            return job
+
+        start = time.perf_counter()
+        steps = CascadeDeleteService.plan(node_type, node_id)
+        transactional = _supports_transactions()
+
+        if transactional:
+            with client.start_session() as session:
+                deleted = session.with_transaction(
+                    lambda s: CascadeDeleteService._delete_all(steps, node_type, node_id, s)
+                )
+        else:
+            deleted = CascadeDeleteService._delete_all(steps, node_type, node_id)
+
+        HierarchyCache.node_removed(node_id)
+        bump_version(QUESTIONS_SCOPE)
+        job.update({
+            "status": "done",
+            "deleted": deleted,
+            "transactional": transactional,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+            "finished_at": datetime.utcnow()
+        })
+        job["_id"] = jobs_collection.insert_one(job).inserted_id
+        logger.info(
+            f"Cascade delete of {node_type} {node_id}: {deleted} "
+            f"in {job['duration_ms']}ms (transactional={transactional})"
+        )
+        return job
+
+    @staticmethod
+    def _delete_all(steps, node_type: str, node_id: str, session=None) -> Dict[str, int]:
+        deleted = {}
+        for level, query in steps:
+            deleted[level] = COLLECTIONS[level].delete_many(query, session=session).deleted_count
+        CascadeDeleteService._delete_catalog(node_type, node_id, session)
+        return deleted
+
+    @staticmethod
+    def _delete_catalog(node_type: str, node_id: str, session=None) -> None:
+        query = {"$or": [{"_id": ObjectId(node_id)}, {f"{node_type}_id": node_id}]}
+        curriculum_catalog_collection.delete_many(query, session=session)
+
+    @staticmethod
+    def start_job(job_id: ObjectId) -> None:
+        """Run a cascade-delete job on a background thread"""
+        threading.Thread(target=CascadeDeleteService.run_job, args=(job_id,), daemon=True).start()
+
+    @staticmethod
+    def run_job(job_id: ObjectId) -> None:
+        """
+        Execute (or resume) a cascade-delete job in batches
+
+        Progress is recorded on the job document after every batch. Because
+        the plan is bottom-up and idempotent, a job interrupted by a restart
+        is resumed by running it again from the top.
+        """
+        now = datetime.utcnow()
+        job = jobs_collection.find_one_and_update(
+            {"_id": job_id, "$or": [
+                {"status": "pending"},
+                {"status": "running", "heartbeat_at": {"$lt": now - JOB_LEASE}}
+            ]},
+            {"$set": {"status": "running", "started_at": now, "heartbeat_at": now}}
+        )
+        if not job:
+            # Already finished, or another worker holds the lease
+            return
+
+        node_type, node_id = job["node_type"], job["node_id"]
+        start = time.perf_counter()
+        try:
+            for level, query in CascadeDeleteService.plan(node_type, node_id):
+                collection = COLLECTIONS[level]
+                while True:
+                    ids = [doc["_id"] for doc in collection.find(query, {"_id": 1}).limit(CASCADE_BATCH_SIZE)]
+                    if not ids:
+                        break
+                    count = collection.delete_many({"_id": {"$in": ids}}).deleted_count
+                    jobs_collection.update_one(
+                        {"_id": job_id},
+                        {"$inc": {f"deleted.{level}": count}, "$set": {"heartbeat_at": datetime.utcnow()}}
+                    )
+
+            CascadeDeleteService._delete_catalog(node_type, node_id)
+            HierarchyCache.node_removed(node_id)
+            bump_version(QUESTIONS_SCOPE)
+        except Exception as e:
+            logger.error(f"Cascade delete job {job_id} failed: {e}")
+            jobs_collection.update_one({"_id": job_id}, {"$set": {"status": "failed", "error": str(e)}})
+            return
+
+        duration_ms = round((time.perf_counter() - start) * 1000, 1)
+        job = jobs_collection.find_one_and_update(
+            {"_id": job_id},
+            {"$set": {"status": "done", "duration_ms": duration_ms, "finished_at": datetime.utcnow()}}
+        )
+        logger.info(f"Cascade delete job {job_id} for {node_type} {node_id}: {job.get('deleted')} in {duration_ms}ms")
+
+    @staticmethod
+    def resume_jobs() -> int:
+        """Restart cascade-delete jobs left unfinished by a previous process"""
+        job_ids = [job["_id"] for job in jobs_collection.find(
+            {"type": "cascade_delete", "status": {"$in": ["pending", "running"]}}, {"_id": 1}
+        )]
+        for job_id in job_ids:
+            CascadeDeleteService.start_job(job_id)
+        return len(job_ids)
+
+    @staticmethod
+    async def get_job(job_oid: ObjectId) -> Optional[Dict[str, Any]]:
+        """Get a job document by id"""
+        return jobs_collection.find_one({"_id": job_oid})
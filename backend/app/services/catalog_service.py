@@ -0,0 +1,168 @@
+import re
+from typing import Dict, List, Any, Optional
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from app.config.db import curriculum_catalog_collection
+from app.utils.hierarchy import LEVELS, PARENT_FIELD, ANCESTOR_FIELDS, ancestor_ids
+from app.utils.search import normalize_name, name_terms
+
+# Keys of the grouped search result, per level
+RESULT_KEYS = {
+    "curriculum": "curricula",
+    "subject": "subjects",
+    "course": "courses",
+    "unit": "units",
+    "topic": "topics"
+}
+
+def build_catalog_entry(node_type: str, doc: Dict[str, Any], ancestors: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Build the catalog document for a hierarchy node
+
+    Args:
+        node_type: One of LEVELS
+        doc: The node as stored in its own collection
+        ancestors: Ancestor ids of the node (curriculum_id ... unit_id, as applicable)
+
+    Returns:
+        Catalog document keyed by the node's own _id
+    """
+    return {
+        "_id": doc["_id"],
+        "type": node_type,
+        "level": LEVELS.index(node_type),
+        "name": doc["name"],
+        "name_normalized": normalize_name(doc["name"]),
+        "name_terms": name_terms(doc["name"]),
+        "slug": doc.get("slug"),
+        "description": doc.get("description", ""),
+        **ancestors
+    }
+
+class CatalogService:
+    """Denormalized, indexed search catalog of all curriculum hierarchy nodes"""
+
+    @staticmethod
+    async def get_ancestors(node_type: str, doc: Dict[str, Any]) -> Dict[str, str]:
+        """Resolve a node's ancestor ids from its parent's catalog entry (one indexed lookup)"""
+        parent_field = PARENT_FIELD.get(node_type)
+        if not parent_field:
+            return {}
+
+        parent_id = doc[parent_field]
+        ancestors = {}
+        try:
+            parent = curriculum_catalog_collection.find_one(
+                {"_id": ObjectId(parent_id)},
+                {field: 1 for field in ANCESTOR_FIELDS}
+            )
+        except Exception:
+            parent = None
+        if parent:
+            ancestors = ancestor_ids(parent)
+        ancestors[parent_field] = parent_id
+        return ancestors
+
+    @staticmethod
+    async def upsert_node(node_type: str, doc: Dict[str, Any]) -> None:
+        """
+        Insert or refresh a node's catalog entry after a create or update
+
+        If the node moved to another parent, the ancestor ids of every
+        descendant entry are rewritten in the same pass.
+        """
+        ancestors = await CatalogService.get_ancestors(node_type, doc)
+        entry = build_catalog_entry(node_type, doc, ancestors)
+
+        previous = curriculum_catalog_collection.find_one_and_replace(
+            {"_id": doc["_id"]},
+            entry,
+            upsert=True,
+            return_document=ReturnDocument.BEFORE
+        )
+
+        if node_type == "topic" or not previous:
+            return
+
+        moved = any(previous.get(field) != entry.get(field) for field in ANCESTOR_FIELDS)
+        if moved:
+            # Descendants share this node's ancestors above it; levels below stay as they are
+            inherited = ancestor_ids(entry)
+            curriculum_catalog_collection.update_many(
+                {f"{node_type}_id": str(doc["_id"])},
+                {"$set": inherited}
+            )
+
+    @staticmethod
+    async def search(
+        query: str,
+        limit: int = 20,
+        curriculum_id: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search every hierarchy level with one indexed query
+
+        All query words must match a word of the node name, the last one as a
+        prefix so the search works as you type. Matches are ranked exact name >
+        name prefix > word match, then by level (curricula first) and name.
+
+        Args:
+            query: Search text
+            limit: Maximum results per level
+            curriculum_id: Restrict results to one curriculum
+
+        Returns:
+            Matches grouped by level
+        """
+        results = {key: [] for key in RESULT_KEYS.values()}
+
+        terms = name_terms(query)
+        if not terms:
+            return results
+
+        normalized = normalize_name(query)
+        conditions = [{"name_terms": term} for term in terms[:-1]]
+        conditions.append({"name_terms": {"$regex": "^" + re.escape(terms[-1])}})
+
+        match = {"$and": conditions}
+        if curriculum_id:
+            match["$or"] = [{"curriculum_id": curriculum_id}, {"_id": ObjectId(curriculum_id)}] \
+                if ObjectId.is_valid(curriculum_id) else [{"curriculum_id": curriculum_id}]
+
+        pipeline = [
+            {"$match": match},
+            {"$addFields": {"score": {"$switch": {
+                "branches": [
+                    {"case": {"$eq": ["$name_normalized", normalized]}, "then": 3},
+                    {"case": {"$eq": [{"$indexOfCP": ["$name_normalized", normalized]}, 0]}, "then": 2}
+                ],
+                "default": 1
+            }}}},
+            {"$sort": {"score": -1, "level": 1, "name_normalized": 1}},
+            # Limit each level on its own, so many matches at one level
+            # (e.g. topics) cannot crowd out the others
+            {"$facet": {
+                RESULT_KEYS[level]: [{"$match": {"type": level}}, {"$limit": limit}]
+                for level in LEVELS
+            }}
+        ]
+
+        grouped = next(curriculum_catalog_collection.aggregate(pipeline), {})
+        for key, entries in grouped.items():
+            bucket = results[key]
+            for entry in entries:
+                item = {
+                    "id": str(entry["_id"]),
+                    "name": entry["name"],
+                    "type": entry["type"],
+                    "slug": entry.get("slug"),
+                    "description": entry.get("description", ""),
+                    "score": entry["score"]
+                }
+                for field in ANCESTOR_FIELDS:
+                    if entry.get(field):
+                        item[field] = entry[field]
+                bucket.append(item)
+
+        return results
@@ -4,8 +4,11 @@ from datetime import datetime
 
 from app.config.db import (
     curriculum_collection, subjects_collection, courses_collection, 
-    units_collection, topics_collection, questions_collection
+    units_collection, topics_collection, questions_collection,
+    curriculum_catalog_collection
 )
+from app.services.catalog_service import CatalogService
+from app.services.hierarchy_cache import HierarchyCache
 
 class CurriculumService:
     """Service for curriculum-related business logic"""
@@ -20,52 +23,50 @@ class CurriculumService:
         if not curriculum:
             raise ValueError(f"Curriculum with ID {curriculum_id} not found")
             
-        # Get counts for each level
-        subjects_count = subjects_collection.count_documents({"curriculum_id": curriculum_id})
-        
-        # Get subject IDs for this curriculum
-        subject_ids = [str(subject["_id"]) for subject in subjects_collection.find({"curriculum_id": curriculum_id})]
-        
-        # Get course count for these subjects
-        courses_count = courses_collection.count_documents({"subject_id": {"$in": subject_ids}})
-        
-        # Get course IDs
-        course_ids = [str(course["_id"]) for course in courses_collection.find({"subject_id": {"$in": subject_ids}})]
-        
-        # Get unit count for these courses
-        units_count = units_collection.count_documents({"course_id": {"$in": course_ids}})
-        
-        # Get unit IDs
-        unit_ids = [str(unit["_id"]) for unit in units_collection.find({"course_id": {"$in": course_ids}})]
-        
-        # Get topic count for these units
-        topics_count = topics_collection.count_documents({"unit_id": {"$in": unit_ids}})
-        
-        # Get topic IDs
-        topic_ids = [str(topic["_id"]) for topic in topics_collection.find({"unit_id": {"$in": unit_ids}})]
-        
-        # Get question count for these topics
-        questions_count = questions_collection.count_documents({"topic_id": {"$in": topic_ids}})
+        # Node counts per level from the catalog, which carries every node's ancestor ids
+        level_counts = {
+            entry["_id"]: entry["count"]
+            for entry in curriculum_catalog_collection.aggregate([
+                {"$match": {"curriculum_id": curriculum_id}},
+                {"$group": {"_id": "$type", "count": {"$sum": 1}}}
+            ])
+        }
+        subjects_count = level_counts.get("subject", 0)
+        courses_count = level_counts.get("course", 0)
+        units_count = level_counts.get("unit", 0)
+        topics_count = level_counts.get("topic", 0)
+        
+        # Question counts and distributions in one pass over the curriculum_id index
+        facets = next(questions_collection.aggregate([
+            {"$match": {"curriculum_id": curriculum_id}},
+            {"$facet": {
+                "total": [{"$count": "count"}],
+                "by_type": [{"$group": {"_id": "$question_type", "count": {"$sum": 1}}}],
+                "by_difficulty": [{"$group": {"_id": "$difficulty", "count": {"$sum": 1}}}],
+                "by_source": [{"$group": {"_id": "$ai_generated", "count": {"$sum": 1}}}]
+            }}
+        ]))
+        by_type = {entry["_id"]: entry["count"] for entry in facets["by_type"]}
+        by_difficulty = {entry["_id"]: entry["count"] for entry in facets["by_difficulty"]}
+        by_source = {entry["_id"]: entry["count"] for entry in facets["by_source"]}
+        
+        questions_count = facets["total"][0]["count"] if facets["total"] else 0
         
         # Question distribution by type
         question_type_distribution = {
-            "MCQ": questions_collection.count_documents({"topic_id": {"$in": topic_ids}, "question_type": "MCQ"}),
-            "MultipleAnswer": questions_collection.count_documents({"topic_id": {"$in": topic_ids}, "question_type": "MultipleAnswer"}),
-            "True/False": questions_collection.count_documents({"topic_id": {"$in": topic_ids}, "question_type": "True/False"}),
-            "Fill-in-the-blank": questions_collection.count_documents({"topic_id": {"$in": topic_ids}, "question_type": "Fill-in-the-blank"})
+            question_type: by_type.get(question_type, 0)
+            for question_type in ["MCQ", "MultipleAnswer", "True/False", "Fill-in-the-blank"]
         }
         
         # Question distribution by difficulty
         difficulty_distribution = {
-            "Easy": questions_collection.count_documents({"topic_id": {"$in": topic_ids}, "difficulty": "Easy"}),
-            "Medium": questions_collection.count_documents({"topic_id": {"$in": topic_ids}, "difficulty": "Medium"}),
-            "Hard": questions_collection.count_documents({"topic_id": {"$in": topic_ids}, "difficulty": "Hard"}),
-            "Mixed": questions_collection.count_documents({"topic_id": {"$in": topic_ids}, "difficulty": "Mixed"})
+            difficulty: by_difficulty.get(difficulty, 0)
+            for difficulty in ["Easy", "Medium", "Hard", "Mixed"]
         }
         
         # AI vs manual questions
-        ai_generated = questions_collection.count_documents({"topic_id": {"$in": topic_ids}, "ai_generated": True})
-        manually_created = questions_collection.count_documents({"topic_id": {"$in": topic_ids}, "ai_generated": False})
+        ai_generated = by_source.get(True, 0)
+        manually_created = by_source.get(False, 0)
         
         return {
             "curriculum_id": curriculum_id,
@@ -89,6 +90,16 @@ class CurriculumService:
     async def find_topic_path(topic_id: str) -> Dict[str, Any]:
         """Find the full path from curriculum to the specified topic"""
         
+        tree = HierarchyCache.get_tree()
+        if tree:
+            if tree.types.get(topic_id) != "topic":
+                raise ValueError(f"Topic with ID {topic_id} not found")
+            path = tree.path(topic_id)
+            return {
+                node_type: {"id": str(node["_id"]), "name": node["name"]}
+                for node_type, node in path.items()
+            }
+        
         # Check if topic exists
         topic_oid = ObjectId(topic_id)
         topic = topics_collection.find_one({"_id": topic_oid})
@@ -145,94 +156,5 @@ class CurriculumService:
         limit: int = 20, 
         curriculum_id: Optional[str] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
-        """Search across curriculum items (subjects, courses, units, topics)"""
-        
-        # Create regex pattern
-        pattern = {"$regex": query, "$options": "i"}  # Case-insensitive regex
-        
-        # Base filter to use for all queries
-        base_filter = {}
-        if curriculum_id:
-            base_filter["curriculum_id"] = curriculum_id
-        
-        # Search subjects
-        subject_filter = {**base_filter, "name": pattern}
-        subjects = list(subjects_collection.find(subject_filter).limit(limit))
-        subject_results = []
-        for subject in subjects:
-            subject_results.append({
-                "id": str(subject["_id"]),
-                "name": subject["name"],
-                "type": "subject",
-                "curriculum_id": subject["curriculum_id"],
-                "description": subject.get("description", "")
-            })
-        
-        # If we have subjects, get their IDs for course filtering
-        subject_ids = [str(subject["_id"]) for subject in subjects]
-        
-        # Search courses
-        course_filter = {"name": pattern}
-        if curriculum_id:
-            # If curriculum_id is specified, we need to get all subjects in that curriculum
-            if not subject_ids:
-                subject_ids = [str(subject["_id"]) for subject in subjects_collection.find({"curriculum_id": curriculum_id})]
-            
-            course_filter["subject_id"] = {"$in": subject_ids}
-        
-        courses = list(courses_collection.find(course_filter).limit(limit))
-        course_results = []
-        for course in courses:
-            course_results.append({
-                "id": str(course["_id"]),
-                "name": course["name"],
-                "type": "course",
-                "subject_id": course["subject_id"],
-                "description": course.get("description", "")
-            })
-        
-        # Get course IDs for unit filtering
-        course_ids = [str(course["_id"]) for course in courses]
-        
-        # Search units
-        unit_filter = {"name": pattern}
-        if course_ids:
-            unit_filter["course_id"] = {"$in": course_ids}
-        
-        units = list(units_collection.find(unit_filter).limit(limit))
-        unit_results = []
-        for unit in units:
-            unit_results.append({
-                "id": str(unit["_id"]),
-                "name": unit["name"],
-                "type": "unit",
-                "course_id": unit["course_id"],
-                "description": unit.get("description", "")
-            })
-        
-        # Get unit IDs for topic filtering
-        unit_ids = [str(unit["_id"]) for unit in units]
-        
-        # Search topics
-        topic_filter = {"name": pattern}
-        if unit_ids:
-            topic_filter["unit_id"] = {"$in": unit_ids}
-        
-        topics = list(topics_collection.find(topic_filter).limit(limit))
-        topic_results = []
-        for topic in topics:
-            topic_results.append({
-                "id": str(topic["_id"]),
-                "name": topic["name"],
-                "type": "topic",
-                "unit_id": topic["unit_id"],
-                "description": topic.get("description", "")
-            })
-        
-        # Return combined results
-        return {
-            "subjects": subject_results,
-            "courses": course_results,
-            "units": unit_results,
-            "topics": topic_results
-        }
\ No newline at end of file
+        """Search across curriculum items (subjects, courses, units, topics) via the search catalog"""
+        return await CatalogService.search(query, limit, curriculum_id)
@@ -0,0 +1,99 @@
+import os
+import threading
+from typing import Dict, List, Any, Optional
+
+from app.config.db import (
+    curriculum_collection, subjects_collection, courses_collection,
+    units_collection, topics_collection
+)
+from app.utils.change_tracking import get_version, bump_version
+from app.utils.hierarchy import CurriculumTree, build_subtree_pipeline, assemble_subtree
+
+# Set CURRICULUM_TREE_CACHE=false to always read the hierarchy from the database
+CURRICULUM_TREE_CACHE = os.getenv("CURRICULUM_TREE_CACHE", "true").lower() in ("1", "true", "yes")
+
+# Version scope bumped by every hierarchy write
+TREE_SCOPE = "curriculum"
+
+COLLECTIONS = {
+    "curriculum": curriculum_collection,
+    "subject": subjects_collection,
+    "course": courses_collection,
+    "unit": units_collection,
+    "topic": topics_collection
+}
+
+_lock = threading.Lock()
+_tree: Optional[CurriculumTree] = None
+
+class HierarchyCache:
+    """Process-level curriculum tree, kept coherent across workers by a version stamp"""
+
+    @staticmethod
+    def get_tree() -> Optional[CurriculumTree]:
+        """Current tree, reloaded if another worker changed the hierarchy; None when disabled"""
+        global _tree
+        if not CURRICULUM_TREE_CACHE:
+            return None
+
+        version = get_version(TREE_SCOPE)
+        tree = _tree
+        if tree is not None and tree.version >= version:
+            return tree
+
+        with _lock:
+            if _tree is None or _tree.version < version:
+                _tree = CurriculumTree.load(version, COLLECTIONS)
+            return _tree
+
+    @staticmethod
+    def get_subtree(
+        node_type: str,
+        id_or_slug: str,
+        fields: Optional[Dict[str, List[str]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        A node by id or slug with all of its descendants nested, or None if not found
+
+        Served from the tree when the cache is enabled, otherwise with a single
+        aggregation against the node's collection. ``fields`` limits each
+        level to the given fields (e.g. TREE_NODE_FIELDS); by default whole
+        documents are returned.
+        """
+        tree = HierarchyCache.get_tree()
+        if tree:
+            node = tree.resolve(node_type, id_or_slug)
+            return tree.subtree(str(node["_id"]), fields) if node else None
+
+        docs = COLLECTIONS[node_type].aggregate(build_subtree_pipeline(node_type, id_or_slug))
+        return assemble_subtree(node_type, id_or_slug, docs, fields)
+
+    @staticmethod
+    def node_changed(node_type: str, doc: Dict[str, Any]) -> None:
+        """Record a created or updated node: bump the version and patch the local tree"""
+        HierarchyCache._apply(lambda tree: tree.upsert(node_type, doc))
+
+    @staticmethod
+    def node_removed(node_id: str) -> None:
+        """Record a deleted node (and subtree): bump the version and patch the local tree"""
+        HierarchyCache._apply(lambda tree: tree.remove(node_id))
+
+    @staticmethod
+    def invalidate() -> None:
+        """Record a bulk change: bump the version so every worker reloads"""
+        global _tree
+        bump_version(TREE_SCOPE)
+        with _lock:
+            _tree = None
+
+    @staticmethod
+    def _apply(patch) -> None:
+        global _tree
+        version = bump_version(TREE_SCOPE)
+        with _lock:
+            if _tree is not None and _tree.version == version - 1:
+                # No other writer in between, so patching keeps the tree exact
+                patch(_tree)
+                _tree.version = version
+            else:
+                _tree = None
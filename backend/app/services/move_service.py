@@ -0,0 +1,208 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Any, Tuple
+from bson import ObjectId
+
+from app.config.db import client, curriculum_catalog_collection, jobs_collection
+from app.services.ancestry_service import AncestryService
+from app.services.cascade_service import (
+    CascadeDeleteService, COLLECTIONS, CASCADE_SYNC_LIMIT, CASCADE_BATCH_SIZE, JOB_LEASE,
+    _supports_transactions
+)
+from app.services.catalog_service import CatalogService
+from app.services.hierarchy_cache import HierarchyCache
+from app.utils.hierarchy import PARENT_FIELD, PARENT_LEVEL, ANCESTOR_FIELDS
+
+logger = logging.getLogger(__name__)
+
+class MoveService:
+    """Re-parents a hierarchy node, rewriting the ancestor ids stored below it"""
+
+    @staticmethod
+    async def new_ancestors(node_type: str, new_parent_id: str) -> Dict[str, str]:
+        """Ancestor id fields a node (and everything below it) gets under its new parent"""
+        lineage = await AncestryService.get_lineage(PARENT_LEVEL[node_type], new_parent_id)
+        return {field: lineage[field] for field in ANCESTOR_FIELDS if field in lineage}
+
+    @staticmethod
+    def plan(node_type: str, node_id: str, ancestors: Dict[str, str]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        (level, filter) pairs of the documents below the node whose ancestor ids change
+
+        Each filter skips documents already carrying the new ids, so the plan
+        shrinks as it is applied and re-running it resumes an interrupted move.
+        The node itself is updated last, by move().
+        """
+        field = f"{node_type}_id"
+        pending = {"$or": [{name: {"$ne": value}} for name, value in ancestors.items()]}
+
+        steps = []
+        if node_type != "topic":
+            steps.append(("topic", {field: node_id, **pending}))
+        steps.append(("question", {field: node_id, **pending}))
+        return steps
+
+    @staticmethod
+    async def move(node_type: str, node_doc: Dict[str, Any], new_parent_id: str) -> Dict[str, Any]:
+        """
+        Move a subject, course, unit or topic under a new parent
+
+        Small subtrees are updated synchronously (in a transaction when the
+        deployment supports one); larger ones by a resumable background job
+        that rewrites descendants in batches before re-linking the node.
+
+        Args:
+            node_type: Level of the node
+            node_doc: The node document
+            new_parent_id: Id of the new parent (one level up)
+
+        Returns:
+            The job document, status "done" or "pending"
+
+        Raises:
+            ValueError: If a sibling under the new parent has the same name
+        """
+        node_id = str(node_doc["_id"])
+        parent_field = PARENT_FIELD[node_type]
+        if COLLECTIONS[node_type].find_one({
+            parent_field: new_parent_id, "name": node_doc["name"], "_id": {"$ne": node_doc["_id"]}
+        }, {"_id": 1}):
+            raise ValueError(f"A {node_type} named '{node_doc['name']}' already exists under the new parent")
+
+        job = {
+            "type": "move",
+            "node_type": node_type,
+            "node_id": node_id,
+            "new_parent_id": new_parent_id,
+            "ancestors": await MoveService.new_ancestors(node_type, new_parent_id),
+            "status": "pending",
+            "updated": {},
+            "created_at": datetime.utcnow()
+        }
+
+        if CascadeDeleteService.estimate_size(node_type, node_id) > CASCADE_SYNC_LIMIT:
+            job["_id"] = jobs_collection.insert_one(job).inserted_id
+            MoveService.start_job(job["_id"])
+            return job
+
+        start = time.perf_counter()
+        transactional = _supports_transactions()
+        if transactional:
+            with client.start_session() as session:
+                updated = session.with_transaction(lambda s: MoveService._apply(job, s))
+        else:
+            updated = MoveService._apply(job)
+
+        await MoveService._finish(node_type, node_id)
+        job.update({
+            "status": "done",
+            "updated": updated,
+            "transactional": transactional,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+            "finished_at": datetime.utcnow()
+        })
+        job["_id"] = jobs_collection.insert_one(job).inserted_id
+        logger.info(f"Moved {node_type} {node_id} to {new_parent_id}: {updated} in {job['duration_ms']}ms")
+        return job
+
+    @staticmethod
+    def _apply(job: Dict[str, Any], session=None) -> Dict[str, int]:
+        node_type, node_id, ancestors = job["node_type"], job["node_id"], job["ancestors"]
+        updated = {}
+        for level, query in MoveService.plan(node_type, node_id, ancestors):
+            updated[level] = COLLECTIONS[level].update_many(
+                query, {"$set": ancestors}, session=session
+            ).modified_count
+        MoveService._relink(job, session)
+        return updated
+
+    @staticmethod
+    def _relink(job: Dict[str, Any], session=None) -> None:
+        """Point the node at its new parent and move its catalog entries along"""
+        node_type, node_id, ancestors = job["node_type"], job["node_id"], job["ancestors"]
+        node_update = {PARENT_FIELD[node_type]: job["new_parent_id"], "updated_at": datetime.utcnow()}
+        if node_type == "topic":
+            node_update.update(ancestors)
+        COLLECTIONS[node_type].update_one({"_id": ObjectId(node_id)}, {"$set": node_update}, session=session)
+
+        curriculum_catalog_collection.update_many(
+            {"$or": [{"_id": ObjectId(node_id)}, {f"{node_type}_id": node_id}]},
+            {"$set": ancestors},
+            session=session
+        )
+
+    @staticmethod
+    async def _finish(node_type: str, node_id: str) -> None:
+        node = COLLECTIONS[node_type].find_one({"_id": ObjectId(node_id)})
+        if node:
+            await CatalogService.upsert_node(node_type, node)
+            HierarchyCache.node_changed(node_type, node)
+
+    @staticmethod
+    def start_job(job_id: ObjectId) -> None:
+        """Run a move job on a background thread"""
+        threading.Thread(target=MoveService.run_job, args=(job_id,), daemon=True).start()
+
+    @staticmethod
+    def run_job(job_id: ObjectId) -> None:
+        """
+        Execute (or resume) a move job in batches
+
+        Descendants are rewritten first and the node is re-linked last, so
+        until the job is done the tree still shows the node at its old place;
+        running the job again from the top finishes an interrupted move.
+        """
+        now = datetime.utcnow()
+        job = jobs_collection.find_one_and_update(
+            {"_id": job_id, "$or": [
+                {"status": "pending"},
+                {"status": "running", "heartbeat_at": {"$lt": now - JOB_LEASE}}
+            ]},
+            {"$set": {"status": "running", "started_at": now, "heartbeat_at": now}}
+        )
+        if not job:
+            # Already finished, or another worker holds the lease
+            return
+
+        node_type, node_id = job["node_type"], job["node_id"]
+        start = time.perf_counter()
+        try:
+            for level, query in MoveService.plan(node_type, node_id, job["ancestors"]):
+                collection = COLLECTIONS[level]
+                while True:
+                    ids = [doc["_id"] for doc in collection.find(query, {"_id": 1}).limit(CASCADE_BATCH_SIZE)]
+                    if not ids:
+                        break
+                    count = collection.update_many({"_id": {"$in": ids}}, {"$set": job["ancestors"]}).modified_count
+                    jobs_collection.update_one(
+                        {"_id": job_id},
+                        {"$inc": {f"updated.{level}": count}, "$set": {"heartbeat_at": datetime.utcnow()}}
+                    )
+
+            MoveService._relink(job)
+            node = COLLECTIONS[node_type].find_one({"_id": ObjectId(node_id)})
+            if node:
+                HierarchyCache.node_changed(node_type, node)
+        except Exception as e:
+            logger.error(f"Move job {job_id} failed: {e}")
+            jobs_collection.update_one({"_id": job_id}, {"$set": {"status": "failed", "error": str(e)}})
+            return
+
+        duration_ms = round((time.perf_counter() - start) * 1000, 1)
+        jobs_collection.update_one(
+            {"_id": job_id},
+            {"$set": {"status": "done", "duration_ms": duration_ms, "finished_at": datetime.utcnow()}}
+        )
+        logger.info(f"Move job {job_id} for {node_type} {node_id}: done in {duration_ms}ms")
+
+    @staticmethod
+    def resume_jobs() -> int:
+        """Restart move jobs left unfinished by a previous process"""
+        job_ids = [job["_id"] for job in jobs_collection.find(
+            {"type": "move", "status": {"$in": ["pending", "running"]}}, {"_id": 1}
+        )]
+        for job_id in job_ids:
+            MoveService.start_job(job_id)
+        return len(job_ids)
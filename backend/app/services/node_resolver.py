@@ -0,0 +1,95 @@
+import os
+import threading
+from typing import Dict, Any, Optional, Tuple
+from bson import ObjectId
+
+from app.services.hierarchy_cache import TREE_SCOPE
+from app.utils.cache import TTLCache
+from app.utils.change_tracking import get_version
+
+# Bounds of the id-or-slug -> id cache shared by all hierarchy collections
+SLUG_CACHE_SIZE = int(os.getenv("SLUG_CACHE_SIZE", "10000"))
+SLUG_CACHE_TTL = float(os.getenv("SLUG_CACHE_TTL", "300"))
+
+_cache = TTLCache(SLUG_CACHE_SIZE, SLUG_CACHE_TTL)
+_cache_version = -1
+_lock = threading.Lock()
+
+def _lookup_query(id_or_slug: str) -> Dict[str, Any]:
+    """A slug-only query, or one $or query when the input could also be an id"""
+    if ObjectId.is_valid(id_or_slug):
+        return {"$or": [{"_id": ObjectId(id_or_slug)}, {"slug": id_or_slug}]}
+    return {"slug": id_or_slug}
+
+def _pick(docs, id_or_slug: str) -> Dict[str, Any]:
+    """The document matched by _id if there is one, else the slug match"""
+    if len(docs) > 1:
+        oid = ObjectId(id_or_slug)
+        return next(doc for doc in docs if doc["_id"] == oid)
+    return docs[0]
+
+def _check_version() -> None:
+    """Drop cached mappings once any worker has written to the hierarchy"""
+    global _cache_version
+    version = get_version(TREE_SCOPE)
+    if version != _cache_version:
+        with _lock:
+            if version != _cache_version:
+                _cache.clear()
+                _cache_version = version
+
+class NodeResolver:
+    """Resolves hierarchy references given either as an ObjectId string or a slug"""
+
+    @staticmethod
+    def get(collection, id_or_slug: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Find a document by id or slug with a single query
+
+        Inputs that cannot be an ObjectId are looked up by slug only; the rest
+        use one ``$or`` query, where a match on ``_id`` wins over a document
+        whose slug happens to look like an id.
+
+        Args:
+            collection: Hierarchy collection to search
+            id_or_slug: ObjectId string or slug
+
+        Returns:
+            (document, string id), or (None, None) if not found
+        """
+        if not id_or_slug:
+            return None, None
+
+        _check_version()
+        docs = list(collection.find(_lookup_query(id_or_slug)).limit(2))
+        if not docs:
+            return None, None
+        doc = _pick(docs, id_or_slug)
+        _cache.set((collection.name, id_or_slug), str(doc["_id"]))
+        return doc, str(doc["_id"])
+
+    @staticmethod
+    def resolve_id(collection, id_or_slug: str) -> Optional[str]:
+        """
+        The string id a reference points to, or None if not found
+
+        Answered from the cache when possible, so resolving a parent or a
+        filter value usually costs no query at all. The cache is cleared
+        whenever the hierarchy version stamp moves, i.e. after any create,
+        update, move or delete on any worker.
+        """
+        if not id_or_slug:
+            return None
+
+        _check_version()
+        key = (collection.name, id_or_slug)
+        node_id = _cache.get(key)
+        if node_id:
+            return node_id
+
+        docs = list(collection.find(_lookup_query(id_or_slug), {"_id": 1}).limit(2))
+        if not docs:
+            return None
+        node_id = str(_pick(docs, id_or_slug)["_id"])
+        _cache.set(key, node_id)
+        return node_id
@@ -6,6 +6,11 @@ from app.config.db import (
     questions_collection, topics_collection, units_collection,
     courses_collection, subjects_collection, curriculum_collection
 )
+from app.utils.projections import (
+    QUESTION_SEARCH_PROJECTION, QUESTION_SET_PROJECTION, QUESTION_PRACTICE_PROJECTION
+)
+from app.utils.loaders import CurriculumLoaders
+from app.utils.search import build_search_pipeline
 
 class QuestionService:
     """Service for question-related business logic"""
@@ -101,20 +106,14 @@ class QuestionService:
         question_type: Optional[str] = None,
         difficulty: Optional[str] = None,
         ai_generated: Optional[bool] = None,
-        limit: int = 20
+        limit: int = 20,
+        prefix: bool = True
     ) -> List[Dict[str, Any]]:
-        """Search questions with various filters"""
+        """Ranked search over the question search index with optional filters"""
         
-        # Create base filter
+        # Create base filter (pushed down into the indexed search match)
         filter_query = {}
         
-        # Add text search if query is provided
-        if query:
-            filter_query["$or"] = [
-                {"question_text": {"$regex": query, "$options": "i"}},
-                {"explanation": {"$regex": query, "$options": "i"}}
-            ]
-        
         # Add additional filters if provided
         if topic_id:
             filter_query["topic_id"] = topic_id
@@ -129,22 +128,20 @@ class QuestionService:
             filter_query["ai_generated"] = ai_generated
         
         # Execute search
-        questions = list(questions_collection.find(filter_query).limit(limit))
+        pipeline = build_search_pipeline(query, filter_query, limit, QUESTION_SEARCH_PROJECTION, prefix)
+        if pipeline is None:
+            return []
+        questions = list(questions_collection.aggregate(pipeline))
+        
+        # Resolve all referenced topics with a single query
+        loaders = CurriculumLoaders()
+        loaders.load_topic_chain((question["topic_id"] for question in questions), depth="topic")
         
         # Format results
         result = []
         for question in questions:
             # Get topic info
-            topic_info = None
-            try:
-                topic = topics_collection.find_one({"_id": ObjectId(question["topic_id"])})
-                if topic:
-                    topic_info = {
-                        "id": str(topic["_id"]),
-                        "name": topic["name"]
-                    }
-            except:
-                pass
+            topic_info = loaders.topic_info(question["topic_id"])
                 
             # Format question data
             formatted_question = {
@@ -156,7 +153,8 @@ class QuestionService:
                 "created_at": question["created_at"],
                 "topic": topic_info,
                 "options": question["options"],
-                "correct_answer": question["correct_answer"]
+                "correct_answer": question["correct_answer"],
+                "score": question.get("score", 0)
             }
             
             result.append(formatted_question)
@@ -173,7 +171,7 @@ class QuestionService:
             raise ValueError(f"Topic with ID {topic_id} not found")
         
         # Get questions for this topic
-        questions = list(questions_collection.find({"topic_id": topic_id}).limit(limit))
+        questions = list(questions_collection.find({"topic_id": topic_id}, QUESTION_SET_PROJECTION).limit(limit))
         
         # Group by question type
         by_type = {}
@@ -277,25 +275,21 @@ class QuestionService:
         # Get random questions (using MongoDB's sample)
         pipeline = [
             {"$match": filter_query},
-            {"$sample": {"size": count}}
+            {"$sample": {"size": count}},
+            {"$project": QUESTION_PRACTICE_PROJECTION}
         ]
         
         questions = list(questions_collection.aggregate(pipeline))
         
+        # Resolve all referenced topics with a single query
+        loaders = CurriculumLoaders()
+        loaders.load_topic_chain((question["topic_id"] for question in questions), depth="topic")
+        
         # Format questions
         formatted_questions = []
         for question in questions:
             # Get topic info
-            topic_info = None
-            try:
-                topic = topics_collection.find_one({"_id": ObjectId(question["topic_id"])})
-                if topic:
-                    topic_info = {
-                        "id": str(topic["_id"]),
-                        "name": topic["name"]
-                    }
-            except:
-                pass
+            topic_info = loaders.topic_info(question["topic_id"])
             
             # Format question
             formatted_q = {
@@ -0,0 +1,105 @@
+import threading
+from collections import defaultdict
+from typing import Dict, Any, Optional
+
+from app.config.db import questions_collection
+from app.services.hierarchy_cache import HierarchyCache, TREE_SCOPE
+from app.utils.change_tracking import get_version, bump_version, QUESTIONS_SCOPE
+from app.utils.hierarchy import rollup_question_stats
+
+_lock = threading.Lock()
+
+# curriculum id -> {"tree_version", "questions_version", "topics": {topic id: {(type, difficulty): count}}}
+_entries: Dict[str, Dict[str, Any]] = {}
+
+def _stats_key(question: Optional[Dict[str, Any]]):
+    """Where a question is counted: (curriculum id, topic id, (type, difficulty)), or None"""
+    if not question or not question.get("curriculum_id"):
+        return None
+    return (
+        question["curriculum_id"],
+        question["topic_id"],
+        (question.get("question_type"), question.get("difficulty"))
+    )
+
+class QuestionStatsCache:
+    """Per-curriculum question counts by topic, kept current with incremental patches"""
+
+    @staticmethod
+    def get_tree_stats(curriculum_id_or_slug: str) -> Optional[Dict[str, Any]]:
+        """
+        Curriculum subtree with question stats rolled up to every node
+
+        Per-topic counts for a curriculum come from one aggregation and are
+        cached until the hierarchy changes or a question write this worker
+        cannot patch in (see question_changed()).
+
+        Returns:
+            The nested curriculum, each node carrying ``question_stats``, or
+            None if the curriculum does not exist
+        """
+        # Read the stamps first so a concurrent write can only make the cache entry look older
+        tree_version = get_version(TREE_SCOPE)
+        questions_version = get_version(QUESTIONS_SCOPE)
+
+        curriculum = HierarchyCache.get_subtree("curriculum", curriculum_id_or_slug)
+        if not curriculum:
+            return None
+        curriculum_id = str(curriculum["_id"])
+        with _lock:
+            entry = _entries.get(curriculum_id)
+            if entry and (entry["tree_version"], entry["questions_version"]) == (tree_version, questions_version):
+                topics = {topic_id: dict(counts) for topic_id, counts in entry["topics"].items()}
+            else:
+                topics = None
+
+        if topics is None:
+            topics = defaultdict(dict)
+            for group in questions_collection.aggregate([
+                {"$match": {"curriculum_id": curriculum_id}},
+                {"$group": {
+                    "_id": {"topic_id": "$topic_id", "type": "$question_type", "difficulty": "$difficulty"},
+                    "count": {"$sum": 1}
+                }}
+            ]):
+                key = group["_id"]
+                topics[key["topic_id"]][(key.get("type"), key.get("difficulty"))] = group["count"]
+            topics = dict(topics)
+            with _lock:
+                _entries[curriculum_id] = {
+                    "tree_version": tree_version,
+                    "questions_version": questions_version,
+                    "topics": {topic_id: dict(counts) for topic_id, counts in topics.items()}
+                }
+
+        rollup_question_stats("curriculum", curriculum, topics)
+        return curriculum
+
+    @staticmethod
+    def question_changed(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> None:
+        """
+        Record a question write: bump the questions version and patch cached counts
+
+        Args:
+            before: The question as it was (None when created)
+            after: The question as it is now (None when deleted)
+        """
+        version = bump_version(QUESTIONS_SCOPE)
+        deltas = [(key, delta) for key, delta in ((_stats_key(before), -1), (_stats_key(after), 1)) if key]
+
+        with _lock:
+            for curriculum_id in list(_entries):
+                entry = _entries[curriculum_id]
+                if entry["questions_version"] != version - 1:
+                    # Another write landed in between, the counts can no longer be patched
+                    del _entries[curriculum_id]
+                    continue
+                entry["questions_version"] = version
+
+            for (curriculum_id, topic_id, group), delta in deltas:
+                entry = _entries.get(curriculum_id)
+                if entry:
+                    counts = entry["topics"].setdefault(topic_id, {})
+                    counts[group] = counts.get(group, 0) + delta
+                    if counts[group] <= 0:
+                        del counts[group]
@@ -4,10 +4,20 @@ from datetime import datetime, timedelta
 
 from app.config.db import (
     questions_collection, topics_collection, units_collection,
-    courses_collection, subjects_collection, curriculum_collection,
-    users_collection
+    courses_collection, subjects_collection, curriculum_collection
 )
 from app.models.student import StudentStats, StudentDashboard
+from app.utils.projections import (
+    QUESTION_SUMMARY_PROJECTION, QUESTION_QUIZ_PROJECTION, QUESTION_TOPIC_LIST_PROJECTION
+)
+from app.utils.loaders import CurriculumLoaders
+from app.services.user_profiles import UserProfileCache
+from app.services.hierarchy_cache import HierarchyCache, TREE_SCOPE, COLLECTIONS
+from app.utils.change_tracking import get_version, QUESTIONS_SCOPE
+from app.utils.hierarchy import CurriculumTree, CHILD_LEVEL, COLLECTION_NAMES
+
+# Last question-set catalog built by this process, as (etag, catalog)
+_question_sets = None
 
 class StudentService:
     """Service for student-specific business logic"""
@@ -17,31 +27,28 @@ class StudentService:
         """Get student dashboard data including available questions and recommended topics"""
         
         # Validate student exists
-        student = users_collection.find_one({"_id": ObjectId(student_id)})
+        student = UserProfileCache.get(student_id)
         if not student:
             raise ValueError(f"Student with ID {student_id} not found")
         
         # For demonstration, we'll count questions available to the student
         questions_count = questions_collection.count_documents({})
         
+        # Batch loaders shared by every lookup below (one query per collection)
+        loaders = CurriculumLoaders()
+        
         # Get count of topics with questions
-        topic_ids = set()
-        for question in questions_collection.find({}, {"topic_id": 1}):
-            topic_ids.add(question["topic_id"])
+        topic_ids = set(questions_collection.distinct("topic_id"))
         
         topics_count = len(topic_ids)
         
         # Get count of courses with topics that have questions
+        topics = loaders.load_topic_chain(topic_ids, depth="unit")
         course_ids = set()
-        for topic_id in topic_ids:
-            try:
-                topic = topics_collection.find_one({"_id": ObjectId(topic_id)})
-                if topic:
-                    unit = units_collection.find_one({"_id": ObjectId(topic["unit_id"])})
-                    if unit:
-                        course_ids.add(unit["course_id"])
-            except:
-                pass
+        for topic in topics.values():
+            unit = loaders.units.load(topic.get("unit_id"))
+            if unit:
+                course_ids.add(unit["course_id"])
         
         courses_count = len(course_ids)
         
@@ -49,21 +56,28 @@ class StudentService:
         recent_activity = []
         
         # Get recent questions (using the most recently created questions)
-        recent_questions_cursor = questions_collection.find({}).sort("created_at", -1).limit(5)
+        recent_questions_docs = list(questions_collection.find({}, QUESTION_SUMMARY_PROJECTION).sort("created_at", -1).limit(5))
+        
+        # Get recommended topics (topics with most questions)
+        pipeline = [
+            {"$group": {"_id": "$topic_id", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1}},
+            {"$limit": 5}
+        ]
+        
+        topic_counts = list(questions_collection.aggregate(pipeline))
+        
+        # Prefetch every topic, unit and course referenced below in one pass
+        loaders.load_topic_chain(
+            [question["topic_id"] for question in recent_questions_docs] +
+            [topic_result["_id"] for topic_result in topic_counts],
+            depth="course"
+        )
         
         recent_questions = []
-        for question in recent_questions_cursor:
+        for question in recent_questions_docs:
             # Get topic info
-            topic_info = None
-            try:
-                topic = topics_collection.find_one({"_id": ObjectId(question["topic_id"])})
-                if topic:
-                    topic_info = {
-                        "id": str(topic["_id"]),
-                        "name": topic["name"]
-                    }
-            except:
-                pass
+            topic_info = loaders.topic_info(question["topic_id"])
             
             recent_questions.append({
                 "id": str(question["_id"]),
@@ -74,56 +88,22 @@ class StudentService:
                 "topic": topic_info
             })
         
-        # Get recommended topics (topics with most questions)
-        pipeline = [
-            {"$group": {"_id": "$topic_id", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-            {"$limit": 5}
-        ]
-        
-        topic_counts = list(questions_collection.aggregate(pipeline))
         recommended_topics = []
         
         for topic_result in topic_counts:
             topic_id = topic_result["_id"]
             question_count = topic_result["count"]
             
-            # Get topic info
-            try:
-                topic = topics_collection.find_one({"_id": ObjectId(topic_id)})
-                if topic:
-                    # Try to get unit and course info
-                    unit_info = None
-                    try:
-                        unit = units_collection.find_one({"_id": ObjectId(topic["unit_id"])})
-                        if unit:
-                            unit_info = {
-                                "id": str(unit["_id"]),
-                                "name": unit["name"]
-                            }
-                            
-                            # Try to get course info
-                            try:
-                                course = courses_collection.find_one({"_id": ObjectId(unit["course_id"])})
-                                if course:
-                                    unit_info["course"] = {
-                                        "id": str(course["_id"]),
-                                        "name": course["name"]
-                                    }
-                            except:
-                                pass
-                    except:
-                        pass
-                    
-                    recommended_topics.append({
-                        "id": str(topic["_id"]),
-                        "name": topic["name"],
-                        "description": topic.get("description", ""),
-                        "question_count": question_count,
-                        "unit": unit_info
-                    })
-            except:
-                pass
+            # Get topic info with its unit and course
+            topic = loaders.topics.load(topic_id)
+            if topic:
+                recommended_topics.append({
+                    "id": str(topic["_id"]),
+                    "name": topic["name"],
+                    "description": topic.get("description", ""),
+                    "question_count": question_count,
+                    "unit": loaders.unit_info(topic.get("unit_id"), with_course=True)
+                })
         
         # Build stats object
         stats = StudentStats(
@@ -142,84 +122,60 @@ class StudentService:
         
         return dashboard.dict()
     
+    @staticmethod
+    def question_sets_etag() -> str:
+        """ETag of the question-set catalog, derived from the hierarchy and question version stamps"""
+        return f'W/"qs-{get_version(TREE_SCOPE)}-{get_version(QUESTIONS_SCOPE)}"'
+    
     @staticmethod
     async def get_available_question_sets() -> List[Dict[str, Any]]:
-        """Get sets of questions available to students grouped by curriculum structure"""
-        
-        # Get all curricula
-        curricula = list(curriculum_collection.find())
-        
-        result = []
-        for curriculum in curricula:
-            curriculum_data = {
-                "id": str(curriculum["_id"]),
-                "name": curriculum["name"],
-                "description": curriculum.get("description", ""),
-                "subjects": []
+        """
+        Get sets of questions available to students grouped by curriculum structure
+        
+        Question counts come from one $group over questions by topic_id and
+        the hierarchy from the tree cache, so building the catalog costs a
+        single aggregation. The result is kept per process until a hierarchy
+        or question write moves either version stamp.
+        """
+        global _question_sets
+        key = StudentService.question_sets_etag()
+        cached = _question_sets
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        counts = {
+            group["_id"]: group["count"]
+            for group in questions_collection.aggregate([
+                {"$group": {"_id": "$topic_id", "count": {"$sum": 1}}}
+            ])
+        }
+        tree = HierarchyCache.get_tree() or CurriculumTree.load(get_version(TREE_SCOPE), COLLECTIONS)
+        
+        def node_data(node_id: str) -> Dict[str, Any]:
+            node = tree.nodes[node_id]
+            return {
+                "id": node_id,
+                "name": node["name"],
+                "description": node.get("description", "")
             }
+        
+        def build(node_id: str) -> Optional[Dict[str, Any]]:
+            # Only keep branches that lead to at least one topic with questions
+            node_type = tree.types[node_id]
+            if node_type == "topic":
+                if not counts.get(node_id):
+                    return None
+                return {**node_data(node_id), "question_count": counts[node_id]}
             
-            # Get subjects for this curriculum
-            subjects = list(subjects_collection.find({"curriculum_id": str(curriculum["_id"])}))
-            
-            for subject in subjects:
-                subject_data = {
-                    "id": str(subject["_id"]),
-                    "name": subject["name"],
-                    "description": subject.get("description", ""),
-                    "courses": []
-                }
-                
-                # Get courses for this subject
-                courses = list(courses_collection.find({"subject_id": str(subject["_id"])}))
-                
-                for course in courses:
-                    course_data = {
-                        "id": str(course["_id"]),
-                        "name": course["name"],
-                        "description": course.get("description", ""),
-                        "units": []
-                    }
-                    
-                    # Get units for this course
-                    units = list(units_collection.find({"course_id": str(course["_id"])}))
-                    
-                    for unit in units:
-                        unit_data = {
-                            "id": str(unit["_id"]),
-                            "name": unit["name"],
-                            "description": unit.get("description", ""),
-                            "topics": []
-                        }
-                        
-                        # Get topics for this unit
-                        topics = list(topics_collection.find({"unit_id": str(unit["_id"])}))
-                        
-                        for topic in topics:
-                            # Get question count for this topic
-                            question_count = questions_collection.count_documents({"topic_id": str(topic["_id"])})
-                            
-                            if question_count > 0:  # Only include topics with questions
-                                topic_data = {
-                                    "id": str(topic["_id"]),
-                                    "name": topic["name"],
-                                    "description": topic.get("description", ""),
-                                    "question_count": question_count
-                                }
-                                
-                                unit_data["topics"].append(topic_data)
-                        
-                        if unit_data["topics"]:  # Only include units with topics that have questions
-                            course_data["units"].append(unit_data)
-                    
-                    if course_data["units"]:  # Only include courses with units that have topics with questions
-                        subject_data["courses"].append(course_data)
-                
-                if subject_data["courses"]:  # Only include subjects with courses that have units with topics with questions
-                    curriculum_data["subjects"].append(subject_data)
-            
-            if curriculum_data["subjects"]:  # Only include curricula with subjects that have content
-                result.append(curriculum_data)
+            children = [child for child in map(build, tree.children[node_id]) if child]
+            if not children:
+                return None
+            return {**node_data(node_id), COLLECTION_NAMES[CHILD_LEVEL[node_type]]: children}
+        
+        roots = [node_id for node_id, node_type in tree.types.items() if node_type == "curriculum"]
+        result = [data for data in map(build, roots) if data]
         
+        _question_sets = (key, result)
         return result
     
     @staticmethod
@@ -232,7 +188,7 @@ class StudentService:
             raise ValueError(f"Topic with ID {topic_id} not found")
         
         # Get all questions for this topic
-        questions_cursor = questions_collection.find({"topic_id": topic_id})
+        questions_cursor = questions_collection.find({"topic_id": topic_id}, QUESTION_TOPIC_LIST_PROJECTION)
         
         questions = []
         for question in questions_cursor:
@@ -330,25 +286,24 @@ class StudentService:
         # Use aggregation to get a random sample of questions
         pipeline = [
             {"$match": filter_query},
-            {"$sample": {"size": question_count}}
+            {"$sample": {"size": question_count}},
+            {"$project": QUESTION_QUIZ_PROJECTION}
         ]
         
-        questions_cursor = questions_collection.aggregate(pipeline)
+        sampled_questions = list(questions_collection.aggregate(pipeline))
+        
+        # Resolve the requested and sampled topics with a single query
+        loaders = CurriculumLoaders()
+        loaders.load_topic_chain(
+            list(topic_ids) + [question["topic_id"] for question in sampled_questions],
+            depth="topic"
+        )
         
         # Format questions for the quiz
         quiz_questions = []
-        for question in questions_cursor:
+        for question in sampled_questions:
             # Get topic info
-            topic_info = None
-            try:
-                topic = topics_collection.find_one({"_id": ObjectId(question["topic_id"])})
-                if topic:
-                    topic_info = {
-                        "id": str(topic["_id"]),
-                        "name": topic["name"]
-                    }
-            except:
-                pass
+            topic_info = loaders.topic_info(question["topic_id"])
             
             quiz_questions.append({
                 "id": str(question["_id"]),
@@ -362,12 +317,9 @@ class StudentService:
         # Get topic names
         topic_names = []
         for topic_id in topic_ids:
-            try:
-                topic = topics_collection.find_one({"_id": ObjectId(topic_id)})
-                if topic:
-                    topic_names.append(topic["name"])
-            except:
-                pass
+            topic = loaders.topics.load(topic_id)
+            if topic:
+                topic_names.append(topic["name"])
         
         # Create quiz metadata
         quiz_info = {
@@ -1,13 +1,11 @@
 from typing import Dict, List, Any, Optional
-from bson import ObjectId
 from datetime import datetime, timedelta
 
-from app.config.db import (
-    questions_collection, topics_collection, units_collection,
-    courses_collection, subjects_collection, curriculum_collection,
-    users_collection
-)
+from app.config.db import questions_collection
 from app.models.teacher import TeacherStats, TeacherDashboard
+from app.utils.projections import QUESTION_SUMMARY_PROJECTION, QUESTION_ACTIVITY_PROJECTION
+from app.utils.loaders import CurriculumLoaders
+from app.services.user_profiles import UserProfileCache
 
 class TeacherService:
     """Service for teacher-specific business logic"""
@@ -17,7 +15,7 @@ class TeacherService:
         """Get teacher dashboard data including statistics and recent activity"""
         
         # Validate teacher exists
-        teacher = users_collection.find_one({"_id": ObjectId(teacher_id)})
+        teacher = UserProfileCache.get(teacher_id)
         if not teacher:
             raise ValueError(f"Teacher with ID {teacher_id} not found")
         
@@ -27,40 +25,50 @@ class TeacherService:
         questions_manually_created = questions_collection.count_documents({"created_by": teacher_id, "ai_generated": False})
         
         # Get topics covered
-        topic_ids = set()
-        for question in questions_collection.find({"created_by": teacher_id}, {"topic_id": 1}):
-            topic_ids.add(question["topic_id"])
+        topic_ids = set(questions_collection.distinct("topic_id", {"created_by": teacher_id}))
         
         topics_covered = len(topic_ids)
         
         # Get recent activity (questions created in the last 30 days)
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        recent_activity_cursor = questions_collection.find({
+        recent_activity_docs = list(questions_collection.find({
             "created_by": teacher_id,
             "created_at": {"$gte": thirty_days_ago}
-        }).sort("created_at", -1).limit(10)
+        }, QUESTION_ACTIVITY_PROJECTION).sort("created_at", -1).limit(10))
+        
+        # Get recent questions
+        recent_questions_docs = list(questions_collection.find({
+            "created_by": teacher_id
+        }, QUESTION_SUMMARY_PROJECTION).sort("created_at", -1).limit(5))
+        
+        # Get favorite topics (topics with most questions)
+        pipeline = [
+            {"$match": {"created_by": teacher_id}},
+            {"$group": {"_id": "$topic_id", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1}},
+            {"$limit": 5}
+        ]
+        
+        favorite_topics_result = list(questions_collection.aggregate(pipeline))
+        
+        # Prefetch every topic, unit and course referenced below (one query per collection)
+        loaders = CurriculumLoaders()
+        loaders.load_topic_chain(
+            [activity["topic_id"] for activity in recent_activity_docs] +
+            [question["topic_id"] for question in recent_questions_docs] +
+            [topic_result["_id"] for topic_result in favorite_topics_result],
+            depth="course"
+        )
         
         recent_activity = []
-        for activity in recent_activity_cursor:
-            # Get topic info
-            topic_info = None
-            try:
-                topic = topics_collection.find_one({"_id": ObjectId(activity["topic_id"])})
-                if topic:
-                    topic_info = {
-                        "id": str(topic["_id"]),
-                        "name": topic["name"]
-                    }
-                    
-                    # Try to get unit info
-                    unit = units_collection.find_one({"_id": ObjectId(topic["unit_id"])})
-                    if unit:
-                        topic_info["unit"] = {
-                            "id": str(unit["_id"]),
-                            "name": unit["name"]
-                        }
-            except:
-                pass
+        for activity in recent_activity_docs:
+            # Get topic info with its unit
+            topic_info = loaders.topic_info(activity["topic_id"])
+            if topic_info:
+                topic = loaders.topics.load(activity["topic_id"])
+                unit_info = loaders.unit_info(topic.get("unit_id"))
+                if unit_info:
+                    topic_info["unit"] = unit_info
             
             recent_activity.append({
                 "id": str(activity["_id"]),
@@ -72,24 +80,10 @@ class TeacherService:
                 "topic": topic_info
             })
         
-        # Get recent questions
-        recent_questions_cursor = questions_collection.find({
-            "created_by": teacher_id
-        }).sort("created_at", -1).limit(5)
-        
         recent_questions = []
-        for question in recent_questions_cursor:
+        for question in recent_questions_docs:
             # Get topic info
-            topic_info = None
-            try:
-                topic = topics_collection.find_one({"_id": ObjectId(question["topic_id"])})
-                if topic:
-                    topic_info = {
-                        "id": str(topic["_id"]),
-                        "name": topic["name"]
-                    }
-            except:
-                pass
+            topic_info = loaders.topic_info(question["topic_id"])
             
             recent_questions.append({
                 "id": str(question["_id"]),
@@ -101,57 +95,22 @@ class TeacherService:
                 "topic": topic_info
             })
         
-        # Get favorite topics (topics with most questions)
-        pipeline = [
-            {"$match": {"created_by": teacher_id}},
-            {"$group": {"_id": "$topic_id", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-            {"$limit": 5}
-        ]
-        
-        favorite_topics_result = list(questions_collection.aggregate(pipeline))
         favorite_topics = []
         
         for topic_result in favorite_topics_result:
             topic_id = topic_result["_id"]
             question_count = topic_result["count"]
             
-            # Get topic info
-            try:
-                topic = topics_collection.find_one({"_id": ObjectId(topic_id)})
-                if topic:
-                    # Try to get unit info
-                    unit_info = None
-                    try:
-                        unit = units_collection.find_one({"_id": ObjectId(topic["unit_id"])})
-                        if unit:
-                            unit_info = {
-                                "id": str(unit["_id"]),
-                                "name": unit["name"]
-                            }
-                            
-                            # Try to get course info
-                            try:
-                                course = courses_collection.find_one({"_id": ObjectId(unit["course_id"])})
-                                if course:
-                                    unit_info["course"] = {
-                                        "id": str(course["_id"]),
-                                        "name": course["name"]
-                                    }
-                            except:
-                                pass
-                    except:
-                        pass
-                    
-                    favorite_topics.append({
-                        "id": str(topic["_id"]),
-                        "name": topic["name"],
-                        "description": topic.get("description", ""),
-                        "question_count": question_count,
-                        "unit": unit_info
-                    })
-            except:
-                pass
+            # Get topic info with its unit and course
+            topic = loaders.topics.load(topic_id)
+            if topic:
+                favorite_topics.append({
+                    "id": str(topic["_id"]),
+                    "name": topic["name"],
+                    "description": topic.get("description", ""),
+                    "question_count": question_count,
+                    "unit": loaders.unit_info(topic.get("unit_id"), with_course=True)
+                })
         
         # Build stats object
         stats = TeacherStats(
@@ -176,7 +135,7 @@ class TeacherService:
         """Get detailed teacher activity over a period of time"""
         
         # Validate teacher exists
-        teacher = users_collection.find_one({"_id": ObjectId(teacher_id)})
+        teacher = UserProfileCache.get(teacher_id)
         if not teacher:
             raise ValueError(f"Teacher with ID {teacher_id} not found")
         
@@ -185,10 +144,14 @@ class TeacherService:
         start_date = end_date - timedelta(days=days)
         
         # Get all questions created in the date range
-        questions_cursor = questions_collection.find({
+        questions = list(questions_collection.find({
             "created_by": teacher_id,
             "created_at": {"$gte": start_date, "$lte": end_date}
-        }).sort("created_at", 1)
+        }, QUESTION_ACTIVITY_PROJECTION).sort("created_at", 1))
+        
+        # Resolve every topic used in the period with a single query
+        loaders = CurriculumLoaders()
+        loaders.load_topic_chain((question["topic_id"] for question in questions), depth="topic")
         
         # Prepare activity data
         activity_by_date = {}
@@ -208,7 +171,7 @@ class TeacherService:
         # Track topics used
         topic_usage = {}
         
-        for question in questions_cursor:
+        for question in questions:
             # Format date as string (YYYY-MM-DD)
             date_str = question["created_at"].strftime("%Y-%m-%d")
             
@@ -242,15 +205,14 @@ class TeacherService:
             topic_id = question["topic_id"]
             if topic_id not in topic_usage:
                 # Get topic info
-                try:
-                    topic = topics_collection.find_one({"_id": ObjectId(topic_id)})
-                    if topic:
-                        topic_usage[topic_id] = {
-                            "id": str(topic["_id"]),
-                            "name": topic["name"],
-                            "count": 0
-                        }
-                except:
+                topic = loaders.topics.load(topic_id)
+                if topic:
+                    topic_usage[topic_id] = {
+                        "id": str(topic["_id"]),
+                        "name": topic["name"],
+                        "count": 0
+                    }
+                else:
                     topic_usage[topic_id] = {
                         "id": topic_id,
                         "name": "Unknown Topic",
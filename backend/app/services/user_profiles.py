@@ -0,0 +1,107 @@
+import os
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.config.db import users_collection
+from app.utils.cache import TTLCache
+from app.utils.change_tracking import get_version, bump_version
+
+# Bounds of the user id -> public profile cache
+USER_PROFILE_CACHE_SIZE = int(os.getenv("USER_PROFILE_CACHE_SIZE", "10000"))
+USER_PROFILE_CACHE_TTL = float(os.getenv("USER_PROFILE_CACHE_TTL", "300"))
+
+# Version scope bumped whenever an admin changes or removes a user
+USERS_SCOPE = "users"
+
+# The only user fields ever shown next to content (never the password hash)
+PROFILE_PROJECTION = {"full_name": 1, "email": 1, "role": 1}
+
+# Cached for ids with no user, so unknown authors are not looked up again
+_MISSING = object()
+
+_cache = TTLCache(USER_PROFILE_CACHE_SIZE, USER_PROFILE_CACHE_TTL)
+_cache_version = -1
+_lock = threading.Lock()
+
+def _check_version() -> None:
+    """Drop cached profiles once any worker has changed a user"""
+    global _cache_version
+    version = get_version(USERS_SCOPE)
+    if version != _cache_version:
+        with _lock:
+            if version != _cache_version:
+                _cache.clear()
+                _cache_version = version
+
+class UserProfileCache:
+    """Public user profiles ({id, full_name, email, role}) for enriching created_by references"""
+
+    @staticmethod
+    def get_many(user_ids: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Profiles for a batch of user ids
+
+        Ids not in the cache are fetched with a single ``$in`` query.
+
+        Args:
+            user_ids: String ids (or ObjectIds); None, invalid and unknown ids are skipped
+
+        Returns:
+            Mapping of string id -> profile for every user that exists
+        """
+        _check_version()
+        profiles: Dict[str, Dict[str, Any]] = {}
+        pending: Dict[str, ObjectId] = {}
+        for user_id in user_ids:
+            if user_id is None:
+                continue
+            key = str(user_id)
+            if key in profiles or key in pending:
+                continue
+            cached = _cache.get(key)
+            if cached is _MISSING:
+                continue
+            if cached is not None:
+                profiles[key] = cached
+                continue
+            try:
+                pending[key] = ObjectId(key)
+            except (InvalidId, TypeError):
+                continue
+
+        if pending:
+            for doc in users_collection.find({"_id": {"$in": list(pending.values())}}, PROFILE_PROJECTION):
+                key = str(doc["_id"])
+                profiles[key] = {
+                    "id": key,
+                    "full_name": doc.get("full_name"),
+                    "email": doc.get("email"),
+                    "role": doc.get("role")
+                }
+                _cache.set(key, profiles[key])
+            for key in pending:
+                if key not in profiles:
+                    _cache.set(key, _MISSING)
+
+        return profiles
+
+    @staticmethod
+    def get(user_id: Any) -> Optional[Dict[str, Any]]:
+        """Profile of a single user, or None if there is no such user"""
+        if user_id is None:
+            return None
+        return UserProfileCache.get_many([user_id]).get(str(user_id))
+
+    @staticmethod
+    def invalidate(user_id: str) -> None:
+        """
+        Record a changed or deleted user
+
+        Bumps the users version, so every worker drops its cached profiles
+        (this one at once, others within VERSION_CHECK_INTERVAL).
+        """
+        _cache.pop(str(user_id))
+        bump_version(USERS_SCOPE)
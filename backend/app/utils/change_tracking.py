@@ -0,0 +1,68 @@
+# backend/app/utils/change_tracking.py
+import os
+import threading
+import time
+from typing import Dict, Tuple
+
+from pymongo import ReturnDocument
+
+from app.config.db import meta_collection
+
+# How long a worker trusts its last read of a version stamp before re-checking
+VERSION_CHECK_INTERVAL = float(os.getenv("VERSION_CHECK_INTERVAL", "1.0"))
+
+# Version scope bumped by every question write (create, update, delete, import)
+QUESTIONS_SCOPE = "questions"
+
+# Version scope bumped by every prompt template write
+PROMPTS_SCOPE = "prompts"
+
+_lock = threading.Lock()
+_versions: Dict[str, Tuple[int, float]] = {}
+
+def get_version(scope: str) -> int:
+    """
+    Current version stamp of a data scope (e.g. "curriculum")
+
+    Stamps live in the meta collection so every worker process sees the same
+    value. Reads are cached per process for VERSION_CHECK_INTERVAL seconds,
+    which bounds both the staleness window and the number of round trips.
+
+    Args:
+        scope: Name of the data scope
+
+    Returns:
+        Version counter (0 if the scope was never written)
+    """
+    now = time.monotonic()
+    with _lock:
+        cached = _versions.get(scope)
+    if cached and now - cached[1] < VERSION_CHECK_INTERVAL:
+        return cached[0]
+
+    doc = meta_collection.find_one({"_id": f"version:{scope}"}, {"version": 1})
+    version = doc["version"] if doc else 0
+    with _lock:
+        _versions[scope] = (version, now)
+    return version
+
+def bump_version(scope: str) -> int:
+    """
+    Increment a scope's version stamp after a write
+
+    Args:
+        scope: Name of the data scope
+
+    Returns:
+        The new version, which is also cached locally so this worker sees its
+        own write immediately
+    """
+    doc = meta_collection.find_one_and_update(
+        {"_id": f"version:{scope}"},
+        {"$inc": {"version": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    with _lock:
+        _versions[scope] = (doc["version"], time.monotonic())
+    return doc["version"]
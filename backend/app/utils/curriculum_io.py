@@ -0,0 +1,127 @@
+# backend/app/utils/curriculum_io.py
+import csv
+import io
+import json
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+from app.utils.hierarchy import LEVELS
+
+RECORD_TYPES = LEVELS + ["question"]
+
+# Question fields carried by import/export records
+QUESTION_FIELDS = ["question_text", "question_type", "options", "correct_answer", "explanation", "difficulty"]
+
+# CSV layout: one path column per level, then node and question fields
+CSV_COLUMNS = LEVELS + ["description", "slug"] + QUESTION_FIELDS
+
+# Separator for list values (options, multiple correct answers) inside a CSV cell
+CSV_LIST_SEPARATOR = "|"
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield lists of at most ``size`` items without materializing the input"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def validate_record(record: Dict[str, Any]) -> None:
+    """
+    Check the type and path of an import record
+
+    A node's path lists the names from its curriculum down to itself; a
+    question's path is the path of its topic.
+
+    Raises:
+        ValueError: If the record is malformed
+    """
+    record_type = record.get("type")
+    if record_type not in RECORD_TYPES:
+        raise ValueError(f"unknown record type {record_type!r}")
+
+    path = record.get("path")
+    depth = len(LEVELS) if record_type == "question" else LEVELS.index(record_type) + 1
+    if not isinstance(path, list) or len(path) != depth or not all(isinstance(name, str) and name for name in path):
+        raise ValueError(f"a {record_type} record needs a path of {depth} non-empty names")
+
+def read_jsonl(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Parse JSON Lines import records lazily
+
+    Every record gets a ``line`` key with its 1-based line number for error
+    reporting; blank lines are skipped.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line_number}: invalid JSON ({e.msg})")
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {line_number}: expected a JSON object")
+        record["line"] = line_number
+        yield record
+
+def read_csv(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Parse CSV import rows lazily into the same records as read_jsonl()
+
+    The record type is the deepest non-empty level column, or "question"
+    when question_text is filled in. List values use ``|`` as separator.
+    """
+    for line_number, row in enumerate(csv.DictReader(lines), start=2):
+        path = []
+        for level in LEVELS:
+            name = (row.get(level) or "").strip()
+            if not name:
+                break
+            path.append(name)
+        if not path:
+            continue
+
+        record = {"path": path, "line": line_number}
+        if (row.get("question_text") or "").strip():
+            record["type"] = "question"
+            for field in QUESTION_FIELDS:
+                value = row.get(field) or None
+                if value and field == "options":
+                    value = value.split(CSV_LIST_SEPARATOR)
+                elif value and field == "correct_answer" and row.get("question_type") == "MultipleAnswer":
+                    value = value.split(CSV_LIST_SEPARATOR)
+                if value is not None:
+                    record[field] = value
+        else:
+            record["type"] = LEVELS[len(path) - 1]
+            for field in ("description", "slug"):
+                if row.get(field):
+                    record[field] = row[field]
+        yield record
+
+def write_jsonl(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Serialize export records as JSON Lines, one string per record"""
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+def write_csv(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Serialize export records as CSV rows (header first), one string per row"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    for record in records:
+        row = dict(zip(LEVELS, record["path"]))
+        for field in CSV_COLUMNS[len(LEVELS):]:
+            value = record.get(field)
+            if isinstance(value, list):
+                value = CSV_LIST_SEPARATOR.join(value)
+            if value is not None:
+                row[field] = value
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
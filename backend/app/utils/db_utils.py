@@ -1,53 +1,81 @@
 # backend/app/utils/db_utils.py
-from typing import Dict, List, Any, Union
+from typing import Any, Callable, List, Tuple
 from bson import ObjectId
-from datetime import datetime
+from datetime import date, datetime
+
+# Values returned unchanged. Datetimes are kept as datetimes: response models
+# take them as they are and FastJSONResponse/jsonable_encoder format them, so
+# turning them into strings here only meant parsing them back later.
+_LEAVES = frozenset({str, int, float, bool, type(None), datetime, date})
+
+def _convert(value: Any) -> Any:
+    """Convert a value that is neither a container nor a plain leaf"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    return value
 
 def transform_object_id(data: Any) -> Any:
     """
     Transform MongoDB document by converting _id fields to id.
-    Works recursively with nested objects and arrays.
-    
+    Works with nested objects and arrays.
+
+    Walks the structure with an explicit stack instead of recursion and
+    dispatches on the exact type of each value, so plain scalars are copied
+    with a single set lookup. A list of documents is converted in one pass.
+
     Args:
         data: MongoDB document or list of documents, or any nested structure
              containing ObjectId values
-    
+
     Returns:
         Transformed data with _id -> id and ObjectId -> str
     """
-    if data is None:
-        return None
-    
-    if isinstance(data, list):
-        return [transform_object_id(item) for item in data]
-    
-    if isinstance(data, dict):
-        result = {}
-        for key, value in data.items():
-            if key == "_id":
-                # Convert _id field to id
-                result["id"] = str(value)
-            elif isinstance(value, ObjectId):
-                # Convert ObjectId values to strings
-                result[key] = str(value)
-            elif isinstance(value, dict) or isinstance(value, list):
-                # Recursively transform nested objects and arrays
-                result[key] = transform_object_id(value)
-            elif isinstance(value, datetime):
-                # Convert datetimes to ISO format strings
-                result[key] = value.isoformat()
-            else:
-                # Keep other values as is
-                result[key] = value
-        return result
-    
-    # Convert ObjectId to string if encountered directly
-    if isinstance(data, ObjectId):
-        return str(data)
-    
-    # Convert datetime to ISO format if encountered directly
-    if isinstance(data, datetime):
-        return data.isoformat()
-    
-    # Return other types unchanged
-    return data
\ No newline at end of file
+    if not isinstance(data, (dict, list, tuple)):
+        return _convert(data)
+
+    leaves = _LEAVES
+    stack: List[Tuple[Any, Any]] = []
+    pop = stack.pop
+    push = stack.append
+    root = _nest(data, push)
+
+    while stack:
+        source, target = pop()
+        if isinstance(source, dict):
+            for key, value in source.items():
+                kind = type(value)
+                if key == "_id":
+                    target["id"] = str(value)
+                elif kind in leaves:
+                    target[key] = value
+                elif kind is ObjectId:
+                    target[key] = str(value)
+                elif kind is list and leaves.issuperset(map(type, value)):
+                    # Lists of plain values (options, tags, search terms) are copied without a walk
+                    target[key] = value[:]
+                else:
+                    target[key] = _nest(value, push)
+        else:
+            append = target.append
+            for value in source:
+                kind = type(value)
+                if kind in leaves:
+                    append(value)
+                elif kind is ObjectId:
+                    append(str(value))
+                else:
+                    append(_nest(value, push))
+
+    return root
+
+def _nest(value: Any, push: Callable) -> Any:
+    """Create the empty container for a nested dict or list and queue it, or convert a scalar"""
+    if isinstance(value, dict):
+        child: Any = {}
+        push((value, child))
+        return child
+    if isinstance(value, (list, tuple)):
+        child = []
+        push((value, child))
+        return child
+    return _convert(value)
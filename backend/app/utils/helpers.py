@@ -1,11 +1,11 @@
 # backend/app/utils/helpers.py
 import re
 import unicodedata
-from typing import Dict, List, Any, Optional, Union
-from datetime import datetime
+from typing import Dict, Iterable, List, Any, Optional, Set, Union
 import json
 import hashlib
 import uuid
+from pymongo.errors import DuplicateKeyError
 
 def slugify(text: str) -> str:
     """
@@ -77,29 +77,103 @@ def create_unique_slug(collection, name: str) -> str:
     Returns:
         A unique slug for the collection
     """
-    # First try without random suffix
-    base_slug = generate_slug(name, add_random=False)
+    return allocate_unique_slugs(collection, [name])[0]
+
+# Number of slug bases looked up per query by allocate_unique_slugs
+SLUG_QUERY_BATCH = 500
+
+def allocate_unique_slugs(collection, names: List[str], reserved: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Allocate unique slugs for a batch of names
     
-    # Check if it exists
-    if not check_slug_exists(collection, base_slug):
-        return base_slug
+    All existing slugs sharing a base with any of the names (``base`` and
+    ``base-<n>``) are fetched with one anchored-regex query per batch of
+    bases, and collisions are resolved in memory with numeric suffixes, so
+    the cost does not grow with the number of candidates tried.
     
-    # If it exists, add a random suffix
-    unique_slug = generate_slug(name, add_random=True)
+    Args:
+        collection: MongoDB collection the slugs must be unique in
+        names: Names to create slugs from
+        reserved: Slugs to treat as taken (e.g. explicit slugs in the same batch)
+        
+    Returns:
+        One slug per name, in order
+    """
+    bases = [generate_slug(name, add_random=False) or "item" for name in names]
+    taken = set(reserved or ())
     
-    # In the rare case that even this exists, keep trying with new UUIDs
-    attempt = 1
-    max_attempts = 5
-    while check_slug_exists(collection, unique_slug) and attempt < max_attempts:
-        unique_slug = generate_slug(name, add_random=True)
-        attempt += 1
+    distinct_bases = list(dict.fromkeys(bases))
+    for start in range(0, len(distinct_bases), SLUG_QUERY_BATCH):
+        patterns = [
+            re.compile(f"^{re.escape(base)}(-[0-9]+)?$")
+            for base in distinct_bases[start:start + SLUG_QUERY_BATCH]
+        ]
+        for doc in collection.find({"slug": {"$in": patterns}}, {"slug": 1, "_id": 0}):
+            taken.add(doc["slug"])
     
-    # If we still couldn't find a unique slug, append a timestamp
-    if attempt >= max_attempts:
-        timestamp = int(datetime.now().timestamp())
-        unique_slug = f"{base_slug}-{timestamp}"
+    return resolve_slugs(bases, taken)
+
+def resolve_slugs(bases: List[str], taken: Set[str]) -> List[str]:
+    """
+    Resolve slug collisions in memory
+    
+    Each base is used as is when free, otherwise with the lowest free
+    numeric suffix (``base-2``, ``base-3``, ...). Allocated slugs are added
+    to ``taken``, so repeated bases within the batch stay unique too.
     
-    return unique_slug
+    Args:
+        bases: Base slugs, one per name
+        taken: Slugs already in use
+        
+    Returns:
+        One unique slug per base, in order
+    """
+    slugs = []
+    next_suffix = {}
+    for base in bases:
+        slug = base
+        suffix = next_suffix.get(base, 2)
+        while slug in taken:
+            slug = f"{base}-{suffix}"
+            suffix += 1
+        next_suffix[base] = suffix
+        taken.add(slug)
+        slugs.append(slug)
+    
+    return slugs
+
+# Attempts made by insert_with_unique_slug before giving up
+SLUG_INSERT_ATTEMPTS = 3
+
+def is_slug_conflict(error: DuplicateKeyError) -> bool:
+    """Whether a duplicate key error was raised by the unique slug index"""
+    details = error.details or {}
+    return "slug" in (details.get("keyPattern") or details.get("keyValue") or {})
+
+def insert_with_unique_slug(collection, doc: Dict[str, Any], regenerate: bool = True):
+    """
+    Insert a document, re-allocating its slug if the unique index rejects it
+    
+    The slug is allocated before the insert without holding any lock, so a
+    concurrent insert may claim it first; the unique slug index catches
+    that and a fresh slug is allocated from the document's name.
+    
+    Args:
+        collection: MongoDB collection to insert into
+        doc: Document with ``name`` and ``slug``
+        regenerate: Whether the slug may be replaced (False for explicit slugs)
+        
+    Returns:
+        The pymongo InsertOneResult
+    """
+    for attempt in range(1, SLUG_INSERT_ATTEMPTS + 1):
+        try:
+            return collection.insert_one(doc)
+        except DuplicateKeyError as e:
+            if not regenerate or not is_slug_conflict(e) or attempt == SLUG_INSERT_ATTEMPTS:
+                raise
+            doc.pop("_id", None)
+            doc["slug"] = create_unique_slug(collection, doc["name"])
 
 def sanitize_string(text: str) -> str:
     """
@@ -0,0 +1,295 @@
+# backend/app/utils/hierarchy.py
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from bson import ObjectId
+
+# Hierarchy levels from the root down, and the field each level uses to point at its parent
+LEVELS = ["curriculum", "subject", "course", "unit", "topic"]
+PARENT_FIELD = {
+    "subject": "curriculum_id",
+    "course": "subject_id",
+    "unit": "course_id",
+    "topic": "unit_id"
+}
+
+# Collection of each level; it is also the key children are nested under in "full" responses
+COLLECTION_NAMES = {
+    "curriculum": "curriculum",
+    "subject": "subjects",
+    "course": "courses",
+    "unit": "units",
+    "topic": "topics"
+}
+CHILD_LEVEL = dict(zip(LEVELS, LEVELS[1:]))
+PARENT_LEVEL = dict(zip(LEVELS[1:], LEVELS))
+
+# Denormalized ancestor ids carried by topics and questions (and catalog entries)
+ANCESTOR_FIELDS = ["curriculum_id", "subject_id", "course_id", "unit_id"]
+
+def ancestor_ids(doc: Dict[str, Any]) -> Dict[str, str]:
+    """The ancestor id fields present on a document, e.g. to copy a topic's onto its questions"""
+    return {field: doc[field] for field in ANCESTOR_FIELDS if doc.get(field)}
+
+def id_or_slug_match(id_or_slug: str) -> Dict[str, Any]:
+    """Filter matching a node by ObjectId or by slug"""
+    if ObjectId.is_valid(id_or_slug):
+        return {"$or": [{"_id": ObjectId(id_or_slug)}, {"slug": id_or_slug}]}
+    return {"slug": id_or_slug}
+
+def _descend(path: List[str]) -> List[Dict[str, Any]]:
+    """
+    Stages turning root documents into one document per node of path[-1]
+
+    Each hop looks up the children of the current documents and unwinds them,
+    so every intermediate document only ever holds one node's children and
+    large subtrees never approach the 16MB document limit.
+    """
+    stages = []
+    for depth, child_type in enumerate(path[1:], start=1):
+        last = depth == len(path) - 1
+        stages += [
+            {"$project": {"_node_id": {"$toString": "$_id"}}},
+            {"$lookup": {
+                "from": COLLECTION_NAMES[child_type],
+                "localField": "_node_id",
+                "foreignField": PARENT_FIELD[child_type],
+                "pipeline": [{"$sort": {"_id": 1}}] + ([] if last else [{"$project": {"_id": 1}}]),
+                "as": "_children"
+            }},
+            {"$unwind": "$_children"},
+            {"$replaceRoot": {"newRoot": "$_children"}}
+        ]
+    stages.append({"$addFields": {"_level": path[-1]}})
+    return stages
+
+def build_subtree_pipeline(node_type: str, id_or_slug: str) -> List[Dict[str, Any]]:
+    """
+    Build one aggregation returning a node and all of its descendants
+
+    Runs against the node's own collection. The root comes first, then one
+    $unionWith branch per level below it; documents carry a ``_level`` field
+    and are nested by assemble_subtree().
+
+    Args:
+        node_type: Level of the root node
+        id_or_slug: Root id or slug
+
+    Returns:
+        Aggregation pipeline
+    """
+    match = {"$match": id_or_slug_match(id_or_slug)}
+    pipeline = [match, {"$addFields": {"_level": node_type}}]
+
+    path = [node_type]
+    while path[-1] in CHILD_LEVEL:
+        path.append(CHILD_LEVEL[path[-1]])
+        pipeline.append({"$unionWith": {
+            "coll": COLLECTION_NAMES[node_type],
+            "pipeline": [match] + _descend(path)
+        }})
+
+    return pipeline
+
+def select_fields(node_type: str, doc: Dict[str, Any], fields: Optional[Dict[str, List[str]]]) -> Dict[str, Any]:
+    """
+    Copy of a node with only _id and the given fields of its level
+
+    Fields missing from the document are set to None, the way a response
+    model would send them. Without ``fields`` the whole document is copied.
+    """
+    if fields is None:
+        return dict(doc)
+    return {"_id": doc["_id"], **{field: doc.get(field) for field in fields[node_type]}}
+
+def assemble_subtree(
+    node_type: str,
+    id_or_slug: str,
+    docs: Iterable[Dict[str, Any]],
+    fields: Optional[Dict[str, List[str]]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Nest the flat output of build_subtree_pipeline()
+
+    The root is chosen the way get_by_id_or_slug resolves it (id before slug).
+
+    Args:
+        node_type: Level of the root node
+        id_or_slug: Root id or slug
+        docs: Aggregation results
+        fields: Fields to keep per level (see select_fields), or None for whole documents
+
+    Returns:
+        Root document with children under subjects/courses/units/topics, or
+        None if the root does not exist
+    """
+    roots = []
+    children = defaultdict(list)
+    for doc in docs:
+        level = doc.pop("_level")
+        if level == node_type:
+            roots.append(doc)
+        else:
+            children[(level, doc[PARENT_FIELD[level]])].append(doc)
+
+    root = next((doc for doc in roots if str(doc["_id"]) == id_or_slug), None) or \
+        next((doc for doc in roots if doc.get("slug") == id_or_slug), None)
+    if not root:
+        return None
+
+    def attach(level: str, doc: Dict[str, Any]) -> Dict[str, Any]:
+        node = select_fields(level, doc, fields)
+        child_level = CHILD_LEVEL.get(level)
+        if child_level:
+            node[COLLECTION_NAMES[child_level]] = [
+                attach(child_level, child) for child in children[(child_level, str(doc["_id"]))]
+            ]
+        return node
+
+    return attach(node_type, root)
+
+def rollup_question_stats(
+    node_type: str,
+    node: Dict[str, Any],
+    topic_counts: Dict[str, Dict[tuple, int]]
+) -> Dict[str, Any]:
+    """
+    Annotate a nested subtree in place with question counts at every node
+
+    Topic counts are summed bottom-up, so each node's ``question_stats``
+    covers its whole subtree.
+
+    Args:
+        node_type: Level of ``node``
+        node: Subtree as returned by CurriculumTree.subtree() or assemble_subtree()
+        topic_counts: topic id -> {(question_type, difficulty): count}
+
+    Returns:
+        The node's stats: question_count, by_type and by_difficulty
+    """
+    stats = {"question_count": 0, "by_type": defaultdict(int), "by_difficulty": defaultdict(int)}
+
+    child_level = CHILD_LEVEL.get(node_type)
+    if child_level:
+        for child in node.get(COLLECTION_NAMES[child_level], []):
+            child_stats = rollup_question_stats(child_level, child, topic_counts)
+            stats["question_count"] += child_stats["question_count"]
+            for field in ("by_type", "by_difficulty"):
+                for key, count in child_stats[field].items():
+                    stats[field][key] += count
+    else:
+        for (question_type, difficulty), count in topic_counts.get(str(node["_id"]), {}).items():
+            stats["question_count"] += count
+            stats["by_type"][question_type] += count
+            stats["by_difficulty"][difficulty] += count
+
+    stats["by_type"] = dict(stats["by_type"])
+    stats["by_difficulty"] = dict(stats["by_difficulty"])
+    node["question_stats"] = stats
+    return stats
+
+class CurriculumTree:
+    """
+    Snapshot of the whole curriculum hierarchy
+
+    Nodes are indexed by id and by (type, slug), with parent pointers and
+    ordered children lists, so lookups and subtree walks never touch the
+    database. Stored documents are never handed out directly: subtree()
+    and path() return fresh dicts.
+    """
+
+    def __init__(self, version: int):
+        self.version = version
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.types: Dict[str, str] = {}
+        self.parents: Dict[str, Optional[str]] = {}
+        self.children: Dict[str, List[str]] = {}
+        self.slugs: Dict[str, Dict[str, str]] = {node_type: {} for node_type in LEVELS}
+
+    @classmethod
+    def load(cls, version: int, collections: Dict[str, Any]) -> "CurriculumTree":
+        """Read every level top-down from {level: collection} (one query per level) and link the nodes"""
+        tree = cls(version)
+        for node_type in LEVELS:
+            for doc in collections[node_type].find().sort("_id", 1):
+                tree.upsert(node_type, doc)
+        return tree
+
+    def upsert(self, node_type: str, doc: Dict[str, Any]) -> None:
+        """Add a node or replace it in place, re-linking it if its parent changed"""
+        node_id = str(doc["_id"])
+        parent_field = PARENT_FIELD.get(node_type)
+        parent_id = doc.get(parent_field) if parent_field else None
+
+        if parent_field and parent_id not in self.nodes:
+            # Orphaned node (its parent is gone), unreachable from any subtree
+            self.remove(node_id)
+            return
+
+        previous = self.nodes.get(node_id)
+        linked = False
+        if previous is not None:
+            if previous.get("slug"):
+                self.slugs[node_type].pop(previous["slug"], None)
+            old_parent = self.parents.get(node_id)
+            linked = old_parent == parent_id
+            if not linked and node_id in self.children.get(old_parent, []):
+                self.children[old_parent].remove(node_id)
+
+        self.nodes[node_id] = doc
+        self.types[node_id] = node_type
+        self.parents[node_id] = parent_id
+        self.children.setdefault(node_id, [])
+        if doc.get("slug"):
+            self.slugs[node_type][doc["slug"]] = node_id
+        if parent_id is not None and not linked:
+            self.children[parent_id].append(node_id)
+
+    def remove(self, node_id: str) -> None:
+        """Drop a node and its whole subtree"""
+        if node_id not in self.nodes:
+            return
+        parent_id = self.parents.get(node_id)
+        if parent_id in self.children and node_id in self.children[parent_id]:
+            self.children[parent_id].remove(node_id)
+
+        stack = [node_id]
+        while stack:
+            current = stack.pop()
+            stack.extend(self.children.pop(current, []))
+            doc = self.nodes.pop(current, None)
+            node_type = self.types.pop(current, None)
+            self.parents.pop(current, None)
+            if doc and doc.get("slug"):
+                self.slugs[node_type].pop(doc["slug"], None)
+
+    def resolve(self, node_type: str, id_or_slug: str) -> Optional[Dict[str, Any]]:
+        """Find a node of the given type by id, then by slug (same order as get_by_id_or_slug)"""
+        if self.types.get(id_or_slug) == node_type:
+            return self.nodes[id_or_slug]
+        node_id = self.slugs[node_type].get(id_or_slug)
+        return self.nodes[node_id] if node_id else None
+
+    def subtree(self, node_id: str, fields: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+        """
+        Copy of a node with its descendants nested under subjects/courses/units/topics
+
+        With ``fields``, each node keeps only _id and its level's fields (see select_fields).
+        """
+        node_type = self.types[node_id]
+        node = select_fields(node_type, self.nodes[node_id], fields)
+        child_level = CHILD_LEVEL.get(node_type)
+        if child_level:
+            node[COLLECTION_NAMES[child_level]] = [
+                self.subtree(child_id, fields) for child_id in self.children[node_id]
+            ]
+        return node
+
+    def path(self, node_id: str) -> Dict[str, Dict[str, Any]]:
+        """Ancestors of a node (and the node itself) keyed by type"""
+        path = {}
+        current = node_id
+        while current is not None:
+            path[self.types[current]] = self.nodes[current]
+            current = self.parents.get(current)
+        return path
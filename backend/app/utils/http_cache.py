@@ -0,0 +1,128 @@
+# backend/app/utils/http_cache.py
+import hashlib
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, List, Optional, Sequence, Tuple
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.utils.cache import TTLCache
+from app.utils.server_timing import record_timing
+
+# Server-side response cache: entries per process, seconds an entry is kept, largest body cached
+HTTP_CACHE_SIZE = int(os.getenv("HTTP_CACHE_SIZE", "1000"))
+HTTP_CACHE_TTL = float(os.getenv("HTTP_CACHE_TTL", "300"))
+HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(2 * 1024 * 1024)))
+
+# Headers of the handler's response that are not replayed from the cache
+_UNCACHED_HEADERS = {"content-length", "server-timing", "etag", "cache-control"}
+
+@dataclass(frozen=True)
+class CacheRule:
+    """
+    A read-mostly GET route served through the HTTP cache
+
+    Attributes:
+        pattern: Regular expression the full request path must match
+        scopes: Version scopes (see change_tracking) whose writes change the response
+        roles: Roles allowed to read the route; other callers go to the handler,
+            which produces the usual 401/403
+        cache_control: Cache-Control header sent with the response
+    """
+    pattern: str
+    scopes: Tuple[str, ...]
+    roles: FrozenSet[str]
+    cache_control: str = "private, no-cache"
+
+    def matches(self, path: str) -> bool:
+        return re.fullmatch(self.pattern, path) is not None
+
+def compute_etag(path: str, query: Sequence[Tuple[str, str]], versions: Sequence[int]) -> str:
+    """
+    Strong ETag for a URL at given scope versions
+
+    Every write to a scope bumps its version, so the same URL at the same
+    versions always renders the same body and the tag can be computed (and
+    compared) without running the handler. Workers agree on the tag since
+    the versions are shared.
+    """
+    canonical = f"{path}?{'&'.join(f'{key}={value}' for key, value in sorted(query))}|{','.join(map(str, versions))}"
+    return '"' + hashlib.sha1(canonical.encode("utf-8")).hexdigest() + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header lists the tag (weak comparison, as RFC 9110 requires)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in tags)
+
+class HTTPCacheMiddleware(BaseHTTPMiddleware):
+    """
+    Conditional GET and response caching for the routes in ``rules``
+
+    For an authorized GET on a cached route the ETag is derived from the
+    route's version stamps. A matching If-None-Match is answered with 304
+    straight away; otherwise a body cached under the same tag is replayed,
+    and only on a miss does the handler run (its 200 response is stored).
+    Writes invalidate by bumping their scope's version, which changes the
+    tag; old entries are no longer looked up and simply age out. Versions
+    are read through ``versions`` (change_tracking.get_version in the app),
+    which caches them per worker for VERSION_CHECK_INTERVAL, so another
+    worker may still answer with the previous body (or a 304) for that long
+    after a write.
+
+    Register it before GZip and CORS so it sits inside them: cached bodies
+    are stored uncompressed and replies still get CORS headers.
+    """
+
+    def __init__(
+        self,
+        app,
+        rules: List[CacheRule],
+        authorize: Callable[[Request], Optional[str]],
+        versions: Callable[[str], int]
+    ):
+        super().__init__(app)
+        self.rules = rules
+        self.authorize = authorize
+        self.versions = versions
+        self.responses = TTLCache(HTTP_CACHE_SIZE, HTTP_CACHE_TTL)
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method != "GET":
+            return await call_next(request)
+        path = request.url.path
+        rule = next((rule for rule in self.rules if rule.matches(path)), None)
+        if rule is None or self.authorize(request) not in rule.roles:
+            return await call_next(request)
+
+        start = time.perf_counter()
+        etag = compute_etag(path, request.query_params.multi_items(), [self.versions(scope) for scope in rule.scopes])
+        headers = {"ETag": etag, "Cache-Control": rule.cache_control}
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            record_timing(request, "http-cache", time.perf_counter() - start, "not modified")
+            return Response(status_code=304, headers=headers)
+
+        cached = self.responses.get(etag)
+        if cached is not None:
+            body, cached_headers = cached
+            record_timing(request, "http-cache", time.perf_counter() - start, "hit")
+            return Response(body, headers={**cached_headers, **headers})
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        kept_headers = {
+            key: value for key, value in response.headers.items()
+            if key.lower() not in _UNCACHED_HEADERS
+        }
+        if len(body) <= HTTP_CACHE_MAX_BYTES:
+            self.responses.set(etag, (body, kept_headers))
+        return Response(body, headers={**kept_headers, **headers}, background=response.background)
@@ -0,0 +1,124 @@
+# backend/app/utils/loaders.py
+from typing import Any, Dict, Iterable, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.config.db import (
+    topics_collection, units_collection, courses_collection,
+    subjects_collection, curriculum_collection
+)
+
+class DocumentLoader:
+    """
+    DataLoader-style batch loader for documents referenced by string id.
+
+    Callers collect the ids they need and hand them over in one go; every id
+    that has not been seen yet is fetched with a single ``$in`` query and the
+    result (including misses) is memoized. Create one loader per request so
+    repeated lookups within that request never hit the database twice.
+    """
+
+    def __init__(self, collection, projection: Optional[Dict[str, Any]] = None):
+        self.collection = collection
+        self.projection = projection
+        self._cache: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def load_many(self, ids: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load documents for a batch of ids
+
+        Args:
+            ids: String ids (or ObjectIds); invalid and unknown ids are skipped
+
+        Returns:
+            Mapping of string id -> document for every id that exists
+        """
+        keys = [str(id_value) for id_value in ids if id_value is not None]
+
+        pending = {}
+        for key in keys:
+            if key in self._cache or key in pending:
+                continue
+            try:
+                pending[key] = ObjectId(key)
+            except (InvalidId, TypeError):
+                self._cache[key] = None
+
+        if pending:
+            for doc in self.collection.find({"_id": {"$in": list(pending.values())}}, self.projection):
+                self._cache[str(doc["_id"])] = doc
+            for key in pending:
+                self._cache.setdefault(key, None)
+
+        return {key: self._cache[key] for key in keys if self._cache.get(key) is not None}
+
+    def load(self, id_value: Any) -> Optional[Dict[str, Any]]:
+        """Load a single document, going through the same batch cache"""
+        if id_value is None:
+            return None
+        return self.load_many([id_value]).get(str(id_value))
+
+class CurriculumLoaders:
+    """
+    Per-request set of loaders for the curriculum hierarchy.
+
+    Only the fields the services put into their responses are fetched. User
+    references go through UserProfileCache instead, which is shared across
+    requests.
+    """
+
+    def __init__(self):
+        self.topics = DocumentLoader(topics_collection, {"name": 1, "description": 1, "unit_id": 1})
+        self.units = DocumentLoader(units_collection, {"name": 1, "course_id": 1})
+        self.courses = DocumentLoader(courses_collection, {"name": 1, "subject_id": 1})
+        self.subjects = DocumentLoader(subjects_collection, {"name": 1, "curriculum_id": 1})
+        self.curricula = DocumentLoader(curriculum_collection, {"name": 1})
+
+    def load_topic_chain(self, topic_ids: Iterable[Any], depth: str = "unit") -> Dict[str, Dict[str, Any]]:
+        """
+        Load topics together with their parent units (and optionally courses)
+
+        One query per level regardless of how many topics are requested.
+
+        Args:
+            topic_ids: Topic ids to load
+            depth: "topic", "unit" or "course" - how far up to prefetch
+
+        Returns:
+            Mapping of topic id -> topic document
+        """
+        topics = self.topics.load_many(topic_ids)
+        if depth in ("unit", "course"):
+            units = self.units.load_many(topic["unit_id"] for topic in topics.values() if topic.get("unit_id"))
+            if depth == "course":
+                self.courses.load_many(unit["course_id"] for unit in units.values() if unit.get("course_id"))
+        return topics
+
+    def topic_info(self, topic_id: Any) -> Optional[Dict[str, str]]:
+        """Compact {id, name} reference used in question listings"""
+        topic = self.topics.load(topic_id)
+        if not topic:
+            return None
+        return {
+            "id": str(topic["_id"]),
+            "name": topic["name"]
+        }
+
+    def unit_info(self, unit_id: Any, with_course: bool = False) -> Optional[Dict[str, Any]]:
+        """Compact {id, name} unit reference, optionally with its course"""
+        unit = self.units.load(unit_id)
+        if not unit:
+            return None
+        info = {
+            "id": str(unit["_id"]),
+            "name": unit["name"]
+        }
+        if with_course:
+            course = self.courses.load(unit.get("course_id"))
+            if course:
+                info["course"] = {
+                    "id": str(course["_id"]),
+                    "name": course["name"]
+                }
+        return info
@@ -0,0 +1,244 @@
+# backend/app/utils/metrics.py
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import monitoring
+
+logger = logging.getLogger(__name__)
+
+# Requests slower than this (milliseconds) are logged with their query shapes
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "500"))
+
+# Distinct query shapes remembered per request for the slow-request log
+MAX_QUERY_SHAPES = 50
+
+# Upper bounds (seconds) of the request duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Command document fields describing what a command touches, by command name
+_FILTER_FIELDS = {
+    "find": ("filter", "sort", "projection"),
+    "aggregate": ("pipeline",),
+    "count": ("query",),
+    "distinct": ("key", "query"),
+    "update": ("updates",),
+    "delete": ("deletes",),
+    "findAndModify": ("query", "sort"),
+}
+
+class RequestStats:
+    """Work done while handling one request"""
+
+    __slots__ = ("started", "db_count", "db_seconds", "llm_count", "llm_seconds",
+                 "prompt_tokens", "completion_tokens", "serialize_seconds", "query_shapes")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_count = 0
+        self.db_seconds = 0.0
+        self.llm_count = 0
+        self.llm_seconds = 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.serialize_seconds = 0.0
+        # shape -> [count, seconds]
+        self.query_shapes: Dict[str, List[float]] = {}
+
+    def add_query(self, shape: str, seconds: float) -> None:
+        self.db_count += 1
+        self.db_seconds += seconds
+        entry = self.query_shapes.get(shape)
+        if entry is not None:
+            entry[0] += 1
+            entry[1] += seconds
+        elif len(self.query_shapes) < MAX_QUERY_SHAPES:
+            self.query_shapes[shape] = [1, seconds]
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+def begin_request() -> RequestStats:
+    """Start collecting stats for the request handled in the current context"""
+    stats = RequestStats()
+    _current.set(stats)
+    return stats
+
+def current_stats() -> Optional[RequestStats]:
+    """Stats of the request being handled, or None outside a request"""
+    return _current.get()
+
+def query_shape(value: Any) -> Any:
+    """A filter/pipeline with every literal replaced by "?", so N+1 loops collapse into one shape"""
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = [query_shape(item) for item in value]
+        # $in lists and the like: one entry stands for all of them
+        return shapes[:1] if all(shape == "?" for shape in shapes) else shapes
+    return "?"
+
+def command_shape(command_name: str, command: Dict[str, Any]) -> str:
+    """Command name, collection and literal-free arguments, e.g. find topics {'unit_id': '?'}"""
+    collection = command.get(command_name)
+    parts = [command_name, str(collection) if isinstance(collection, str) else ""]
+    for field in _FILTER_FIELDS.get(command_name, ()):
+        if field in command:
+            parts.append(f"{field}={query_shape(command[field])}")
+    return " ".join(part for part in parts if part)
+
+class CommandMetrics(monitoring.CommandListener):
+    """
+    pymongo listener attributing command time to the current request
+
+    Pass it to MongoClient(event_listeners=[...]). Handlers call pymongo
+    synchronously, so the listener runs in the request's context and sees
+    its RequestStats.
+    """
+
+    def __init__(self):
+        self._shapes: Dict[Tuple[int, Any], str] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event) -> None:
+        if _current.get() is None:
+            return
+        shape = command_shape(event.command_name, event.command)
+        with self._lock:
+            self._shapes[(event.request_id, event.connection_id)] = shape
+
+    def succeeded(self, event) -> None:
+        self._finish(event)
+
+    def failed(self, event) -> None:
+        self._finish(event)
+
+    def _finish(self, event) -> None:
+        with self._lock:
+            shape = self._shapes.pop((event.request_id, event.connection_id), None)
+        seconds = event.duration_micros / 1e6
+        registry.inc("mongo_commands_total", 1, command=event.command_name)
+        registry.inc("mongo_command_seconds_total", seconds, command=event.command_name)
+        stats = _current.get()
+        if stats is not None:
+            stats.add_query(shape or event.command_name, seconds)
+
+def record_llm_call(seconds: float, prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+    """Record a language model call (time and token usage)"""
+    registry.inc("llm_requests_total", 1)
+    registry.inc("llm_request_seconds_total", seconds)
+    registry.inc("llm_tokens_total", prompt_tokens, kind="prompt")
+    registry.inc("llm_tokens_total", completion_tokens, kind="completion")
+    stats = _current.get()
+    if stats is not None:
+        stats.llm_count += 1
+        stats.llm_seconds += seconds
+        stats.prompt_tokens += prompt_tokens
+        stats.completion_tokens += completion_tokens
+
+def record_serialization(seconds: float) -> None:
+    """Record time spent rendering a response body"""
+    registry.inc("response_serialization_seconds_total", seconds)
+    stats = _current.get()
+    if stats is not None:
+        stats.serialize_seconds += seconds
+
+def finish_request(stats: RequestStats, method: str, route: str, status_code: int) -> float:
+    """
+    Add a finished request to the metrics and log it if it was slow
+
+    Args:
+        stats: The request's stats from begin_request
+        method: HTTP method
+        route: Route template (e.g. /api/topics/{topic_id_or_slug}), keeping label cardinality low
+        status_code: Response status
+
+    Returns:
+        Wall time of the request in seconds
+    """
+    seconds = time.perf_counter() - stats.started
+    registry.inc("http_requests_total", 1, method=method, route=route, status=str(status_code))
+    registry.observe("http_request_duration_seconds", seconds, method=method, route=route)
+    registry.inc("http_request_mongo_commands_total", stats.db_count, method=method, route=route)
+
+    if seconds * 1000 >= SLOW_REQUEST_MS:
+        shapes = sorted(stats.query_shapes.items(), key=lambda item: item[1][1], reverse=True)
+        logger.warning(
+            "Slow request %s %s: %.0fms, %d mongo commands (%.0fms), %d llm calls (%.0fms), serialize %.0fms%s",
+            method, route, seconds * 1000, stats.db_count, stats.db_seconds * 1000,
+            stats.llm_count, stats.llm_seconds * 1000, stats.serialize_seconds * 1000,
+            "".join(f"\n  {count:.0f}x {total * 1000:7.1f}ms {shape}" for shape, (count, total) in shapes[:10])
+        )
+    return seconds
+
+class MetricsRegistry:
+    """
+    Per-process counters and histograms rendered in the Prometheus text format
+
+    Each worker keeps its own values; scrape every worker (or run one) to get
+    the whole picture.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DURATION_BUCKETS):
+        self.buckets = buckets
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        # (name, labels) -> [bucket counts..., sum, count]
+        self._histograms: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0.0] * (len(self.buckets) + 2)
+            index = bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                histogram[index] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((key, list(values)) for key, values in self._histograms.items())
+
+        lines = []
+        typed = set()
+        for (name, labels), value in counters:
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{_labels(labels)} {value:g}")
+
+        for (name, labels), values in histograms:
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(labels + (('le', f'{bound:g}'),))} {cumulative:g}")
+            lines.append(f"{name}_bucket{_labels(labels + (('le', '+Inf'),))} {values[-1]:g}")
+            lines.append(f"{name}_sum{_labels(labels)} {values[-2]:g}")
+            lines.append(f"{name}_count{_labels(labels)} {values[-1]:g}")
+        return "\n".join(lines) + "\n"
+
+def _labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+registry = MetricsRegistry()
@@ -0,0 +1,115 @@
+# backend/app/utils/pagination.py
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, Response, status
+
+# Header used to hand the opaque cursor for the next page back to the client.
+# List endpoints keep returning plain JSON arrays for compatibility.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(last_id: ObjectId) -> str:
+    """
+    Encode the _id of the last document on a page into an opaque cursor
+
+    Args:
+        last_id: ObjectId of the last document returned
+
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(last_id.binary).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> ObjectId:
+    """
+    Decode an opaque cursor back into the ObjectId it points after
+
+    Args:
+        cursor: Cursor string previously produced by encode_cursor
+
+    Returns:
+        The ObjectId to continue after
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return ObjectId(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, InvalidId, TypeError, UnicodeEncodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+def paginate(
+    collection,
+    query: Dict[str, Any],
+    limit: int,
+    skip: int = 0,
+    cursor: Optional[str] = None,
+    projection: Optional[Dict[str, Any]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch one page of documents in stable _id order
+
+    When a cursor is given the page starts right after the document it points
+    to (keyset pagination, served straight from the _id index). Otherwise the
+    legacy skip offset is used. Either way a cursor for the following page is
+    returned, so skip-based clients can switch over at any point.
+
+    Args:
+        collection: MongoDB collection to read from
+        query: Filter to apply
+        limit: Maximum number of documents to return
+        skip: Offset used when no cursor is provided
+        cursor: Opaque cursor from a previous page
+        projection: Optional projection passed to find()
+
+    Returns:
+        Tuple of (documents, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if cursor:
+        after_id = decode_cursor(cursor)
+        keyset = {"_id": {"$gt": after_id}}
+        query = {"$and": [query, keyset]} if query else keyset
+        documents = collection.find(query, projection).sort("_id", 1).limit(limit + 1)
+    else:
+        documents = collection.find(query, projection).sort("_id", 1).skip(skip).limit(limit + 1)
+
+    documents = list(documents)
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        next_cursor = encode_cursor(documents[-1]["_id"])
+
+    return documents, next_cursor
+
+def paginate_response(
+    collection,
+    query: Dict[str, Any],
+    response: Response,
+    limit: int,
+    skip: int = 0,
+    cursor: Optional[str] = None,
+    projection: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Route-level wrapper around paginate() that reports a bad cursor as a 400
+    and exposes the next cursor through the X-Next-Cursor response header
+    """
+    try:
+        documents, next_cursor = paginate(collection, query, limit, skip, cursor, projection)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return documents
@@ -0,0 +1,86 @@
+# backend/app/utils/projections.py
+from typing import Dict, Iterable, List, Type
+
+from pydantic import BaseModel
+
+from app.models.curriculum import CurriculumOut, SubjectOut, CourseOut, UnitOut, TopicOut
+from app.models.question import QuestionOut
+from app.models.user import UserOut
+
+def projection_from_model(model: Type[BaseModel], exclude: Iterable[str] = ("id",)) -> Dict[str, int]:
+    """
+    Build a MongoDB projection that returns only the fields a response model serializes
+
+    Args:
+        model: Pydantic response model
+        exclude: Model fields that are not stored under the same name
+                 (``id`` comes from ``_id``, which MongoDB always returns)
+
+    Returns:
+        Inclusion projection for find() or $project
+    """
+    excluded = set(exclude)
+    return {name: 1 for name in model.model_fields if name not in excluded}
+
+def projection_from_fields(*fields: str) -> Dict[str, int]:
+    """Build an inclusion projection from a list of stored field names"""
+    return {field: 1 for field in fields}
+
+# Question documents also carry ai_prompt, raw_ai_response and content_hash,
+# which are never returned to clients. Each spec below lists exactly the
+# fields read by the handler or service it is named after.
+
+# GET /questions, GET /questions/{id} and the admin dashboard's recent questions
+QUESTION_OUT_PROJECTION = projection_from_model(QuestionOut)
+
+# GET /users and the admin dashboard's recent users (never ships hashed_password)
+USER_OUT_PROJECTION = projection_from_model(UserOut)
+
+# The /full and /units/{id}/topics trees: each node carries exactly the fields of
+# its level's response model, never internal ones such as a topic's ancestor ids
+TREE_NODE_FIELDS: Dict[str, List[str]] = {
+    "curriculum": list(projection_from_model(CurriculumOut)),
+    "subject": list(projection_from_model(SubjectOut)),
+    "course": list(projection_from_model(CourseOut)),
+    "unit": list(projection_from_model(UnitOut)),
+    "topic": list(projection_from_model(TopicOut))
+}
+
+# QuestionService.search_questions
+QUESTION_SEARCH_PROJECTION = projection_from_fields(
+    "question_text", "question_type", "difficulty", "ai_generated",
+    "created_at", "topic_id", "options", "correct_answer"
+)
+
+# QuestionService.get_question_sets_by_topic
+QUESTION_SET_PROJECTION = projection_from_fields(
+    "question_text", "question_type", "difficulty", "options",
+    "correct_answer", "ai_generated"
+)
+
+# QuestionService.generate_practice_set
+QUESTION_PRACTICE_PROJECTION = projection_from_fields(
+    "question_text", "question_type", "difficulty", "options",
+    "correct_answer", "explanation", "topic_id"
+)
+
+# StudentService.generate_practice_quiz (answers are deliberately left out)
+QUESTION_QUIZ_PROJECTION = projection_from_fields(
+    "question_text", "question_type", "difficulty", "options", "topic_id"
+)
+
+# StudentService.get_topic_questions
+QUESTION_TOPIC_LIST_PROJECTION = projection_from_fields(
+    "question_text", "question_type", "difficulty", "options", "created_at"
+)
+
+# Recent question lists on the student and teacher dashboards
+QUESTION_SUMMARY_PROJECTION = projection_from_fields(
+    "question_text", "question_type", "difficulty", "ai_generated",
+    "created_at", "topic_id"
+)
+
+# Teacher recent activity and activity timeline
+QUESTION_ACTIVITY_PROJECTION = projection_from_fields(
+    "question_type", "difficulty", "ai_generated", "created_at", "topic_id"
+)
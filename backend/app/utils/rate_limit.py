@@ -0,0 +1,257 @@
+# backend/app/utils/rate_limit.py
+import asyncio
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, Optional, Tuple
+
+from pymongo import ReturnDocument
+
+class MemoryRateLimitStore:
+    """
+    Per-process attempt log: key -> timestamps inside the window.
+
+    Keys whose attempts have all aged out are dropped during a periodic
+    sweep, so memory stays proportional to recently active keys.
+    """
+
+    def __init__(self, sweep_interval: float = 60.0):
+        self._attempts: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+
+    def count(self, key: str, window: float, now: float) -> Tuple[int, Optional[float]]:
+        """Attempts within the window and the time of the oldest of them"""
+        with self._lock:
+            attempts = self._attempts.get(key)
+            if not attempts:
+                return 0, None
+            while attempts and attempts[0] <= now - window:
+                attempts.popleft()
+            return len(attempts), (attempts[0] if attempts else None)
+
+    def add(self, key: str, window: float, now: float) -> None:
+        with self._lock:
+            self._attempts.setdefault(key, deque()).append(now)
+            if now - self._last_sweep >= self._sweep_interval:
+                self._sweep(window, now)
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._attempts.pop(key, None)
+
+    def _sweep(self, window: float, now: float) -> None:
+        for key in [key for key, attempts in self._attempts.items() if not attempts or attempts[-1] <= now - window]:
+            del self._attempts[key]
+        self._last_sweep = now
+
+class MongoRateLimitStore:
+    """
+    Attempt log shared by every worker, one document per attempt.
+
+    The collection should have an index on (key, at) and a TTL index on
+    expires_at so old attempts clean themselves up.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def count(self, key: str, window: float, now: float) -> Tuple[int, Optional[float]]:
+        since = datetime.utcfromtimestamp(now - window)
+        query = {"key": key, "at": {"$gt": since}}
+        count = self.collection.count_documents(query)
+        if not count:
+            return 0, None
+        oldest = self.collection.find_one(query, {"at": 1}, sort=[("at", 1)])
+        return count, (oldest["at"] - datetime(1970, 1, 1)).total_seconds() if oldest else None
+
+    def add(self, key: str, window: float, now: float) -> None:
+        at = datetime.utcfromtimestamp(now)
+        self.collection.insert_one({"key": key, "at": at, "expires_at": at + timedelta(seconds=window)})
+
+    def clear(self, key: str) -> None:
+        self.collection.delete_many({"key": key})
+
+class SlidingWindowLimiter:
+    """
+    Allow at most ``limit`` attempts per key in any ``window`` seconds.
+
+    Uses an exact sliding log rather than fixed buckets, so a burst
+    straddling a bucket boundary cannot get twice the limit through.
+    """
+
+    def __init__(self, limit: int, window: float, store=None, clock=time.time):
+        self.limit = limit
+        self.window = window
+        self.store = store or MemoryRateLimitStore()
+        self.clock = clock
+
+    def retry_after(self, key: str) -> Optional[float]:
+        """
+        Check a key without recording an attempt
+
+        Returns:
+            Seconds until the next attempt is allowed, or None if allowed now
+        """
+        now = self.clock()
+        count, oldest = self.store.count(key, self.window, now)
+        if count < self.limit:
+            return None
+        return max(0.0, oldest + self.window - now) if oldest is not None else self.window
+
+    def hit(self, key: str) -> None:
+        """Record an attempt"""
+        self.store.add(key, self.window, self.clock())
+
+    def reset(self, key: str) -> None:
+        """Forget a key's attempts (e.g. after a successful login)"""
+        self.store.clear(key)
+
+class MemoryTokenBucketStore:
+    """
+    Per-process token buckets: key -> (tokens, time of last update, rate, capacity).
+
+    Buckets that have refilled completely carry no information and are
+    dropped during a periodic sweep. Each bucket keeps its own rate and
+    capacity, so one store can serve limiters with different settings.
+    """
+
+    def __init__(self, sweep_interval: float = 60.0):
+        self._buckets: Dict[str, Tuple[float, float, float, float]] = {}
+        self._lock = threading.Lock()
+        self._sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+
+    def take(self, key: str, rate: float, capacity: float, now: float) -> Tuple[bool, float]:
+        """Take one token if available; returns (taken, tokens left)"""
+        with self._lock:
+            tokens, updated, _, _ = self._buckets.get(key, (capacity, now, rate, capacity))
+            tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+            taken = tokens >= 1
+            if taken:
+                tokens -= 1
+            self._buckets[key] = (tokens, now, rate, capacity)
+            if now - self._last_sweep >= self._sweep_interval:
+                self._sweep(now)
+            return taken, tokens
+
+    def _sweep(self, now: float) -> None:
+        full = [
+            key for key, (tokens, updated, rate, capacity) in self._buckets.items()
+            if tokens + (now - updated) * rate >= capacity
+        ]
+        for key in full:
+            del self._buckets[key]
+        self._last_sweep = now
+
+class MongoTokenBucketStore:
+    """
+    Token buckets shared by every worker, one document per bucket.
+
+    Refill and take happen in a single pipeline update, so concurrent
+    workers never both spend the last token. Documents carry expires_at for
+    the TTL index and disappear once the bucket would be full again.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def take(self, key: str, rate: float, capacity: float, now: float) -> Tuple[bool, float]:
+        refilled = {"$min": [
+            capacity,
+            {"$add": [
+                {"$ifNull": ["$tokens", capacity]},
+                {"$multiply": [{"$max": [0, {"$subtract": [now, {"$ifNull": ["$updated_at", now]}]}]}, rate]}
+            ]}
+        ]}
+        doc = self.collection.find_one_and_update(
+            {"_id": f"bucket:{key}"},
+            [
+                {"$set": {"tokens": refilled, "updated_at": now}},
+                {"$set": {"taken": {"$gte": ["$tokens", 1]}}},
+                {"$set": {
+                    "tokens": {"$cond": ["$taken", {"$subtract": ["$tokens", 1]}, "$tokens"]},
+                    "expires_at": datetime.utcfromtimestamp(now + capacity / rate)
+                }}
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return doc["taken"], doc["tokens"]
+
+class TokenBucketLimiter:
+    """
+    Allow bursts of up to ``capacity`` requests per key, refilled at ``rate`` per second.
+
+    Unlike the sliding window used for logins, steady users are never locked
+    out for a whole window: a token comes back every 1/rate seconds.
+    """
+
+    def __init__(self, rate: float, capacity: float, store=None, clock=time.time):
+        self.rate = rate
+        self.capacity = capacity
+        self.store = store or MemoryTokenBucketStore()
+        self.clock = clock
+
+    def take(self, key: str) -> Optional[float]:
+        """
+        Spend a token for a request
+
+        Returns:
+            None if the request may proceed, otherwise seconds until a token is available
+        """
+        taken, tokens = self.store.take(key, self.rate, self.capacity, self.clock())
+        if taken:
+            return None
+        return (1 - tokens) / self.rate
+
+class ConcurrencyLimitExceeded(Exception):
+    """Raised when all slots are busy and the wait queue is full or timed out"""
+
+    def __init__(self, retry_after: float):
+        super().__init__("Too many requests in progress, please try again later")
+        self.retry_after = retry_after
+
+class ConcurrencyLimiter:
+    """
+    At most ``limit`` concurrent holders per process, with a bounded wait queue.
+
+    Requests beyond the limit wait up to ``queue_timeout`` seconds for a slot;
+    once ``queue_limit`` are already waiting, new ones are rejected at once.
+    """
+
+    def __init__(self, limit: int, queue_limit: int, queue_timeout: float):
+        self.limit = limit
+        self.queue_limit = queue_limit
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(limit)
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    async def acquire(self) -> None:
+        """
+        Take a slot, waiting in the queue if needed
+
+        Raises:
+            ConcurrencyLimitExceeded: If the queue is full or the wait timed out
+        """
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return
+        if self._waiting >= self.queue_limit:
+            raise ConcurrencyLimitExceeded(self.queue_timeout)
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise ConcurrencyLimitExceeded(self.queue_timeout)
+        finally:
+            self._waiting -= 1
+
+    def release(self) -> None:
+        self._semaphore.release()
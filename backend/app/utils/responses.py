@@ -0,0 +1,46 @@
+# backend/app/utils/responses.py
+import time
+from typing import Any, Optional
+
+import orjson
+from bson import ObjectId
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+from app.utils.metrics import record_serialization
+
+def _default(value: Any) -> Any:
+    """orjson fallback for BSON types it does not know"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    JSON response rendered by orjson
+    
+    Datetimes, dicts and lists are serialized natively in C and ObjectIds are
+    written as strings, so documents can be returned without a
+    jsonable_encoder pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        start = time.perf_counter()
+        body = orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        record_serialization(time.perf_counter() - start)
+        return body
+
+def fast_json(content: Any, response: Optional[Response] = None, status_code: int = 200) -> FastJSONResponse:
+    """
+    Return already-shaped data directly, skipping response_model validation and jsonable_encoder
+    
+    Args:
+        content: JSON-ready data (documents already passed through transform_object_id)
+        response: The route's injected Response, whose headers (e.g. X-Next-Cursor) are carried over
+        status_code: HTTP status code
+        
+    Returns:
+        The response to return from the route
+    """
+    headers = dict(response.headers) if response is not None else None
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
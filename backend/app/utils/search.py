@@ -0,0 +1,154 @@
+# backend/app/utils/search.py
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+# LaTeX commands that only affect layout and carry no searchable meaning
+LATEX_LAYOUT_COMMANDS = {
+    "left", "right", "big", "bigg", "displaystyle", "textstyle", "text",
+    "mathrm", "mathbf", "mathit", "mathbb", "mathcal", "operatorname",
+    "begin", "end", "quad", "qquad", "hspace", "vspace", "limits", "nolimits"
+}
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "if",
+    "in", "is", "it", "of", "on", "or", "that", "the", "this", "to", "was",
+    "what", "when", "which", "with"
+}
+
+# Upper bound on stored terms per question, keeps index entries bounded
+MAX_TERMS = 256
+
+_LATEX_COMMAND = re.compile(r"\\([a-zA-Z]+)")
+_LATEX_ESCAPE = re.compile(r"\\[^a-zA-Z]")
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Split question text into normalized search terms
+
+    LaTeX is understood rather than treated as noise: ``\\frac{a}{b}`` yields
+    ``frac``, ``a`` and ``b``; layout-only commands such as ``\\left`` and
+    ``\\mathrm`` are dropped, and escapes like ``\\,`` become separators.
+
+    Args:
+        text: Raw question or explanation text
+
+    Returns:
+        Terms in order of appearance (duplicates preserved)
+    """
+    if not text:
+        return []
+
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+
+    def command(match):
+        name = match.group(1).lower()
+        return " " if name in LATEX_LAYOUT_COMMANDS else f" {name} "
+
+    text = _LATEX_COMMAND.sub(command, text)
+    text = _LATEX_ESCAPE.sub(" ", text)
+
+    return [
+        token for token in _TOKEN.findall(text.lower())
+        if token not in STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+def normalize_name(text: Optional[str]) -> str:
+    """Lowercase, strip accents and collapse whitespace for exact/prefix name matching"""
+    if not text:
+        return ""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'\s+', ' ', text.lower()).strip()
+
+def name_terms(text: Optional[str]) -> List[str]:
+    """Word terms of a short name; unlike tokenize() nothing is dropped"""
+    return unique_terms(_TOKEN.findall(normalize_name(text)))
+
+def unique_terms(tokens: List[str]) -> List[str]:
+    """De-duplicate terms keeping first-seen order, capped at MAX_TERMS"""
+    return list(dict.fromkeys(tokens))[:MAX_TERMS]
+
+def build_search_fields(question_text: Optional[str], explanation: Optional[str]) -> Dict[str, List[str]]:
+    """
+    Compute the denormalized search fields stored on every question
+
+    ``search_terms`` is the inverted-index field (multikey index) covering the
+    question text and explanation; ``search_title_terms`` holds the question
+    text terms alone and is used to rank title hits above explanation hits.
+    """
+    title_terms = unique_terms(tokenize(question_text))
+    return {
+        "search_terms": unique_terms(title_terms + tokenize(explanation)),
+        "search_title_terms": title_terms
+    }
+
+def build_search_pipeline(
+    query: str,
+    filters: Dict[str, Any],
+    limit: int,
+    projection: Dict[str, Any],
+    prefix: bool = True
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Build a ranked search aggregation over the search_terms index
+
+    Every query term must match (AND semantics). With ``prefix`` enabled the
+    last term matches any stored term starting with it, which is what a
+    search-as-you-type box needs; the anchored regex still uses the index.
+    Filters (topic, type, difficulty, ...) are pushed into the same $match.
+    Results are ranked by how many terms hit the question text, then recency.
+    A blank query lists the filtered questions by recency instead.
+
+    Args:
+        query: Raw search box input
+        filters: Equality filters to push down
+        limit: Maximum number of results
+        projection: Fields to return (the score is added as ``score``)
+        prefix: Treat the last term as a prefix
+
+    Returns:
+        Aggregation pipeline for the questions collection, or None when the
+        query has text but no searchable terms (only stopwords or single
+        letters), which matches nothing
+    """
+    terms = unique_terms(tokenize(query))
+    if not terms:
+        if query.strip():
+            return None
+        return [
+            {"$match": filters},
+            {"$sort": {"created_at": -1}},
+            {"$limit": limit},
+            {"$project": projection}
+        ]
+
+    exact_terms = terms[:-1] if prefix else terms
+    prefix_term = terms[-1] if prefix else None
+
+    conditions = [{"search_terms": term} for term in exact_terms]
+    score_parts = [
+        {"$cond": [{"$in": [term, {"$ifNull": ["$search_title_terms", []]}]}, 2, 1]}
+        for term in exact_terms
+    ]
+
+    if prefix_term:
+        pattern = "^" + re.escape(prefix_term)
+        conditions.append({"search_terms": {"$regex": pattern}})
+        score_parts.append({"$cond": [
+            {"$anyElementTrue": [{"$map": {
+                "input": {"$ifNull": ["$search_title_terms", []]},
+                "as": "term",
+                "in": {"$regexMatch": {"input": "$$term", "regex": pattern}}
+            }}]},
+            2,
+            1
+        ]})
+
+    return [
+        {"$match": {**filters, "$and": conditions}},
+        {"$addFields": {"score": {"$add": score_parts}}},
+        {"$sort": {"score": -1, "created_at": -1}},
+        {"$limit": limit},
+        {"$project": {**projection, "score": 1}}
+    ]
@@ -0,0 +1,27 @@
+# backend/app/utils/server_timing.py
+from typing import Optional
+
+from starlette.requests import Request
+
+def record_timing(request: Request, name: str, seconds: float, description: Optional[str] = None) -> None:
+    """
+    Record a timing to be reported in the response's Server-Timing header
+    
+    Args:
+        request: The current request
+        name: Metric name (a token, e.g. "auth")
+        seconds: Duration in seconds
+        description: Optional human-readable detail (e.g. "cache hit")
+    """
+    entry = f"{name};dur={seconds * 1000:.2f}"
+    if description:
+        entry += f';desc="{description}"'
+    timings = getattr(request.state, "server_timing", None)
+    if timings is None:
+        timings = request.state.server_timing = []
+    timings.append(entry)
+
+def server_timing_header(request: Request) -> Optional[str]:
+    """Value of the Server-Timing header for the timings recorded on a request, if any"""
+    timings = getattr(request.state, "server_timing", None)
+    return ", ".join(timings) if timings else None
@@ -1,12 +1,17 @@
 # backend/main.py - Updated CORS Configuration
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 import uvicorn
 import os
+import secrets
 
+from app.auth.auth_bearer import request_role
+from app.auth.auth_handler import PasswordHasherBusy
 from app.auth.auth_routes import router as auth_router
+from app.models.user import UserRole
 from app.routes.admin_routes import router as admin_router
 from app.routes.curriculum_routes import router as curriculum_router
 from app.routes.question_routes import router as question_router
@@ -14,13 +19,42 @@ from app.routes.prompt_routes import router as prompt_router
 from app.routes.teacher_routes import router as teacher_router
 from app.routes.student_routes import router as student_router
 from app.routes.student_auth_routes import router as student_auth_router
+from app.services.cascade_service import CascadeDeleteService
+from app.services.hierarchy_cache import TREE_SCOPE
+from app.services.move_service import MoveService
+from app.utils.change_tracking import get_version, QUESTIONS_SCOPE, PROMPTS_SCOPE
+from app.utils.http_cache import CacheRule, HTTPCacheMiddleware
+from app.utils.responses import FastJSONResponse
+from app.utils.metrics import begin_request, finish_request, registry
+from app.utils.server_timing import record_timing, server_timing_header
 
 app = FastAPI(
     title="AI Question Generator API",
     description="API for an AI-powered educational question generation system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
+ALL_ROLES = frozenset({UserRole.STUDENT, UserRole.TEACHER, UserRole.ADMIN})
+STAFF_ROLES = frozenset({UserRole.TEACHER, UserRole.ADMIN})
+
+# Read-mostly GETs answered with ETags/304s and cached server-side until their scopes change.
+# Roles must match the routes' own dependencies.
+HTTP_CACHE_RULES = [
+    CacheRule(r"/api/curriculum(/[^/]+(/full)?)?", (TREE_SCOPE,), ALL_ROLES),
+    CacheRule(r"/api/curriculum/[^/]+/stats/tree", (TREE_SCOPE, QUESTIONS_SCOPE), STAFF_ROLES, "private, max-age=30"),
+    CacheRule(r"/api/(subjects|courses)(/[^/]+(/full)?)?", (TREE_SCOPE,), ALL_ROLES),
+    CacheRule(r"/api/units(/[^/]+(/topics)?)?", (TREE_SCOPE,), ALL_ROLES),
+    CacheRule(r"/api/topics(/[^/]+)?", (TREE_SCOPE,), ALL_ROLES),
+    CacheRule(r"/api/prompts(/[^/]+)?", (PROMPTS_SCOPE,), STAFF_ROLES),
+]
+
+# Added first so it runs inside GZip and CORS
+app.add_middleware(HTTPCacheMiddleware, rules=HTTP_CACHE_RULES, authorize=request_role, versions=get_version)
+
+# Compress responses above GZIP_MIN_SIZE bytes (hierarchy and question lists shrink ~10x)
+app.add_middleware(GZipMiddleware, minimum_size=int(os.getenv("GZIP_MIN_SIZE", "1024")))
+
 # Get frontend URL from environment or default to localhost
 frontend_url = os.getenv("FRONTEND_URL", "http://localhost:3000")
 
@@ -30,8 +64,8 @@ app.add_middleware(
     allow_origins=[frontend_url, "http://localhost:3000", "http://127.0.0.1:3000"],  # Specify allowed origins
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],  # Specify allowed methods
-    allow_headers=["Content-Type", "Authorization", "X-Requested-With", "Accept"],  # Specify allowed headers
-    expose_headers=["Content-Type", "Authorization"],  # Headers that can be exposed to the browser
+    allow_headers=["Content-Type", "Authorization", "X-Requested-With", "Accept", "If-None-Match"],  # Specify allowed headers
+    expose_headers=["Content-Type", "Authorization", "X-Next-Cursor", "Server-Timing", "ETag", "Retry-After"],  # Headers that can be exposed to the browser
     max_age=600,  # Cache preflight requests for 10 minutes
 )
 
@@ -45,6 +79,58 @@ app.include_router(teacher_router, prefix="/api")
 app.include_router(student_router, prefix="/api")
 app.include_router(student_auth_router, prefix="/api")
 
+# Bearer token the metrics scraper must send; /metrics is open when unset
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+_route_templates = {}
+
+def route_template(request: Request) -> str:
+    """Path template of the route that handled a request, used as the metrics label"""
+    endpoint = request.scope.get("endpoint")
+    if endpoint is None:
+        return "unmatched"
+    if not _route_templates:
+        _route_templates.update(
+            (route.endpoint, route.path) for route in request.app.routes if hasattr(route, "endpoint")
+        )
+    return _route_templates.get(endpoint, "unmatched")
+
+@app.middleware("http")
+async def instrument_request(request: Request, call_next):
+    # Collect database, LLM and serialization time for this request, report it in
+    # Server-Timing along with timings recorded by handlers (e.g. the auth dependency)
+    stats = begin_request()
+    try:
+        response = await call_next(request)
+    except Exception:
+        # Unhandled errors become a 500 further out; count them before re-raising
+        finish_request(stats, request.method, route_template(request), 500)
+        raise
+    seconds = finish_request(stats, request.method, route_template(request), response.status_code)
+
+    record_timing(request, "db", stats.db_seconds, f"{stats.db_count} commands")
+    if stats.llm_count:
+        record_timing(request, "llm", stats.llm_seconds, f"{stats.prompt_tokens + stats.completion_tokens} tokens")
+    record_timing(request, "serialize", stats.serialize_seconds)
+    record_timing(request, "total", seconds)
+    response.headers["Server-Timing"] = server_timing_header(request)
+    return response
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy(request: Request, exc: PasswordHasherBusy):
+    # Shed login/registration bursts instead of queueing them behind minutes of bcrypt work
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+@app.on_event("startup")
+async def resume_background_jobs():
+    # Finish cascade deletes and moves interrupted by a restart
+    CascadeDeleteService.resume_jobs()
+    MoveService.resume_jobs()
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to the AI Question Generator API"}
@@ -53,5 +139,12 @@ async def root():
 async def health_check():
     return JSONResponse(content={"status": "healthy"})
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    # Prometheus text format, per worker process
+    if METRICS_TOKEN and not secrets.compare_digest(request.headers.get("authorization", ""), f"Bearer {METRICS_TOKEN}"):
+        return JSONResponse(status_code=status.HTTP_401_UNAUTHORIZED, content={"detail": "Invalid metrics token"})
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -0,0 +1,93 @@
+# backend/scripts/backfill_ancestor_ids.py
+"""
+Populate the materialized ancestor ids (unit_id, course_id, subject_id,
+curriculum_id) on existing topics and questions.
+
+The hierarchy above topics is loaded into memory once (it is small), so every
+topic's lineage is resolved without per-topic lookups. Topics are updated one
+by one in bulk batches; questions are updated with one update_many per topic.
+Safe to re-run.
+"""
+
+import os
+import sys
+from pymongo import MongoClient, UpdateOne, UpdateMany
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.hierarchy import PARENT_FIELD, COLLECTION_NAMES
+
+# Load environment variables
+load_dotenv()
+
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
+DB_NAME = os.getenv("DB_NAME", "question_generator_db")
+
+def load_parents(db):
+    """Map every subject, course and unit id to its parent id"""
+    parents = {}
+    for node_type in ("subject", "course", "unit"):
+        parent_field = PARENT_FIELD[node_type]
+        for doc in db[COLLECTION_NAMES[node_type]].find({}, {parent_field: 1}):
+            parents[str(doc["_id"])] = doc.get(parent_field)
+    return parents
+
+def lineage_of_unit(unit_id: str, parents) -> dict:
+    """unit_id, course_id, subject_id and curriculum_id of a unit, as far as they resolve"""
+    lineage = {"unit_id": unit_id}
+    course_id = parents.get(unit_id)
+    if course_id:
+        lineage["course_id"] = course_id
+        subject_id = parents.get(course_id)
+        if subject_id:
+            lineage["subject_id"] = subject_id
+            curriculum_id = parents.get(subject_id)
+            if curriculum_id:
+                lineage["curriculum_id"] = curriculum_id
+    return lineage
+
+def flush(collection, operations) -> int:
+    if not operations:
+        return 0
+    return collection.bulk_write(operations, ordered=False).modified_count
+
+def backfill(db, batch_size: int = 500):
+    """Write ancestor ids onto topics and their questions; returns (topics, questions) updated"""
+    parents = load_parents(db)
+    topics_collection = db["topics"]
+    questions_collection = db["questions"]
+
+    topics_updated = questions_updated = 0
+    topic_ops, question_ops = [], []
+    for topic in topics_collection.find({}, {"unit_id": 1}):
+        lineage = lineage_of_unit(topic.get("unit_id"), parents)
+        topic_ops.append(UpdateOne({"_id": topic["_id"]}, {"$set": lineage}))
+        question_ops.append(UpdateMany({"topic_id": str(topic["_id"])}, {"$set": lineage}))
+
+        if len(topic_ops) == batch_size:
+            topics_updated += flush(topics_collection, topic_ops)
+            questions_updated += flush(questions_collection, question_ops)
+            topic_ops, question_ops = [], []
+
+    topics_updated += flush(topics_collection, topic_ops)
+    questions_updated += flush(questions_collection, question_ops)
+    return topics_updated, questions_updated
+
+def main():
+    client = MongoClient(MONGO_URI)
+    db = client[DB_NAME]
+
+    print("Backfilling ancestor ids on topics and questions...")
+    topics_updated, questions_updated = backfill(db)
+    print(f"Updated {topics_updated} topics and {questions_updated} questions")
+
+    for field in ("course_id", "subject_id", "curriculum_id"):
+        db["topics"].create_index(field)
+    for field in ("unit_id", "course_id", "subject_id", "curriculum_id"):
+        db["questions"].create_index(field)
+    print("Done!")
+
+if __name__ == "__main__":
+    main()
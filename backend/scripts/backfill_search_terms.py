@@ -0,0 +1,61 @@
+# backend/scripts/backfill_search_terms.py
+"""
+Populate search_terms / search_title_terms on questions created before the
+search index existed (or after tokenizer changes with --all).
+"""
+
+import os
+import sys
+from pymongo import MongoClient, UpdateOne
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.search import build_search_fields
+
+# Load environment variables
+load_dotenv()
+
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
+DB_NAME = os.getenv("DB_NAME", "question_generator_db")
+
+def backfill(collection, rebuild_all: bool = False, batch_size: int = 1000) -> int:
+    """Write search fields in unordered bulk batches and return the number updated"""
+    query = {} if rebuild_all else {"search_terms": {"$exists": False}}
+    documents = collection.find(query, {"question_text": 1, "explanation": 1})
+
+    count = 0
+    operations = []
+    for doc in documents:
+        fields = build_search_fields(doc.get("question_text"), doc.get("explanation"))
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": fields}))
+        if len(operations) == batch_size:
+            count += collection.bulk_write(operations, ordered=False).modified_count
+            operations = []
+    if operations:
+        count += collection.bulk_write(operations, ordered=False).modified_count
+
+    return count
+
+def main(rebuild_all: bool):
+    client = MongoClient(MONGO_URI)
+    questions_collection = client[DB_NAME]["questions"]
+
+    print("Backfilling question search terms...")
+    count = backfill(questions_collection, rebuild_all)
+    print(f"Updated {count} questions")
+
+    questions_collection.create_index("search_terms")
+    questions_collection.create_index([("topic_id", 1), ("search_terms", 1)])
+    print("Done!")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill question search terms")
+    parser.add_argument("--all", action="store_true", help="Rebuild terms for every question")
+
+    args = parser.parse_args()
+
+    main(args.all)
@@ -0,0 +1,117 @@
+# backend/scripts/benchmark_hierarchy.py
+"""
+Benchmark the /curriculum/{id}/full hierarchy read on a large curriculum
+(default 50 subjects x 20 courses x 20 units x 20 topics = 400k topics).
+
+Compares the previous four sequential queries with in-Python grouping, the
+single $unionWith aggregation used when the tree cache is disabled, and the
+in-memory tree (one-off load plus per-request subtree copy).
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+from bson import ObjectId
+from pymongo import MongoClient
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.hierarchy import (
+    LEVELS, COLLECTION_NAMES, CurriculumTree, build_subtree_pipeline, assemble_subtree
+)
+
+# Load environment variables
+load_dotenv()
+
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
+BENCH_DB_NAME = os.getenv("BENCH_DB_NAME", "question_generator_bench")
+
+def seed(db, subjects: int, courses: int, units: int, topics: int, batch_size: int = 10000):
+    """Create one curriculum with the given fan-out at every level"""
+    for name in COLLECTION_NAMES.values():
+        db[name].drop()
+    now = datetime.utcnow()
+
+    def node(name, slug, **parent):
+        return {"name": name, "slug": slug, "description": "", "created_by": "bench", "created_at": now, **parent}
+
+    curriculum_id = str(db["curriculum"].insert_one(node("Bench", "bench")).inserted_id)
+    fan_out = [("subjects", "curriculum_id", subjects), ("courses", "subject_id", courses),
+               ("units", "course_id", units), ("topics", "unit_id", topics)]
+
+    parent_ids = [curriculum_id]
+    for collection_name, parent_field, count in fan_out:
+        batch, child_ids = [], []
+        for parent_index, parent_id in enumerate(parent_ids):
+            for i in range(count):
+                slug = f"{collection_name}-{parent_index}-{i}"
+                batch.append(node(slug, slug, **{parent_field: parent_id}))
+            if len(batch) >= batch_size:
+                child_ids += [str(oid) for oid in db[collection_name].insert_many(batch).inserted_ids]
+                batch = []
+        if batch:
+            child_ids += [str(oid) for oid in db[collection_name].insert_many(batch).inserted_ids]
+        db[collection_name].create_index([(parent_field, 1), ("_id", 1)])
+        parent_ids = child_ids
+        print(f"  {collection_name}: {len(child_ids)}")
+
+    return curriculum_id
+
+def sequential(db, curriculum_id: str):
+    """The previous implementation: one query per level, grouped in Python"""
+    curriculum = db["curriculum"].find_one({"_id": ObjectId(curriculum_id)})
+    subjects = list(db["subjects"].find({"curriculum_id": curriculum_id}))
+    courses = list(db["courses"].find({"subject_id": {"$in": [str(s["_id"]) for s in subjects]}}))
+    units = list(db["units"].find({"course_id": {"$in": [str(c["_id"]) for c in courses]}}))
+    topics = list(db["topics"].find({"unit_id": {"$in": [str(u["_id"]) for u in units]}}))
+    return curriculum, subjects, courses, units, topics
+
+def aggregated(db, curriculum_id: str):
+    docs = db["curriculum"].aggregate(build_subtree_pipeline("curriculum", curriculum_id))
+    return assemble_subtree("curriculum", curriculum_id, docs)
+
+def timed(fn, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs * 1000
+
+def main(subjects: int, courses: int, units: int, topics: int, runs: int, reseed: bool):
+    client = MongoClient(MONGO_URI)
+    db = client[BENCH_DB_NAME]
+
+    existing = db["curriculum"].find_one({"slug": "bench"})
+    if reseed or not existing:
+        print("Seeding synthetic curriculum...")
+        curriculum_id = seed(db, subjects, courses, units, topics)
+    else:
+        curriculum_id = str(existing["_id"])
+
+    collections = {level: db[COLLECTION_NAMES[level]] for level in LEVELS}
+    load_start = time.perf_counter()
+    tree = CurriculumTree.load(0, collections)
+    load_ms = (time.perf_counter() - load_start) * 1000
+
+    print(f"{'strategy':<28} {'ms/request':>12}")
+    print(f"{'sequential (4 queries)':<28} {timed(lambda: sequential(db, curriculum_id), runs):>12.1f}")
+    print(f"{'single aggregation':<28} {timed(lambda: aggregated(db, curriculum_id), runs):>12.1f}")
+    print(f"{'tree cache (subtree copy)':<28} {timed(lambda: tree.subtree(curriculum_id), runs):>12.1f}")
+    print(f"{'tree cache load (once)':<28} {load_ms:>12.1f}")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark full-hierarchy reads")
+    parser.add_argument("--subjects", type=int, default=50, help="Subjects in the curriculum")
+    parser.add_argument("--courses", type=int, default=20, help="Courses per subject")
+    parser.add_argument("--units", type=int, default=20, help="Units per course")
+    parser.add_argument("--topics", type=int, default=20, help="Topics per unit")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per strategy")
+    parser.add_argument("--seed", action="store_true", help="Re-seed the scratch collections")
+
+    args = parser.parse_args()
+
+    main(args.subjects, args.courses, args.units, args.topics, args.runs, args.seed)
@@ -0,0 +1,81 @@
+# backend/scripts/benchmark_login_storm.py
+"""
+Simulate a class-wide login burst against the password hashing path.
+
+Fires N concurrent password verifications (default: 300 students signing in
+at once) and compares verifying inline on the event loop, as the login
+handlers used to, with the bounded bcrypt pool. A heartbeat task measures how
+long the event loop stalls, which is what every other request on the worker
+experiences during the burst. Attempts shed by admission control are counted
+as rejected (they would get a 503 with Retry-After).
+
+No database is needed.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth import auth_handler
+from app.auth.auth_handler import (
+    PasswordHasherBusy, verify_password, verify_password_async, get_password_hash
+)
+
+async def heartbeat(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """Largest delay (seconds) between scheduled ticks of the event loop"""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+async def storm(logins: int, hashed: str, pooled: bool):
+    """Run the burst; returns (seconds, worst loop stall, accepted, rejected)"""
+    async def login():
+        if pooled:
+            valid, _ = await verify_password_async("correct horse", hashed)
+        else:
+            valid = verify_password("correct horse", hashed)
+        return valid
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(heartbeat(stop))
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(login() for _ in range(logins)), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    worst_stall = await monitor
+    rejected = sum(isinstance(result, PasswordHasherBusy) for result in results)
+    return elapsed, worst_stall, logins - rejected, rejected
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark password verification during a login burst")
+    parser.add_argument("--logins", type=int, default=300, help="Concurrent login attempts")
+    parser.add_argument("--rounds", type=int, default=auth_handler.BCRYPT_ROUNDS, help="bcrypt cost factor")
+    args = parser.parse_args()
+
+    auth_handler.pwd_context.update(bcrypt__rounds=args.rounds)
+    hashed = get_password_hash("correct horse")
+    print(
+        f"{args.logins} logins, bcrypt cost {args.rounds}, {auth_handler.PASSWORD_HASH_WORKERS} pool workers, "
+        f"queue limit {auth_handler.PASSWORD_QUEUE_LIMIT}"
+    )
+
+    for label, pooled in (("inline on the event loop", False), ("bcrypt pool", True)):
+        elapsed, worst_stall, accepted, rejected = asyncio.run(storm(args.logins, hashed, pooled))
+        print(
+            f"{label:>26}: {elapsed:6.2f}s total, worst loop stall {worst_stall * 1000:8.1f}ms, "
+            f"{accepted} verified, {rejected} rejected"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# backend/scripts/benchmark_pagination.py
+"""
+Compare deep-page latency of skip/limit pagination against keyset (cursor) pagination.
+
+Seeds a scratch collection with synthetic questions, then times fetching the
+same page (default: page 1000 of 100) with both strategies.
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+from pymongo import MongoClient
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.pagination import paginate
+
+# Load environment variables
+load_dotenv()
+
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
+BENCH_DB_NAME = os.getenv("BENCH_DB_NAME", "question_generator_bench")
+
+def seed_questions(collection, total: int, batch_size: int = 10000):
+    """Fill the scratch collection with synthetic question documents"""
+    collection.drop()
+    now = datetime.utcnow()
+    batch = []
+    for i in range(total):
+        batch.append({
+            "question_text": f"Synthetic question {i}: what is {i} + {i}?",
+            "question_type": "MCQ",
+            "options": [str(2 * i), str(2 * i + 1), str(i), str(i + 1)],
+            "correct_answer": str(2 * i),
+            "explanation": f"{i} + {i} = {2 * i}",
+            "difficulty": "Easy",
+            "topic_id": "bench-topic",
+            "created_by": "bench",
+            "created_at": now,
+            "updated_at": now,
+            "ai_generated": False
+        })
+        if len(batch) == batch_size:
+            collection.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        collection.insert_many(batch, ordered=False)
+    collection.create_index([("topic_id", 1), ("_id", 1)])
+
+def time_skip(collection, page: int, page_size: int, runs: int) -> float:
+    """Average seconds to fetch the page using skip/limit"""
+    elapsed = 0.0
+    for _ in range(runs):
+        start = time.perf_counter()
+        paginate(collection, {"topic_id": "bench-topic"}, page_size, skip=(page - 1) * page_size)
+        elapsed += time.perf_counter() - start
+    return elapsed / runs
+
+def time_cursor(collection, page: int, page_size: int, runs: int) -> float:
+    """Average seconds to fetch the page using a cursor captured from the previous page"""
+    # Walk to the page once to obtain the cursor a client would be holding
+    cursor = None
+    for _ in range(page - 1):
+        _, cursor = paginate(collection, {"topic_id": "bench-topic"}, page_size, cursor=cursor)
+
+    elapsed = 0.0
+    for _ in range(runs):
+        start = time.perf_counter()
+        paginate(collection, {"topic_id": "bench-topic"}, page_size, cursor=cursor)
+        elapsed += time.perf_counter() - start
+    return elapsed / runs
+
+def main(page: int, page_size: int, runs: int, seed: bool):
+    client = MongoClient(MONGO_URI)
+    collection = client[BENCH_DB_NAME]["bench_pagination"]
+
+    total = page * page_size
+    if seed or collection.estimated_document_count() < total:
+        print(f"Seeding {total} questions...")
+        seed_questions(collection, total)
+
+    skip_seconds = time_skip(collection, page, page_size, runs)
+    cursor_seconds = time_cursor(collection, page, page_size, runs)
+
+    print(f"Page {page} (page size {page_size}, {runs} runs)")
+    print(f"  skip/limit: {skip_seconds * 1000:.2f} ms")
+    print(f"  cursor:     {cursor_seconds * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark skip vs cursor pagination")
+    parser.add_argument("--page", type=int, default=1000, help="Page number to fetch")
+    parser.add_argument("--page-size", type=int, default=100, help="Documents per page")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per mode")
+    parser.add_argument("--seed", action="store_true", help="Re-seed the scratch collection")
+
+    args = parser.parse_args()
+
+    main(args.page, args.page_size, args.runs, args.seed)
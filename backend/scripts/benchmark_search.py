@@ -0,0 +1,125 @@
+# backend/scripts/benchmark_search.py
+"""
+Benchmark question search against a synthetic question bank (default 1M questions).
+
+Compares the old unanchored case-insensitive $regex scan over question_text
+and explanation with the indexed, ranked search_terms pipeline, for full-word
+queries, typeahead prefixes and topic-filtered searches.
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pymongo import MongoClient
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.projections import QUESTION_SEARCH_PROJECTION
+from app.utils.search import build_search_fields, build_search_pipeline
+
+# Load environment variables
+load_dotenv()
+
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
+BENCH_DB_NAME = os.getenv("BENCH_DB_NAME", "question_generator_bench")
+
+VOCABULARY = [
+    "derivative", "integral", "limit", "function", "polynomial", "quadratic",
+    "equation", "matrix", "vector", "probability", "distribution", "sequence",
+    "series", "logarithm", "exponential", "triangle", "circle", "velocity",
+    "acceleration", "momentum", "energy", "photosynthesis", "molecule", "reaction"
+]
+LATEX_SNIPPETS = [
+    r"$\frac{{{a}}}{{{b}}}$", r"$\sqrt{{{a}}}$", r"$x^{{{a}}} + {b}x$",
+    r"$\int_0^{{{a}}} x\,dx$", r"$\lim_{{x \to {a}}} f(x)$", r"$\sin(\theta) = {a}/{b}$"
+]
+QUERIES = ["derivative", "quadratic equation", "frac", "integ", "probability distribution", "sqrt"]
+
+def synthetic_question(rng: random.Random, now: datetime, topic_count: int):
+    words = rng.sample(VOCABULARY, 4)
+    latex = rng.choice(LATEX_SNIPPETS).format(a=rng.randint(1, 9), b=rng.randint(1, 9))
+    question_text = f"Find the {words[0]} of the {words[1]} given {latex}"
+    explanation = f"Apply the {words[2]} rule, then simplify the {words[3]}."
+    return {
+        "question_text": question_text,
+        "question_type": rng.choice(["MCQ", "MultipleAnswer", "True/False", "Fill-in-the-blank"]),
+        "options": ["A", "B", "C", "D"],
+        "correct_answer": "A",
+        "explanation": explanation,
+        "difficulty": rng.choice(["Easy", "Medium", "Hard"]),
+        "topic_id": f"topic-{rng.randrange(topic_count)}",
+        "created_by": "bench",
+        "created_at": now - timedelta(seconds=rng.randrange(10 ** 7)),
+        "ai_generated": True,
+        **build_search_fields(question_text, explanation)
+    }
+
+def seed(collection, total: int, topic_count: int, batch_size: int = 10000):
+    collection.drop()
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    batch = []
+    for i in range(total):
+        batch.append(synthetic_question(rng, now, topic_count))
+        if len(batch) == batch_size:
+            collection.insert_many(batch, ordered=False)
+            batch = []
+            print(f"  {i + 1}/{total}", end="\r")
+    if batch:
+        collection.insert_many(batch, ordered=False)
+    print()
+    collection.create_index("search_terms")
+    collection.create_index([("topic_id", 1), ("search_terms", 1)])
+
+def timed(fn, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs * 1000
+
+def regex_search(collection, query, filters, limit):
+    filter_query = {
+        **filters,
+        "$or": [
+            {"question_text": {"$regex": query, "$options": "i"}},
+            {"explanation": {"$regex": query, "$options": "i"}}
+        ]
+    }
+    return list(collection.find(filter_query, QUESTION_SEARCH_PROJECTION).limit(limit))
+
+def indexed_search(collection, query, filters, limit):
+    pipeline = build_search_pipeline(query, filters, limit, QUESTION_SEARCH_PROJECTION)
+    return list(collection.aggregate(pipeline))
+
+def main(total: int, topic_count: int, runs: int, limit: int, reseed: bool):
+    client = MongoClient(MONGO_URI)
+    collection = client[BENCH_DB_NAME]["bench_search"]
+
+    if reseed or collection.estimated_document_count() != total:
+        print(f"Seeding {total} synthetic questions...")
+        seed(collection, total, topic_count)
+
+    print(f"{'query':<28} {'filter':<10} {'regex ms':>10} {'indexed ms':>11}")
+    for query in QUERIES:
+        for label, filters in [("none", {}), ("topic", {"topic_id": "topic-7"})]:
+            regex_ms = timed(lambda: regex_search(collection, query, filters, limit), runs)
+            indexed_ms = timed(lambda: indexed_search(collection, query, filters, limit), runs)
+            print(f"{query:<28} {label:<10} {regex_ms:>10.2f} {indexed_ms:>11.2f}")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark regex vs indexed question search")
+    parser.add_argument("--count", type=int, default=1_000_000, help="Synthetic questions to generate")
+    parser.add_argument("--topics", type=int, default=2000, help="Distinct topic ids")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per query")
+    parser.add_argument("--limit", type=int, default=20, help="Results per search")
+    parser.add_argument("--seed", action="store_true", help="Re-seed the scratch collection")
+
+    args = parser.parse_args()
+
+    main(args.count, args.topics, args.runs, args.limit, args.seed)
@@ -0,0 +1,94 @@
+# backend/scripts/benchmark_serialization.py
+"""
+Compare how the large list payloads are serialized.
+
+Builds a page of synthetic question documents (shaped like GET /questions
+after transform_object_id) and times three paths:
+
+- response_model: what FastAPI did before, validating every item against
+  QuestionOut, running jsonable_encoder and then json.dumps
+- jsonable_encoder: skipping validation but still encoding via the stdlib
+- orjson: FastJSONResponse.render, which the hot endpoints now use
+
+It also reports the raw body size and the size after gzip at the level the
+GZip middleware uses. No database is needed.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.question import QuestionOut
+from app.utils.responses import FastJSONResponse
+
+def make_questions(count: int) -> List[dict]:
+    """Question documents as returned by the list endpoints"""
+    topic_id = str(ObjectId())
+    created_by = str(ObjectId())
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "id": str(ObjectId()),
+            "question_text": f"Question {i}: which of the following best describes the process shown in the diagram?",
+            "question_type": "MCQ",
+            "options": [f"Option {letter} for question {i}" for letter in "ABCD"],
+            "correct_answer": f"Option A for question {i}",
+            "explanation": "The correct option follows from the definition covered in this topic. " * 3,
+            "difficulty": ("Easy", "Medium", "Hard")[i % 3],
+            "topic_id": topic_id,
+            "created_by": created_by,
+            "created_at": start + timedelta(minutes=i),
+            "updated_at": start + timedelta(minutes=i, seconds=30),
+            "ai_generated": bool(i % 2)
+        }
+        for i in range(count)
+    ]
+
+def time_it(func, repeat: int):
+    """Best-of-N seconds and the last result"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main(count: int, repeat: int):
+    questions = make_questions(count)
+    adapter = TypeAdapter(List[QuestionOut])
+    response = FastJSONResponse(None)
+
+    paths = [
+        ("response_model", lambda: json.dumps(jsonable_encoder(adapter.validate_python(questions))).encode("utf-8")),
+        ("jsonable_encoder", lambda: json.dumps(jsonable_encoder(questions)).encode("utf-8")),
+        ("orjson", lambda: response.render(questions)),
+    ]
+
+    print(f"{count} questions, best of {repeat}")
+    print(f"{'path':<18} {'time':>10} {'raw bytes':>12} {'gzip bytes':>12}")
+    for name, serialize in paths:
+        seconds, body = time_it(serialize, repeat)
+        # GZipMiddleware compresses at level 9
+        compressed = len(gzip.compress(body, compresslevel=9))
+        print(f"{name:<18} {seconds * 1000:>8.2f}ms {len(body):>12} {compressed:>12}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization of large list responses")
+    parser.add_argument("--count", type=int, default=1000, help="Questions per response")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per path")
+
+    args = parser.parse_args()
+
+    main(args.count, args.repeat)
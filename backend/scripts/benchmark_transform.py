@@ -0,0 +1,127 @@
+# backend/scripts/benchmark_transform.py
+"""
+Microbenchmark transform_object_id on realistic question documents.
+
+Builds N question documents shaped like the questions collection (ObjectIds,
+ancestor ids, datetimes, option lists, search terms) and compares:
+
+- the previous recursive converter, which also turned datetimes into strings
+- the current stack-based, type-dispatched converter
+
+For both, it also times the full response path: the old converter followed
+by QuestionOut validation (which parsed the datetime strings back), and the
+new converter followed by FastJSONResponse rendering. No database is needed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, List
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.question import QuestionOut
+from app.utils.db_utils import transform_object_id
+from app.utils.responses import FastJSONResponse
+
+def previous_transform_object_id(data: Any) -> Any:
+    """The recursive converter transform_object_id replaced, kept for comparison"""
+    if data is None:
+        return None
+    if isinstance(data, list):
+        return [previous_transform_object_id(item) for item in data]
+    if isinstance(data, dict):
+        result = {}
+        for key, value in data.items():
+            if key == "_id":
+                result["id"] = str(value)
+            elif isinstance(value, ObjectId):
+                result[key] = str(value)
+            elif isinstance(value, dict) or isinstance(value, list):
+                result[key] = previous_transform_object_id(value)
+            elif isinstance(value, datetime):
+                result[key] = value.isoformat()
+            else:
+                result[key] = value
+        return result
+    if isinstance(data, ObjectId):
+        return str(data)
+    if isinstance(data, datetime):
+        return data.isoformat()
+    return data
+
+def make_documents(count: int) -> List[dict]:
+    """Question documents as stored, including the denormalized ancestor ids"""
+    ancestors = {name: ObjectId() for name in ("curriculum_id", "subject_id", "course_id", "unit_id")}
+    topic_id = ObjectId()
+    created_by = ObjectId()
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "_id": ObjectId(),
+            "question_text": f"Question {i}: which of the following best describes the process shown in the diagram?",
+            "question_type": "MCQ",
+            "options": [f"Option {letter} for question {i}" for letter in "ABCD"],
+            "correct_answer": f"Option A for question {i}",
+            "explanation": "The correct option follows from the definition covered in this topic. " * 3,
+            "difficulty": ("Easy", "Medium", "Hard")[i % 3],
+            "topic_id": str(topic_id),
+            **ancestors,
+            "created_by": created_by,
+            "created_at": start + timedelta(minutes=i),
+            "updated_at": start + timedelta(minutes=i, seconds=30),
+            "ai_generated": bool(i % 2),
+            "search_terms": ["process", "diagram", "definition", f"q{i}"]
+        }
+        for i in range(count)
+    ]
+
+def time_it(func, repeat: int) -> float:
+    """Best-of-N seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(count: int, repeat: int):
+    documents = make_documents(count)
+    adapter = TypeAdapter(List[QuestionOut])
+    response = FastJSONResponse(None)
+
+    # Both converters must agree apart from how datetimes are represented
+    old, new = previous_transform_object_id(documents), transform_object_id(documents)
+    assert json.dumps(jsonable_encoder(new)) == json.dumps(old)
+
+    cases = [
+        ("previous transform", lambda: previous_transform_object_id(documents)),
+        ("transform", lambda: transform_object_id(documents)),
+        (
+            "previous transform + response_model",
+            lambda: json.dumps(jsonable_encoder(adapter.validate_python(previous_transform_object_id(documents))))
+        ),
+        ("transform + orjson", lambda: response.render(transform_object_id(documents))),
+    ]
+
+    print(f"{count} question documents, best of {repeat}")
+    for name, func in cases:
+        seconds = time_it(func, repeat)
+        print(f"{name:<36} {seconds * 1000:>9.2f}ms  {seconds / count * 1e6:>6.2f}us/doc")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark transform_object_id on question documents")
+    parser.add_argument("--count", type=int, default=10000, help="Documents to convert")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case")
+
+    args = parser.parse_args()
+
+    main(args.count, args.repeat)
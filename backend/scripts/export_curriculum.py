@@ -0,0 +1,48 @@
+# backend/scripts/export_curriculum.py
+"""
+Stream a curriculum (hierarchy and questions) to a JSON Lines or CSV file in
+the format read by scripts/import_curriculum.py.
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Load environment variables
+load_dotenv()
+
+from app.config.db import curriculum_collection
+from app.services.bulk_service import BulkCurriculumService
+from app.utils.curriculum_io import write_jsonl, write_csv
+from app.utils.hierarchy import id_or_slug_match
+
+def main(curriculum_id_or_slug: str, out_path: str, file_format: str, include_questions: bool):
+    curriculum = curriculum_collection.find_one(id_or_slug_match(curriculum_id_or_slug))
+    if not curriculum:
+        print(f"Curriculum with ID or slug {curriculum_id_or_slug} not found")
+        sys.exit(1)
+
+    writer = write_csv if file_format == "csv" else write_jsonl
+    count = 0
+    with open(out_path, "w", encoding="utf-8", newline="") as f:
+        for line in writer(BulkCurriculumService.export_records(curriculum, include_questions)):
+            f.write(line)
+            count += 1
+
+    print(f"Wrote {count} lines to {out_path}")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export a curriculum to a file")
+    parser.add_argument("curriculum", help="Curriculum id or slug")
+    parser.add_argument("out", help="Output file")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl", help="Output format")
+    parser.add_argument("--no-questions", action="store_true", help="Export the hierarchy only")
+
+    args = parser.parse_args()
+
+    main(args.curriculum, args.out, args.format, not args.no_questions)
@@ -0,0 +1,45 @@
+# backend/scripts/import_curriculum.py
+"""
+Bulk import a curriculum hierarchy (and questions) from a JSON Lines or CSV file.
+
+Uses the same streaming importer as POST /api/curriculum/import against the
+database configured by MONGO_URI / DB_NAME. Records must list parents before
+children; see app/utils/curriculum_io.py for the format.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Load environment variables
+load_dotenv()
+
+from app.services.bulk_service import BulkCurriculumService
+from app.utils.curriculum_io import read_jsonl, read_csv
+
+def main(path: str, user_id: str, file_format: str):
+    if not file_format:
+        file_format = "csv" if path.lower().endswith(".csv") else "jsonl"
+
+    with open(path, encoding="utf-8", newline="") as f:
+        records = read_csv(f) if file_format == "csv" else read_jsonl(f)
+        summary = asyncio.run(BulkCurriculumService.import_records(records, user_id))
+
+    print(json.dumps(summary, indent=2))
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bulk import a curriculum file")
+    parser.add_argument("path", help="JSON Lines (.jsonl) or CSV (.csv) file")
+    parser.add_argument("--user-id", required=True, help="User id recorded as created_by")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="Override format detection")
+
+    args = parser.parse_args()
+
+    main(args.path, args.user_id, args.format)
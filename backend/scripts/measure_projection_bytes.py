@@ -0,0 +1,95 @@
+# backend/scripts/measure_projection_bytes.py
+"""
+Report how many bytes MongoDB ships per endpoint with and without field projection.
+
+Each endpoint's query is run twice against the configured database: once
+fetching full documents (the old behaviour) and once with the projection spec
+the handler now uses. Sizes are the BSON-encoded document sizes, which is what
+crosses the wire from the server.
+"""
+
+import os
+import sys
+import bson
+from pymongo import MongoClient
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.projections import (
+    QUESTION_OUT_PROJECTION, QUESTION_SEARCH_PROJECTION, QUESTION_SET_PROJECTION,
+    QUESTION_PRACTICE_PROJECTION, QUESTION_QUIZ_PROJECTION,
+    QUESTION_TOPIC_LIST_PROJECTION, QUESTION_SUMMARY_PROJECTION,
+    QUESTION_ACTIVITY_PROJECTION, USER_OUT_PROJECTION
+)
+
+# Load environment variables
+load_dotenv()
+
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
+DB_NAME = os.getenv("DB_NAME", "question_generator_db")
+
+def find_bytes(collection, query, projection, limit, sort=None):
+    """Total BSON bytes returned by a find() with an optional projection"""
+    cursor = collection.find(query, projection).limit(limit)
+    if sort:
+        cursor = cursor.sort(*sort)
+    return sum(len(bson.encode(doc)) for doc in cursor)
+
+def aggregate_bytes(collection, pipeline):
+    """Total BSON bytes returned by an aggregation"""
+    return sum(len(bson.encode(doc)) for doc in collection.aggregate(pipeline))
+
+def sample_pipeline(size, projection=None):
+    """Pipeline shape used by the practice set and quiz generators"""
+    pipeline = [{"$sample": {"size": size}}]
+    if projection:
+        pipeline.append({"$project": projection})
+    return pipeline
+
+def main(limit: int):
+    client = MongoClient(MONGO_URI)
+    db = client[DB_NAME]
+    questions = db["questions"]
+    users = db["users"]
+
+    recent = ("created_at", -1)
+    endpoints = [
+        ("GET /questions", lambda p: find_bytes(questions, {}, p, limit), QUESTION_OUT_PROJECTION),
+        ("QuestionService.search_questions", lambda p: find_bytes(questions, {}, p, 20), QUESTION_SEARCH_PROJECTION),
+        ("QuestionService.get_question_sets_by_topic", lambda p: find_bytes(questions, {}, p, 50), QUESTION_SET_PROJECTION),
+        ("GET /student/topic/{id}/questions", lambda p: find_bytes(questions, {}, p, limit), QUESTION_TOPIC_LIST_PROJECTION),
+        ("Dashboards: recent questions", lambda p: find_bytes(questions, {}, p, 5, recent), QUESTION_SUMMARY_PROJECTION),
+        ("Teacher activity", lambda p: find_bytes(questions, {}, p, limit, recent), QUESTION_ACTIVITY_PROJECTION),
+        ("GET /users", lambda p: find_bytes(users, {}, p, limit), USER_OUT_PROJECTION),
+    ]
+
+    print(f"{'endpoint':<45} {'before':>12} {'after':>12} {'saved':>7}")
+    for name, measure, projection in endpoints:
+        before = measure(None)
+        after = measure(projection)
+        report(name, before, after)
+
+    # $sample returns different documents on each run, so compare per-document averages
+    for name, projection in [
+        ("QuestionService.generate_practice_set", QUESTION_PRACTICE_PROJECTION),
+        ("POST /student/practice-quiz", QUESTION_QUIZ_PROJECTION),
+    ]:
+        before = aggregate_bytes(questions, sample_pipeline(limit))
+        after = aggregate_bytes(questions, sample_pipeline(limit, projection))
+        report(name, before, after)
+
+def report(name, before, after):
+    saved = (1 - after / before) * 100 if before else 0.0
+    print(f"{name:<45} {before:>12} {after:>12} {saved:>6.1f}%")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure bytes transferred per endpoint before and after projection")
+    parser.add_argument("--limit", type=int, default=100, help="Documents fetched per list endpoint")
+
+    args = parser.parse_args()
+
+    main(args.limit)
@@ -0,0 +1,91 @@
+# backend/scripts/rebuild_curriculum_catalog.py
+"""
+Rebuild the curriculum_catalog search collection from the hierarchy collections.
+
+Walks the hierarchy level by level (curricula, subjects, courses, units,
+topics), keeping each level's ancestor ids in memory so every node is resolved
+without extra lookups, and writes entries with bulk upserts. Catalog entries
+whose node no longer exists are removed.
+"""
+
+import os
+import sys
+from pymongo import MongoClient, ReplaceOne
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.catalog_service import build_catalog_entry
+from app.utils.hierarchy import LEVELS, PARENT_FIELD, COLLECTION_NAMES
+
+# Load environment variables
+load_dotenv()
+
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
+DB_NAME = os.getenv("DB_NAME", "question_generator_db")
+
+def rebuild(db, batch_size: int = 1000) -> int:
+    """Upsert a catalog entry for every node and return the number written"""
+    catalog = db["curriculum_catalog"]
+    projection = {"name": 1, "slug": 1, "description": 1, **{field: 1 for field in PARENT_FIELD.values()}}
+
+    ancestors_by_id = {}
+    seen_ids = []
+    count = 0
+
+    for node_type in LEVELS:
+        parent_field = PARENT_FIELD.get(node_type)
+        level_ancestors = {}
+        operations = []
+
+        for doc in db[COLLECTION_NAMES[node_type]].find({}, projection):
+            ancestors = {}
+            if parent_field:
+                parent_id = doc.get(parent_field)
+                if parent_id not in ancestors_by_id:
+                    # Orphaned node, its parent was deleted
+                    continue
+                ancestors = {**ancestors_by_id[parent_id], parent_field: parent_id}
+
+            level_ancestors[str(doc["_id"])] = ancestors
+            seen_ids.append(doc["_id"])
+            operations.append(ReplaceOne(
+                {"_id": doc["_id"]},
+                build_catalog_entry(node_type, doc, ancestors),
+                upsert=True
+            ))
+            if len(operations) == batch_size:
+                catalog.bulk_write(operations, ordered=False)
+                count += len(operations)
+                operations = []
+
+        if operations:
+            catalog.bulk_write(operations, ordered=False)
+            count += len(operations)
+
+        ancestors_by_id = level_ancestors
+        print(f"  {node_type}: {len(level_ancestors)}")
+
+    removed = catalog.delete_many({"_id": {"$nin": seen_ids}}).deleted_count
+    if removed:
+        print(f"  removed {removed} stale entries")
+
+    return count
+
+def main():
+    client = MongoClient(MONGO_URI)
+    db = client[DB_NAME]
+
+    print("Rebuilding curriculum search catalog...")
+    count = rebuild(db)
+    print(f"Wrote {count} catalog entries")
+
+    catalog = db["curriculum_catalog"]
+    catalog.create_index("name_normalized")
+    catalog.create_index("name_terms")
+    catalog.create_index([("curriculum_id", 1), ("name_terms", 1)])
+    print("Done!")
+
+if __name__ == "__main__":
+    main()
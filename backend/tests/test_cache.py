@@ -0,0 +1,37 @@
+import pytest
+import os
+import sys
+import time
+
+# Add the parent directory to the sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.cache import TTLCache
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that a full cache drops the entry used longest ago"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+def test_ttl_cache_expiry():
+    """Test that entries expire after their ttl"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("short", "x", ttl=0.01)
+    cache.set("long", "y")
+
+    time.sleep(0.02)
+
+    assert cache.get("short", "missing") == "missing"
+    assert cache.get("long") == "y"
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,57 @@
+import pytest
+import asyncio
+import uuid
+from bson import ObjectId
+import os
+import sys
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.config.db import curriculum_catalog_collection
+from app.services.cascade_service import CascadeDeleteService, COLLECTIONS
+
+# Ids of the test tree, per level
+tree = {}
+
+def _insert(level, **fields):
+    suffix = uuid.uuid4().hex[:8]
+    doc = {"_id": ObjectId(), "name": f"Cascade test {level} {suffix}", "slug": f"cascade-test-{level}-{suffix}", **fields}
+    COLLECTIONS[level].insert_one(doc)
+    tree.setdefault(level, []).append(doc["_id"])
+    return str(doc["_id"])
+
+def setup_module(module):
+    """Create a tree stored the old way: parent ids only, no ancestor ids, one catalog entry"""
+    curriculum_id = _insert("curriculum")
+    subject_id = _insert("subject", curriculum_id=curriculum_id)
+    for _ in range(2):
+        course_id = _insert("course", subject_id=subject_id)
+        unit_id = _insert("unit", course_id=course_id)
+        topic_id = _insert("topic", unit_id=unit_id)
+        _insert("question", topic_id=topic_id, question_text="Cascade test question")
+
+    # A partly backfilled catalog knows only the first course
+    curriculum_catalog_collection.insert_one({
+        "_id": tree["course"][0], "type": "course", "curriculum_id": curriculum_id, "subject_id": subject_id
+    })
+
+def teardown_module(module):
+    """Remove anything a failed test left behind"""
+    for level, ids in tree.items():
+        COLLECTIONS[level].delete_many({"_id": {"$in": ids}})
+    curriculum_catalog_collection.delete_many({"_id": {"$in": tree.get("course", [])}})
+
+def test_delete_without_backfilled_ancestor_ids():
+    """Test that deleting a subject removes every node below it when only parent ids are stored"""
+    subject_id = str(tree["subject"][0])
+
+    job = asyncio.run(CascadeDeleteService.delete("subject", subject_id))
+
+    assert job["status"] == "done"
+    for level in ("subject", "course", "unit", "topic", "question"):
+        assert COLLECTIONS[level].count_documents({"_id": {"$in": tree[level]}}) == 0
+    assert COLLECTIONS["curriculum"].count_documents({"_id": {"$in": tree["curriculum"]}}) == 1
+
+if __name__ == "__main__":
+    pytest.main()
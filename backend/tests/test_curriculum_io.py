@@ -0,0 +1,61 @@
+import pytest
+import os
+import sys
+
+# Add the parent directory to the sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.curriculum_io import read_jsonl, read_csv, write_jsonl, write_csv, validate_record, chunked
+
+RECORDS = [
+    {"type": "curriculum", "path": ["IB"], "slug": "ib"},
+    {"type": "subject", "path": ["IB", "Math"], "description": "Mathematics"},
+    {"type": "topic", "path": ["IB", "Math", "Algebra", "Equations", "Linear"]},
+    {
+        "type": "question",
+        "path": ["IB", "Math", "Algebra", "Equations", "Linear"],
+        "question_text": "Solve 2x = 4",
+        "question_type": "MCQ",
+        "options": ["1", "2", "3", "4"],
+        "correct_answer": "2",
+        "explanation": "Divide by 2",
+        "difficulty": "Easy"
+    }
+]
+
+def test_jsonl_round_trip():
+    """Test that exported JSON Lines read back into the same records"""
+    records = list(read_jsonl(write_jsonl(RECORDS)))
+
+    assert [record.pop("line") for record in records] == [1, 2, 3, 4]
+    assert records == RECORDS
+
+def test_csv_round_trip():
+    """Test that CSV rows keep type, path and list fields"""
+    lines = "".join(write_csv(RECORDS)).splitlines(keepends=True)
+    records = list(read_csv(lines))
+
+    assert [record["type"] for record in records] == ["curriculum", "subject", "topic", "question"]
+    assert records[1]["description"] == "Mathematics"
+    assert records[3]["options"] == ["1", "2", "3", "4"]
+
+def test_validate_record_path_depth():
+    """Test that a node path must reach exactly its own level"""
+    validate_record({"type": "course", "path": ["IB", "Math", "Algebra"]})
+
+    with pytest.raises(ValueError):
+        validate_record({"type": "course", "path": ["IB", "Math"]})
+    with pytest.raises(ValueError):
+        validate_record({"type": "lesson", "path": ["IB"]})
+
+def test_read_jsonl_reports_line():
+    """Test that malformed JSON is reported with its line number"""
+    with pytest.raises(ValueError, match="Line 2"):
+        list(read_jsonl(['{"type": "curriculum", "path": ["IB"]}\n', '{oops\n']))
+
+def test_chunked():
+    """Test that chunking is lazy and keeps the remainder"""
+    assert list(chunked(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,50 @@
+import pytest
+import os
+import sys
+from datetime import datetime
+from bson import ObjectId
+
+# Add the parent directory to the sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.db_utils import transform_object_id
+
+def test_transform_object_id_nested_document():
+    """Test that _id becomes id and nested ObjectIds become strings"""
+    doc_id, topic_id, child_id = ObjectId(), ObjectId(), ObjectId()
+    created = datetime(2024, 1, 1, 12, 30)
+    doc = {
+        "_id": doc_id,
+        "topic_id": topic_id,
+        "created_at": created,
+        "options": ["a", "b"],
+        "children": [{"_id": child_id, "tags": [topic_id, 3]}],
+        "meta": {"nested": {"ref": child_id}}
+    }
+
+    result = transform_object_id(doc)
+
+    assert result == {
+        "id": str(doc_id),
+        "topic_id": str(topic_id),
+        "created_at": created,
+        "options": ["a", "b"],
+        "children": [{"id": str(child_id), "tags": [str(topic_id), 3]}],
+        "meta": {"nested": {"ref": str(child_id)}}
+    }
+    assert list(result) == ["id", "topic_id", "created_at", "options", "children", "meta"]
+    # The input is left untouched
+    assert doc["_id"] == doc_id
+
+def test_transform_object_id_lists_and_scalars():
+    """Test lists of documents, tuples and bare values"""
+    ids = [ObjectId() for _ in range(3)]
+
+    assert transform_object_id([{"_id": i} for i in ids]) == [{"id": str(i)} for i in ids]
+    assert transform_object_id({"pair": (ids[0], 1)}) == {"pair": [str(ids[0]), 1]}
+    assert transform_object_id(ids[0]) == str(ids[0])
+    assert transform_object_id(None) is None
+    assert transform_object_id("text") == "text"
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,110 @@
+import pytest
+import os
+import sys
+from bson import ObjectId
+
+# Add the parent directory to the sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.hierarchy import CurriculumTree, build_subtree_pipeline, assemble_subtree, rollup_question_stats
+
+def test_subtree_pipeline_has_one_branch_per_level():
+    """Test that a course pipeline unions in its units and topics"""
+    pipeline = build_subtree_pipeline("course", "algebra-1")
+
+    assert pipeline[0] == {"$match": {"slug": "algebra-1"}}
+    branches = [stage["$unionWith"] for stage in pipeline if "$unionWith" in stage]
+    assert len(branches) == 2
+    assert all(branch["coll"] == "courses" for branch in branches)
+    assert branches[-1]["pipeline"][-1] == {"$addFields": {"_level": "topic"}}
+
+def test_subtree_pipeline_matches_id_or_slug():
+    """Test that an ObjectId-shaped key matches either field"""
+    oid = ObjectId()
+    pipeline = build_subtree_pipeline("topic", str(oid))
+
+    assert pipeline[0] == {"$match": {"$or": [{"_id": oid}, {"slug": str(oid)}]}}
+    assert len(pipeline) == 2
+
+def test_assemble_subtree_nests_children():
+    """Test that flat aggregation output is nested under the response keys"""
+    course_id, unit_id = ObjectId(), ObjectId()
+    docs = [
+        {"_id": course_id, "name": "Algebra", "slug": "algebra", "_level": "course"},
+        {"_id": unit_id, "name": "Equations", "course_id": str(course_id), "_level": "unit"},
+        {"_id": ObjectId(), "name": "Linear", "unit_id": str(unit_id), "_level": "topic"},
+        {"_id": ObjectId(), "name": "Quadratic", "unit_id": str(unit_id), "_level": "topic"}
+    ]
+
+    course = assemble_subtree("course", "algebra", docs)
+
+    assert [unit["name"] for unit in course["units"]] == ["Equations"]
+    assert [topic["name"] for topic in course["units"][0]["topics"]] == ["Linear", "Quadratic"]
+    assert "_level" not in course
+
+def test_assemble_subtree_missing_root():
+    """Test that an unknown id or slug yields None"""
+    assert assemble_subtree("unit", "missing", []) is None
+
+def test_tree_patches_move_and_remove():
+    """Test that the tree re-links a moved unit and drops removed subtrees"""
+    tree = CurriculumTree(version=1)
+    curriculum_id, subject_id = ObjectId(), ObjectId()
+    course_a, course_b, unit_id = ObjectId(), ObjectId(), ObjectId()
+    tree.upsert("curriculum", {"_id": curriculum_id, "name": "Root", "slug": "root"})
+    tree.upsert("subject", {"_id": subject_id, "name": "Math", "curriculum_id": str(curriculum_id)})
+    for course_id in (course_a, course_b):
+        tree.upsert("course", {"_id": course_id, "name": "Course", "subject_id": str(subject_id)})
+    tree.upsert("unit", {"_id": unit_id, "name": "Unit", "slug": "unit", "course_id": str(course_a)})
+    tree.upsert("topic", {"_id": ObjectId(), "name": "Topic", "slug": "topic", "unit_id": str(unit_id)})
+
+    tree.upsert("unit", {"_id": unit_id, "name": "Unit", "slug": "unit", "course_id": str(course_b)})
+    assert tree.children[str(course_a)] == []
+    assert tree.children[str(course_b)] == [str(unit_id)]
+    assert [topic["name"] for topic in tree.subtree(str(unit_id))["topics"]] == ["Topic"]
+
+    tree.remove(str(unit_id))
+    assert tree.resolve("topic", "topic") is None
+    assert tree.children[str(course_b)] == []
+
+def test_subtree_keeps_only_model_fields():
+    """Test that a field list drops internal fields and sends missing optional ones as None"""
+    fields = {"unit": ["name", "course_id", "description"], "topic": ["name", "unit_id", "slug"]}
+    tree = CurriculumTree(version=1)
+    curriculum_id, subject_id, course_id, unit_id = str(ObjectId()), str(ObjectId()), str(ObjectId()), ObjectId()
+    tree.upsert("curriculum", {"_id": ObjectId(curriculum_id), "name": "Root"})
+    tree.upsert("subject", {"_id": ObjectId(subject_id), "name": "Math", "curriculum_id": curriculum_id})
+    tree.upsert("course", {"_id": ObjectId(course_id), "name": "Course", "subject_id": subject_id})
+    tree.upsert("unit", {"_id": unit_id, "name": "Unit", "course_id": course_id, "description": "Linear"})
+    tree.upsert("topic", {"_id": ObjectId(), "name": "Topic", "unit_id": str(unit_id), "course_id": course_id})
+
+    unit = tree.subtree(str(unit_id), fields)
+
+    assert unit == {"_id": unit_id, "name": "Unit", "course_id": course_id, "description": "Linear", "topics": [
+        {"_id": unit["topics"][0]["_id"], "name": "Topic", "unit_id": str(unit_id), "slug": None}
+    ]}
+    assert tree.subtree(str(unit_id))["topics"][0]["course_id"] == course_id
+
+def test_rollup_question_stats():
+    """Test that topic counts are summed into every ancestor"""
+    linear, quadratic = ObjectId(), ObjectId()
+    unit = {"_id": ObjectId(), "name": "Equations", "topics": [
+        {"_id": linear, "name": "Linear"},
+        {"_id": quadratic, "name": "Quadratic"}
+    ]}
+    topic_counts = {
+        str(linear): {("MCQ", "Easy"): 3, ("True/False", "Easy"): 1},
+        str(quadratic): {("MCQ", "Hard"): 2}
+    }
+
+    stats = rollup_question_stats("unit", unit, topic_counts)
+
+    assert stats == {
+        "question_count": 6,
+        "by_type": {"MCQ": 5, "True/False": 1},
+        "by_difficulty": {"Easy": 4, "Hard": 2}
+    }
+    assert unit["topics"][1]["question_stats"]["question_count"] == 2
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,39 @@
+import pytest
+import os
+import sys
+
+# Add the parent directory to the sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.http_cache import CacheRule, compute_etag, etag_matches
+
+def test_etag_changes_with_versions_and_url():
+    """Test that the ETag depends on the URL and scope versions but not on query order"""
+    etag = compute_etag("/api/subjects", [("curriculum_id", "a"), ("limit", "10")], [3])
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == compute_etag("/api/subjects", [("limit", "10"), ("curriculum_id", "a")], [3])
+    assert etag != compute_etag("/api/subjects", [("curriculum_id", "a"), ("limit", "10")], [4])
+    assert etag != compute_etag("/api/courses", [("curriculum_id", "a"), ("limit", "10")], [3])
+
+def test_if_none_match_parsing():
+    """Test weak comparison, lists and wildcards in If-None-Match"""
+    etag = '"abc"'
+
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('W/"abc"', etag)
+    assert etag_matches('"xyz", "abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"xyz"', etag)
+    assert not etag_matches(None, etag)
+
+def test_cache_rule_matches_full_path():
+    """Test that rules match whole paths only"""
+    rule = CacheRule(r"/api/curriculum(/[^/]+(/full)?)?", ("curriculum",), frozenset({"student"}))
+
+    assert rule.matches("/api/curriculum")
+    assert rule.matches("/api/curriculum/algebra/full")
+    assert not rule.matches("/api/curriculum/algebra/export")
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,47 @@
+import pytest
+import os
+import sys
+
+# Add the parent directory to the sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.metrics import MetricsRegistry, RequestStats, command_shape, query_shape
+
+def test_query_shape_hides_literals():
+    """Test that queries differing only in values share a shape"""
+    first = {"unit_id": "abc", "difficulty": {"$in": ["Easy", "Hard"]}}
+    second = {"unit_id": "xyz", "difficulty": {"$in": ["Medium"]}}
+
+    assert query_shape(first) == query_shape(second) == {"unit_id": "?", "difficulty": {"$in": ["?"]}}
+    assert command_shape("find", {"find": "topics", "filter": first, "limit": 5}) == \
+        "find topics filter={'unit_id': '?', 'difficulty': {'$in': ['?']}}"
+
+def test_request_stats_groups_repeated_queries():
+    """Test that an N+1 loop shows up as one shape with a count"""
+    stats = RequestStats()
+    for _ in range(3):
+        stats.add_query("find topics filter={'unit_id': '?'}", 0.002)
+    stats.add_query("find units filter={'_id': '?'}", 0.001)
+
+    assert stats.db_count == 4
+    assert stats.query_shapes["find topics filter={'unit_id': '?'}"] == [3, pytest.approx(0.006)]
+
+def test_registry_renders_prometheus_text():
+    """Test counter and histogram exposition"""
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.inc("http_requests_total", 1, method="GET", route="/api/topics", status="200")
+    registry.inc("http_requests_total", 1, method="GET", route="/api/topics", status="200")
+    registry.observe("http_request_duration_seconds", 0.05, route="/api/topics")
+    registry.observe("http_request_duration_seconds", 2.0, route="/api/topics")
+
+    text = registry.render()
+
+    assert "# TYPE http_requests_total counter" in text
+    assert 'http_requests_total{method="GET",route="/api/topics",status="200"} 2' in text
+    assert 'http_request_duration_seconds_bucket{route="/api/topics",le="0.1"} 1' in text
+    assert 'http_request_duration_seconds_bucket{route="/api/topics",le="1"} 1' in text
+    assert 'http_request_duration_seconds_bucket{route="/api/topics",le="+Inf"} 2' in text
+    assert 'http_request_duration_seconds_count{route="/api/topics"} 2' in text
+
+if __name__ == "__main__":
+    pytest.main()
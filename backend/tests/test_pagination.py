@@ -0,0 +1,35 @@
+import pytest
+from bson import ObjectId
+import os
+import sys
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.pagination import encode_cursor, decode_cursor
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes back to the ObjectId it was built from"""
+    last_id = ObjectId()
+    cursor = encode_cursor(last_id)
+
+    assert decode_cursor(cursor) == last_id
+
+def test_cursor_is_url_safe():
+    """Test that cursors can be passed as query parameters without escaping"""
+    cursor = encode_cursor(ObjectId("ffffffffffffffffffffffff"))
+
+    assert "=" not in cursor
+    assert "+" not in cursor
+    assert "/" not in cursor
+
+def test_invalid_cursor():
+    """Test that malformed cursors are rejected"""
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+    with pytest.raises(ValueError):
+        decode_cursor("")
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,101 @@
+import pytest
+import asyncio
+import os
+import sys
+
+# Add the parent directory to the sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.rate_limit import (
+    SlidingWindowLimiter, TokenBucketLimiter, MemoryTokenBucketStore,
+    ConcurrencyLimiter, ConcurrencyLimitExceeded
+)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_sliding_window_blocks_over_limit():
+    """Test that the limit applies to any window, with a matching retry delay"""
+    clock = FakeClock()
+    limiter = SlidingWindowLimiter(limit=3, window=60, clock=clock)
+
+    for _ in range(3):
+        assert limiter.retry_after("ip:1") is None
+        limiter.hit("ip:1")
+        clock.now += 10
+
+    assert limiter.retry_after("ip:1") == pytest.approx(30)
+    assert limiter.retry_after("ip:2") is None
+
+    clock.now += 30
+    assert limiter.retry_after("ip:1") is None
+
+def test_reset_clears_attempts():
+    """Test that a successful login forgets an account's attempts"""
+    limiter = SlidingWindowLimiter(limit=1, window=60, clock=FakeClock())
+    limiter.hit("account:a@example.com")
+    assert limiter.retry_after("account:a@example.com") is not None
+
+    limiter.reset("account:a@example.com")
+
+    assert limiter.retry_after("account:a@example.com") is None
+
+def test_token_bucket_allows_burst_then_refills():
+    """Test that a bucket allows its burst, then one request per refill interval"""
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate=0.5, capacity=2, clock=clock)
+
+    assert limiter.take("ai:teacher:u1") is None
+    assert limiter.take("ai:teacher:u1") is None
+    assert limiter.take("ai:teacher:u1") == pytest.approx(2.0)
+    # Other users have their own bucket
+    assert limiter.take("ai:teacher:u2") is None
+
+    clock.now += 2
+    assert limiter.take("ai:teacher:u1") is None
+    assert limiter.take("ai:teacher:u1") == pytest.approx(2.0)
+
+def test_shared_store_sweeps_each_bucket_with_its_own_rate():
+    """Test that a fast limiter's sweep does not refill a slow limiter's bucket in the same store"""
+    clock = FakeClock()
+    store = MemoryTokenBucketStore(sweep_interval=60)
+    slow = TokenBucketLimiter(rate=0.01, capacity=1, store=store, clock=clock)
+    fast = TokenBucketLimiter(rate=10, capacity=5, store=store, clock=clock)
+
+    assert slow.take("ai:teacher:u1") is None
+    clock.now += 61
+    assert fast.take("quiz:student:u2") is None
+
+    assert slow.take("ai:teacher:u1") is not None
+
+def test_concurrency_limiter_queues_then_rejects():
+    """Test that requests over the cap wait for a slot and a full queue is rejected"""
+    async def scenario():
+        limiter = ConcurrencyLimiter(limit=1, queue_limit=1, queue_timeout=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+
+        with pytest.raises(ConcurrencyLimitExceeded):
+            await limiter.acquire()
+
+        limiter.release()
+        await waiter
+        assert limiter.waiting == 0
+        limiter.release()
+
+        timed_out = ConcurrencyLimiter(limit=1, queue_limit=1, queue_timeout=0.01)
+        await timed_out.acquire()
+        with pytest.raises(ConcurrencyLimitExceeded):
+            await timed_out.acquire()
+
+    asyncio.run(scenario())
+
+if __name__ == "__main__":
+    pytest.main()
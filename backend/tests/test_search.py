@@ -0,0 +1,57 @@
+import pytest
+import os
+import sys
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.search import tokenize, build_search_fields, build_search_pipeline, normalize_name, name_terms
+
+def test_tokenize_plain_text():
+    """Test lowercasing, punctuation splitting and stopword removal"""
+    assert tokenize("What is the Derivative of a Polynomial?") == ["derivative", "polynomial"]
+
+def test_tokenize_latex():
+    """Test that LaTeX commands become terms and layout commands are dropped"""
+    tokens = tokenize(r"Evaluate $\left(\frac{x^2}{\sqrt{y}}\right)\,dx$")
+
+    assert "frac" in tokens
+    assert "sqrt" in tokens
+    assert "left" not in tokens
+    assert "right" not in tokens
+    assert "2" in tokens
+
+def test_build_search_fields():
+    """Test that title terms are a subset of all terms and duplicates are removed"""
+    fields = build_search_fields("Integral of sine", "The integral of sine is minus cosine")
+
+    assert fields["search_title_terms"] == ["integral", "sine"]
+    assert fields["search_terms"] == ["integral", "sine", "minus", "cosine"]
+
+def test_search_pipeline_prefix_and_filters():
+    """Test that the last term is a prefix and filters are pushed into $match"""
+    pipeline = build_search_pipeline("quadratic equ", {"topic_id": "t1"}, 10, {"question_text": 1})
+    match = pipeline[0]["$match"]
+
+    assert match["topic_id"] == "t1"
+    assert {"search_terms": "quadratic"} in match["$and"]
+    assert {"search_terms": {"$regex": "^equ"}} in match["$and"]
+
+def test_search_pipeline_empty_query():
+    """Test that an empty query falls back to a filtered recency listing"""
+    pipeline = build_search_pipeline("   ", {"difficulty": "Easy"}, 5, {"question_text": 1})
+
+    assert pipeline[0] == {"$match": {"difficulty": "Easy"}}
+    assert pipeline[1] == {"$sort": {"created_at": -1}}
+
+def test_search_pipeline_query_without_terms():
+    """Test that text made only of stopwords and single letters matches nothing"""
+    assert build_search_pipeline("the a of", {"difficulty": "Easy"}, 5, {"question_text": 1}) is None
+
+def test_name_normalization():
+    """Test that curriculum names keep short words and lose accents and extra spaces"""
+    assert normalize_name("  Álgebra   II ") == "algebra ii"
+    assert name_terms("Units of Measure: A & B") == ["units", "of", "measure", "a", "b"]
+
+if __name__ == "__main__":
+    pytest.main()
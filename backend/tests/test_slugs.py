@@ -0,0 +1,40 @@
+import pytest
+import os
+import sys
+
+# Add the parent directory to the sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.helpers import resolve_slugs, allocate_unique_slugs
+
+class FakeCollection:
+    """Answers the single slug query made by allocate_unique_slugs"""
+
+    def __init__(self, slugs):
+        self.slugs = slugs
+        self.queries = 0
+
+    def find(self, query, projection=None):
+        self.queries += 1
+        patterns = query["slug"]["$in"]
+        return [{"slug": slug} for slug in self.slugs if any(p.match(slug) for p in patterns)]
+
+def test_resolve_slugs_suffixes():
+    """Test that taken slugs get the lowest free numeric suffix"""
+    taken = {"algebra", "algebra-2", "geometry-3"}
+
+    assert resolve_slugs(["algebra", "geometry", "algebra"], taken) == ["algebra-3", "geometry", "algebra-4"]
+    assert {"algebra-3", "algebra-4", "geometry"} <= taken
+
+def test_allocate_unique_slugs_single_query():
+    """Test that a batch of names is slugged with one query"""
+    collection = FakeCollection(["linear-equations", "linear-equations-2", "linear-equations-x", "algebra-ii"])
+    names = ["Linear Equations", "Algebra", "Linear Equations", "!!!"]
+
+    slugs = allocate_unique_slugs(collection, names, reserved={"algebra"})
+
+    assert slugs == ["linear-equations-3", "algebra-2", "linear-equations-4", "item"]
+    assert collection.queries == 1
+
+if __name__ == "__main__":
+    pytest.main()